@@ -0,0 +1,27 @@
+"""claimed_at column for the PostgreSQL queue lease
+
+Revision ID: 5f2c8d41a7e3
+Revises: beac8996b34c
+Create Date: 2026-10-18 16:02:41.508310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '5f2c8d41a7e3'
+down_revision: Union[str, None] = 'beac8996b34c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tasks', sa.Column('claimed_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('tasks', 'claimed_at')
@@ -0,0 +1,59 @@
+"""JSONB task_data/result, generated task_type column and filter indexes
+
+Revision ID: beac8996b34c
+Revises: 3126e40725da
+Create Date: 2026-10-18 11:47:09.218734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'beac8996b34c'
+down_revision: Union[str, None] = '3126e40725da'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('tasks', 'task_data',
+                    existing_type=postgresql.JSON(astext_type=sa.Text()),
+                    type_=postgresql.JSONB(astext_type=sa.Text()),
+                    existing_nullable=False,
+                    postgresql_using='task_data::jsonb')
+    op.alter_column('tasks', 'result',
+                    existing_type=postgresql.JSON(astext_type=sa.Text()),
+                    type_=postgresql.JSONB(astext_type=sa.Text()),
+                    existing_nullable=True,
+                    postgresql_using='result::jsonb')
+    op.add_column('tasks', sa.Column('task_type', sa.String(),
+                                     sa.Computed("task_data ->> 'task_type'", persisted=True),
+                                     nullable=True))
+    op.create_index('ix_tasks_status_created_at_id', 'tasks', ['status', 'created_at', 'id'], unique=False)
+    op.create_index('ix_tasks_task_type_created_at_id', 'tasks', ['task_type', 'created_at', 'id'], unique=False)
+    op.create_index('ix_tasks_status_task_type_created_at_id', 'tasks',
+                    ['status', 'task_type', 'created_at', 'id'], unique=False)
+    op.create_index('ix_tasks_updated_at', 'tasks', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_updated_at', table_name='tasks')
+    op.drop_index('ix_tasks_status_task_type_created_at_id', table_name='tasks')
+    op.drop_index('ix_tasks_task_type_created_at_id', table_name='tasks')
+    op.drop_index('ix_tasks_status_created_at_id', table_name='tasks')
+    op.drop_column('tasks', 'task_type')
+    op.alter_column('tasks', 'result',
+                    existing_type=postgresql.JSONB(astext_type=sa.Text()),
+                    type_=postgresql.JSON(astext_type=sa.Text()),
+                    existing_nullable=True,
+                    postgresql_using='result::json')
+    op.alter_column('tasks', 'task_data',
+                    existing_type=postgresql.JSONB(astext_type=sa.Text()),
+                    type_=postgresql.JSON(astext_type=sa.Text()),
+                    existing_nullable=False,
+                    postgresql_using='task_data::json')
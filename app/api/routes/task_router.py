@@ -1,25 +1,34 @@
 from uuid import UUID
-from fastapi_cache import FastAPICache
 from celery.result import AsyncResult
 from fastapi import APIRouter, Depends, status,Path
+from fastapi.responses import StreamingResponse
 from fastapi_cache.decorator import cache
 from app.api.dependencies.task import get_task_repository
 from app.api.exceptions.task import InternalServerException, NotFoundException, BadRequestException, ConflictException
 from app.api.schemas.task import CreateTaskResponse, CreateTaskRequest, GetStateTaskResponse, GetTaskListRequest, \
-    UpdateTaskRequest, GetCancelTaskResponse, CancelTaskRequest
+    UpdateTaskRequest, GetCancelTaskResponse, CancelTaskRequest, GetTaskListResponse, CreateTaskBatchRequest, \
+    TaskListFilters
 from app.application.services.task_processor import TaskProcessor
 from app.application.use_cases.cancel_task import CancelTaskUseCase
 from app.application.use_cases.create_task import CreateTaskUseCase
+from app.application.use_cases.create_task_batch import CreateTaskBatchUseCase
 from app.application.use_cases.execute_task import ExecuteTaskUseCase
+from app.application.use_cases.export_task_list import ExportTaskListUseCase
 from app.application.use_cases.get_task_list import GetTaskListUseCase
 from app.application.use_cases.get_task_status import GetTaskStatusUseCase
 from app.application.use_cases.update_task import UpdateTaskUseCase
 from app.domain.exceptions.entity import TaskException, TaskNotFoundException
-from app.domain.exceptions.value_object import TaskTypeException
+from app.domain.exceptions.value_object import TaskTypeException, TaskCursorException, \
+    ValidationException
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.infrastructure.cache.task_cache import task_status_key_builder, task_list_key_builder, invalidate_task, \
+    invalidate_task_list
 from app.infrastructure.repositories.postgres_task_repository import PostgresTaskRepository
 from typing import Annotated, List
 from app.infrastructure.workers.celery_worker import celery_app
-from app.infrastructure.workers.tasks import enqueue_task_execution, enqueue_task_creation
+from app.infrastructure.workers.tasks import enqueue_task_execution, enqueue_task_creation, \
+    enqueue_task_execution_batch
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
@@ -45,7 +54,7 @@ async def create_task_sync(
     Return:
         CreateTaskResponse: Созданная задача.
     Exception:
-        BadRequestException: Если переданы некорректные данные.
+        BadRequestException: Если переданы некорректные данные (неизвестный тип или невалидные пути).
         InternalServerException: Если произошла внутренняя ошибка.
     """
     try:
@@ -55,9 +64,47 @@ async def create_task_sync(
             data=task.task_data.dict()
         )
         enqueue_task_execution(new_task.id)
-        await FastAPICache.clear()
+        await invalidate_task_list()
         return new_task
-    except TaskTypeException as e:
+    except ValidationException as e:
+        raise BadRequestException(detail=str(e))
+    except Exception as e:
+        raise InternalServerException(detail=f"Ошибка: {str(e)}")
+
+
+
+@router.post(
+    "/sync/create/batch",
+    response_model=List[CreateTaskResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Пакетное создание задач",
+    description="Создает пакет задач одним запросом к базе данных",
+    response_description="Возвращает данные о созданных задачах в порядке запроса"
+)
+async def create_tasks_batch_sync(
+    batch: CreateTaskBatchRequest,
+    repo: Annotated[PostgresTaskRepository, Depends(get_task_repository)]
+)->List[CreateTaskResponse]:
+    """
+    Создает пакет задач синхронно и ставит их на выполнение одной публикацией в брокер.
+    Args:
+        batch (CreateTaskBatchRequest): Данные новых задач.
+        repo (PostgresTaskRepository): Репозиторий для работы с задачами.
+    Return:
+        List[CreateTaskResponse]: Созданные задачи.
+    Exception:
+        BadRequestException: Если хотя бы одна задача пакета невалидна.
+        InternalServerException: Если произошла внутренняя ошибка.
+    """
+    try:
+        use_case = CreateTaskBatchUseCase(repo)
+        new_tasks = await use_case.execute(
+            [(task.name, task.task_data.dict()) for task in batch.tasks]
+        )
+        enqueue_task_execution_batch([new_task.id for new_task in new_tasks])
+        await invalidate_task_list()
+        return new_tasks
+    except ValidationException as e:
         raise BadRequestException(detail=str(e))
     except Exception as e:
         raise InternalServerException(detail=f"Ошибка: {str(e)}")
@@ -72,17 +119,38 @@ async def create_task_sync(
     response_description="Возвращает данные о созданной задаче"
 )
 async def create_task_async(
-    task: CreateTaskRequest
+    task: CreateTaskRequest,
+    repo: Annotated[PostgresTaskRepository, Depends(get_task_repository)]
 )->dict:
     """
     Создает задачу асинхронно через Celery.
+    В режиме TASK_QUEUE_BACKEND=postgres брокера нет: задача сразу записывается в таблицу
+    tasks, которая и служит очередью.
     Args:
         task (CreateTaskRequest): Данные новой задачи.
+        repo (PostgresTaskRepository): Репозиторий для работы с задачами.
     Return:
         dict: Информация о поставленной в очередь задаче.
+    Exception:
+        BadRequestException: Если переданы некорректные данные (очередь PostgreSQL).
     """
+    if settings.TASK_QUEUE_BACKEND == "postgres":
+        try:
+            new_task = await CreateTaskUseCase(repo).execute(
+                name=task.name,
+                data=task.task_data.dict()
+            )
+        except ValidationException as e:
+            raise BadRequestException(detail=str(e))
+        await invalidate_task_list()
+        return {
+            "task_id": new_task.id,
+            "status": "PENDING",
+            "message": "Задача поставлена в очередь",
+            "task_status_url": f"/tasks/id/{new_task.id}"
+        }
+
     task_id_celery = enqueue_task_creation(task.name, task.task_data.dict())
-    await FastAPICache.clear()
     return {
         "task_id": task_id_celery,
         "status": "PENDING",
@@ -100,7 +168,7 @@ async def create_task_async(
     description="Получает статус задачи",
     response_description="Возвращает данные о статусе задачи и результате выполнения(при наличии)"
 )
-@cache(expire=120)
+@cache(expire=120, key_builder=task_status_key_builder)
 async def get_state_task(
     task_id: Annotated[UUID,Path(...,title="Идентификатор задачи",description="Уникальный идентификатор задачи в формате uuid")],
     repo: Annotated[PostgresTaskRepository, Depends(get_task_repository)]
@@ -136,23 +204,26 @@ async def get_state_task(
 
 @router.get("/list",
     status_code=status.HTTP_200_OK,
-    response_model=List[CreateTaskResponse],
+    response_model=GetTaskListResponse,
     summary="Получение списка задач",
-    description="Возвращает список задач с возможностью фильтрации.",
-    response_description="Возвращает список задач, соответствующих заданным фильтрам. Если задачи не найдены, вернется пустой список."
+    description="Возвращает список задач с возможностью фильтрации и постраничной выдачей по курсору.",
+    response_description="Возвращает страницу задач, соответствующих заданным фильтрам, и курсор следующей страницы. Если задачи не найдены, вернется пустой список."
     )
-@cache(expire=300)
+@cache(expire=300, key_builder=task_list_key_builder)
 async def get_tasks(
     repo: Annotated[PostgresTaskRepository, Depends(get_task_repository)],
     filters: GetTaskListRequest = Depends(),
 ):
     """
-    Получает список задач с фильтрацией.
+    Получает страницу списка задач с фильтрацией.
     Args:
         repo (PostgresTaskRepository): Репозиторий для работы с задачами.
-        filters (GetTaskListRequest): Фильтры для поиска задач.
+        filters (GetTaskListRequest): Фильтры для поиска задач, размер страницы и курсор.
     Return:
-        List[CreateTaskResponse]: Список задач.
+        GetTaskListResponse: Страница задач и курсор следующей страницы.
+    Exception:
+        BadRequestException: Если передан некорректный курсор.
+        InternalServerException: Если произошла внутренняя ошибка.
     """
     try:
         use_case = GetTaskListUseCase(repo)
@@ -163,13 +234,53 @@ async def get_tasks(
             updated_at_from=filters.updated_at_from,
             updated_at_to=filters.updated_at_to,
             status=filters.status,
-            task_type=filters.task_type
+            task_type=filters.task_type,
+            limit=filters.limit,
+            cursor=filters.cursor
         )
         return tasks
+    except TaskCursorException as e:
+        raise BadRequestException(detail=str(e))
     except Exception as e:
         raise InternalServerException(detail=f"Ошибка: {str(e)}")
 
 
+@router.get("/export",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    summary="Выгрузка задач в NDJSON",
+    description="Потоково выгружает все задачи, соответствующие фильтрам, по одной JSON-строке на задачу.",
+    response_description="Поток application/x-ndjson с задачами в порядке создания"
+    )
+async def export_tasks(
+    filters: TaskListFilters = Depends(),
+):
+    """
+    Потоково выгружает задачи с фильтрацией.
+    Сессия открывается внутри генератора: она должна жить, пока отдается ответ,
+    а зависимость get_db закрывается до начала отправки тела.
+    Args:
+        filters (TaskListFilters): Фильтры для поиска задач.
+    Return:
+        StreamingResponse: Поток NDJSON.
+    """
+    async def stream_tasks():
+        async with async_session_maker() as session:
+            use_case = ExportTaskListUseCase(PostgresTaskRepository(session))
+            async for line in use_case.execute(
+                name=filters.name,
+                created_at_from=filters.created_at_from,
+                created_at_to=filters.created_at_to,
+                updated_at_from=filters.updated_at_from,
+                updated_at_to=filters.updated_at_to,
+                status=filters.status,
+                task_type=filters.task_type
+            ):
+                yield line
+
+    return StreamingResponse(stream_tasks(), media_type="application/x-ndjson")
+
+
 @router.post(
     "/update",
     response_model=CreateTaskResponse,
@@ -202,9 +313,9 @@ async def update_task(
             name=task.name,
             data=task.task_data
         )
-        await FastAPICache.clear()
+        await invalidate_task(updated_task.id)
         return updated_task
-    except TaskTypeException as e:
+    except ValidationException as e:
         raise BadRequestException(detail=str(e))
     except TaskNotFoundException as e:
         raise NotFoundException(detail=str(e))
@@ -244,7 +355,7 @@ async def cancel_task(
         canceled_task = await use_case.execute(
             task_id=task.id
         )
-        await FastAPICache.clear()
+        await invalidate_task(task.id)
         return canceled_task
     except TaskTypeException as e:
         raise BadRequestException(detail=str(e))
@@ -1,6 +1,6 @@
 import uuid
-from pydantic import BaseModel, Field, ConfigDict, field_validator, model_validator
-from typing import Optional, List, Union
+from pydantic import BaseModel, Field, ConfigDict, field_validator, model_validator, Discriminator, Tag
+from typing import Optional, List, Union, Literal, Annotated, Any
 from uuid import UUID
 from datetime import datetime
 
@@ -15,7 +15,8 @@ class FileTaskData(BaseModel):
     task_type: TaskTypeEnum = Field(
         ...,
         title="Тип задачи",
-        description="Тип выполняемой задачи: создание файла(FILE_CREATE), копирование файла(FILE_COPY) и удаление файла(FILE_DELETE)",
+        description="Тип выполняемой задачи: создание файла(FILE_CREATE), копирование файла(FILE_COPY), "
+                    "удаление файла(FILE_DELETE) и рекурсивное копирование каталога(DIR_COPY)",
         example="FILE_CREATE"
     )
     source_path: str = Field(
@@ -30,6 +31,403 @@ class FileTaskData(BaseModel):
         description="Целевой путь для копирования",
         example=""
     )
+
+
+class FileCopyTaskData(BaseModel):
+    task_type: Literal[TaskTypeEnum.FILE_COPY] = Field(
+        ...,
+        title="Тип задачи",
+        description="Копирование файла(FILE_COPY)",
+        example="FILE_COPY"
+    )
+    source_path: str = Field(
+        ...,
+        title='Исходный путь файла',
+        description="Исходный путь файла",
+        example="/app/files/file.txt"
+    )
+    destination_path: str = Field(
+        ...,
+        title='Целевой путь файла',
+        description="Целевой путь для копирования",
+        example="/app/files/copy.txt"
+    )
+    delta: bool = Field(
+        False,
+        title="Дельта-копирование",
+        description="Если файл назначения существует, перезаписать только изменившиеся блоки"
+    )
+    verify: bool = Field(
+        False,
+        title="Проверка копии",
+        description="После копирования сверить хэши BLAKE2b источника и копии"
+    )
+
+
+def _batch_operation_tag(value: Any) -> str:
+    return "copy" if _task_data_tag(value) == "copy" else "file"
+
+
+BatchOperationSchema = Annotated[
+    Union[
+        Annotated[FileTaskData, Tag("file")],
+        Annotated[FileCopyTaskData, Tag("copy")],
+    ],
+    Discriminator(_batch_operation_tag)
+]
+
+
+class FileBatchTaskData(BaseModel):
+    task_type: Literal[TaskTypeEnum.FILE_BATCH] = Field(
+        ...,
+        title="Тип задачи",
+        description="Пакет файловых операций(FILE_BATCH)",
+        example="FILE_BATCH"
+    )
+    operations: List[BatchOperationSchema] = Field(
+        ...,
+        min_length=1,
+        max_length=10000,
+        title="Операции",
+        description="Операции FILE_CREATE, FILE_COPY и FILE_DELETE, выполняемые одной задачей"
+    )
+    parallelism: Optional[int] = Field(
+        None,
+        ge=1,
+        le=64,
+        title="Параллелизм",
+        description="Максимум одновременно выполняемых операций (по умолчанию - настройка воркера)"
+    )
+    stop_on_error: bool = Field(
+        False,
+        title="Остановка при ошибке",
+        description="Не запускать новые операции после первой ошибки"
+    )
+
+
+class DirSyncTaskData(BaseModel):
+    task_type: Literal[TaskTypeEnum.DIR_SYNC] = Field(
+        ...,
+        title="Тип задачи",
+        description="Инкрементальная синхронизация каталога(DIR_SYNC)",
+        example="DIR_SYNC"
+    )
+    source_path: str = Field(
+        ...,
+        title='Исходный каталог',
+        description="Исходный каталог",
+        example="/app/files/in"
+    )
+    destination_path: str = Field(
+        ...,
+        title='Каталог назначения',
+        description="Синхронизируемый каталог назначения",
+        example="/app/files/mirror"
+    )
+    delete: bool = Field(
+        True,
+        title="Удалять лишнее",
+        description="Удалять из назначения файлы и каталоги, которых нет в источнике"
+    )
+    checksum: bool = Field(
+        False,
+        title="Сравнение по хэшу",
+        description="Сравнивать файлы одинакового размера по хэшу содержимого вместо mtime"
+    )
+
+
+class FileHashTaskData(BaseModel):
+    task_type: Literal[TaskTypeEnum.FILE_HASH] = Field(
+        ...,
+        title="Тип задачи",
+        description="Вычисление контрольных сумм файлов(FILE_HASH)",
+        example="FILE_HASH"
+    )
+    paths: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=10000,
+        title="Файлы",
+        description="Абсолютные пути хэшируемых файлов"
+    )
+    algorithm: Literal["sha256", "sha512", "blake2b", "blake2s"] = Field(
+        "sha256",
+        title="Алгоритм",
+        description="Алгоритм хэширования"
+    )
+
+
+class FileCompressTaskData(BaseModel):
+    task_type: Literal[TaskTypeEnum.FILE_COMPRESS, TaskTypeEnum.FILE_DECOMPRESS] = Field(
+        ...,
+        title="Тип задачи",
+        description="Сжатие(FILE_COMPRESS) или распаковка(FILE_DECOMPRESS) файла",
+        example="FILE_COMPRESS"
+    )
+    source_path: str = Field(
+        ...,
+        title='Исходный путь файла',
+        description="Исходный путь файла",
+        example="/app/files/file.txt"
+    )
+    destination_path: Optional[str] = Field(
+        None,
+        title='Целевой путь файла',
+        description="Путь результата; по умолчанию суффикс .gz/.xz добавляется или отрезается",
+        example="/app/files/file.txt.gz"
+    )
+    format: Literal["gzip", "xz"] = Field(
+        "gzip",
+        title="Формат",
+        description="Формат сжатия"
+    )
+    level: Optional[int] = Field(
+        None,
+        ge=0,
+        le=9,
+        title="Уровень сжатия",
+        description="gzip 1-9, xz 0-9; по умолчанию 6"
+    )
+    block_size: int = Field(
+        4 * 1024 * 1024,
+        ge=64 * 1024,
+        le=64 * 1024 * 1024,
+        title="Размер блока",
+        description="Размер независимо сжимаемого блока в байтах"
+    )
+
+
+class DirArchiveTaskData(BaseModel):
+    task_type: Literal[TaskTypeEnum.DIR_ARCHIVE] = Field(
+        ...,
+        title="Тип задачи",
+        description="Упаковка каталога в tar-архив(DIR_ARCHIVE)",
+        example="DIR_ARCHIVE"
+    )
+    source_path: str = Field(
+        ...,
+        title='Исходный каталог',
+        description="Архивируемый каталог",
+        example="/app/files/in"
+    )
+    destination_path: str = Field(
+        ...,
+        title='Путь архива',
+        description="Путь создаваемого архива",
+        example="/app/archives/in.tar.gz"
+    )
+    compression: Optional[Literal["gzip"]] = Field(
+        None,
+        title="Сжатие",
+        description="gzip для tar.gz, без значения - обычный tar"
+    )
+    level: int = Field(
+        6,
+        ge=1,
+        le=9,
+        title="Уровень сжатия",
+        description="Уровень сжатия gzip"
+    )
+
+
+class FileSearchTaskData(BaseModel):
+    task_type: Literal[TaskTypeEnum.FILE_SEARCH] = Field(
+        ...,
+        title="Тип задачи",
+        description="Поиск в файлах(FILE_SEARCH). На нескольких ядрах регулярные выражения ищутся только "
+                    "исполнителем очереди PostgreSQL (FILE_SEARCH_PROCESSES); воркер Celery ищет в пуле потоков",
+        example="FILE_SEARCH"
+    )
+    paths: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=10000,
+        title="Файлы и каталоги",
+        description="Абсолютные пути файлов или каталогов (обходятся рекурсивно)"
+    )
+    pattern: str = Field(
+        ...,
+        min_length=1,
+        title="Шаблон",
+        description="Искомый литерал или регулярное выражение. Регулярное выражение ищется в пределах "
+                    "участков файла, выровненных по строкам, поэтому не может содержать перевод строки (\\n)",
+        example="ERROR"
+    )
+    regex: bool = Field(
+        False,
+        title="Регулярное выражение",
+        description="Интерпретировать шаблон как регулярное выражение"
+    )
+    ignore_case: bool = Field(
+        False,
+        title="Без учета регистра",
+        description="Искать без учета регистра"
+    )
+    max_offsets: int = Field(
+        1000,
+        ge=0,
+        le=100000,
+        title="Смещения в результате",
+        description="Сколько смещений совпадений вернуть в результате задачи"
+    )
+    output_path: Optional[str] = Field(
+        None,
+        title="Файл результатов",
+        description="Файл JSON Lines, в который пишутся все совпадения",
+        example="/app/files/matches.jsonl"
+    )
+
+
+class FileSplitTaskData(BaseModel):
+    task_type: Literal[TaskTypeEnum.FILE_SPLIT] = Field(
+        ...,
+        title="Тип задачи",
+        description="Разделение файла на части(FILE_SPLIT)",
+        example="FILE_SPLIT"
+    )
+    source_path: str = Field(
+        ...,
+        title='Исходный путь файла',
+        description="Разделяемый файл",
+        example="/app/files/big.bin"
+    )
+    destination_path: str = Field(
+        ...,
+        title='Префикс частей',
+        description="Части записываются как <префикс>.000, <префикс>.001, ...",
+        example="/app/files/parts/big.bin"
+    )
+    parts: Optional[int] = Field(
+        None,
+        ge=1,
+        le=10000,
+        title="Количество частей",
+        description="На сколько частей разделить файл"
+    )
+    part_size: Optional[int] = Field(
+        None,
+        ge=1,
+        title="Размер части",
+        description="Размер части в байтах (вместо parts)"
+    )
+
+    @model_validator(mode="after")
+    def check_split_mode(self):
+        if (self.parts is None) == (self.part_size is None):
+            raise BadRequestException(detail="Нужно задать либо parts, либо part_size")
+        return self
+
+
+class FileConcatTaskData(BaseModel):
+    task_type: Literal[TaskTypeEnum.FILE_CONCAT] = Field(
+        ...,
+        title="Тип задачи",
+        description="Склейка частей в один файл(FILE_CONCAT)",
+        example="FILE_CONCAT"
+    )
+    source_paths: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=10000,
+        title="Части",
+        description="Абсолютные пути частей в порядке склейки"
+    )
+    destination_path: str = Field(
+        ...,
+        title='Целевой путь файла',
+        description="Склеенный файл",
+        example="/app/files/big.bin"
+    )
+
+
+class FileDeletePatternTaskData(BaseModel):
+    task_type: Literal[TaskTypeEnum.FILE_DELETE_PATTERN] = Field(
+        ...,
+        title="Тип задачи",
+        description="Удаление файлов по условию(FILE_DELETE_PATTERN)",
+        example="FILE_DELETE_PATTERN"
+    )
+    source_path: str = Field(
+        ...,
+        title='Корневой каталог',
+        description="Каталог, в котором удаляются файлы",
+        example="/app/files/scratch"
+    )
+    pattern: str = Field(
+        "*",
+        min_length=1,
+        title="Шаблон",
+        description='Glob-шаблон имени файла (с "/" - пути относительно корня)',
+        example="*.tmp"
+    )
+    min_age_sec: Optional[int] = Field(
+        None,
+        ge=0,
+        title="Минимальный возраст",
+        description="Удалять только файлы, измененные не менее указанного числа секунд назад"
+    )
+    min_size: Optional[int] = Field(
+        None,
+        ge=0,
+        title="Минимальный размер",
+        description="Минимальный размер файла в байтах"
+    )
+    max_size: Optional[int] = Field(
+        None,
+        ge=0,
+        title="Максимальный размер",
+        description="Максимальный размер файла в байтах"
+    )
+    recursive: bool = Field(
+        True,
+        title="Рекурсивно",
+        description="Обходить подкаталоги"
+    )
+    dry_run: bool = Field(
+        False,
+        title="Пробный запуск",
+        description="Только подсчитать подходящие файлы, ничего не удаляя"
+    )
+
+
+TASK_DATA_TAGS = {
+    TaskTypeEnum.FILE_COPY: "copy",
+    TaskTypeEnum.FILE_BATCH: "batch",
+    TaskTypeEnum.DIR_SYNC: "sync",
+    TaskTypeEnum.FILE_HASH: "hash",
+    TaskTypeEnum.FILE_COMPRESS: "compress",
+    TaskTypeEnum.FILE_DECOMPRESS: "compress",
+    TaskTypeEnum.DIR_ARCHIVE: "archive",
+    TaskTypeEnum.FILE_SEARCH: "search",
+    TaskTypeEnum.FILE_SPLIT: "split",
+    TaskTypeEnum.FILE_CONCAT: "concat",
+    TaskTypeEnum.FILE_DELETE_PATTERN: "delete_pattern",
+}
+
+
+def _task_data_tag(value: Any) -> str:
+    task_type = value.get("task_type") if isinstance(value, dict) else getattr(value, "task_type", None)
+    return TASK_DATA_TAGS.get(task_type, "file")
+
+
+TaskDataSchema = Annotated[
+    Union[
+        Annotated[FileTaskData, Tag("file")],
+        Annotated[FileCopyTaskData, Tag("copy")],
+        Annotated[FileBatchTaskData, Tag("batch")],
+        Annotated[DirSyncTaskData, Tag("sync")],
+        Annotated[FileHashTaskData, Tag("hash")],
+        Annotated[FileCompressTaskData, Tag("compress")],
+        Annotated[DirArchiveTaskData, Tag("archive")],
+        Annotated[FileSearchTaskData, Tag("search")],
+        Annotated[FileSplitTaskData, Tag("split")],
+        Annotated[FileConcatTaskData, Tag("concat")],
+        Annotated[FileDeletePatternTaskData, Tag("delete_pattern")],
+    ],
+    Discriminator(_task_data_tag)
+]
+
+
 class CreateTaskRequest(BaseModel):
     name:str = Field(
         ...,
@@ -38,7 +436,17 @@ class CreateTaskRequest(BaseModel):
         description="Наименование задачи",
         example='Task'
     )
-    task_data: FileTaskData
+    task_data: TaskDataSchema
+
+
+class CreateTaskBatchRequest(BaseModel):
+    tasks: List[CreateTaskRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        title='Задачи',
+        description="Пакет создаваемых задач (не более 1000)"
+    )
 
 
 class CreateTaskResponse(BaseModel):
@@ -54,16 +462,17 @@ class CreateTaskResponse(BaseModel):
         description="Наименование задачи",
         example='Task'
     )
-    task_data: FileTaskData
+    task_data: TaskDataSchema
     status: str = Field(
         ...,
         title='Статус задачи',
         description="Статус задачи - 'PENDING','IN_PROGRESS','COMPLETED','FAILED','CANCELED'"
     )
-    result: Optional[str] = Field(
+    result: Optional[Union[str, dict]] = Field(
         None,
         title='Результат выполнения задачи',
-        description='Содержит результат выполнения задачи или возникшие ошибки в ходе выполнения '
+        description='Содержит результат выполнения задачи или возникшие ошибки в ходе выполнения. '
+                    'Для копирования - словарь с механизмом копирования и пропускной способностью'
     )
     created_at: datetime = Field(
         ...,
@@ -91,10 +500,11 @@ class GetStateTaskResponse(BaseModel):
         title='Статус задачи',
         description="Статус задачи"
     )
-    result: Optional[str] = Field(
+    result: Optional[Union[str, dict]] = Field(
         None,
         title='Результат выполнения задачи',
-        description='Содержит результат выполнения задачи или возникшие ошибки в ходе выполнения '
+        description='Содержит результат выполнения задачи или возникшие ошибки в ходе выполнения. '
+                    'Для копирования - словарь с механизмом копирования и пропускной способностью'
     )
     updated_at: datetime = Field(
         ...,
@@ -104,7 +514,7 @@ class GetStateTaskResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class GetTaskListRequest(BaseModel):
+class TaskListFilters(BaseModel):
     name: Optional[str] = Field(
         None,
         title="Название задачи",
@@ -146,11 +556,42 @@ class GetTaskListRequest(BaseModel):
             raise BadRequestException(detail="created_at_from не может быть больше updated_at_to")
         return self
 
+
+class GetTaskListRequest(TaskListFilters):
+    limit: int = Field(
+        100, ge=1, le=1000,
+        title="Размер страницы",
+        description="Максимальное количество задач в ответе"
+    )
+    cursor: Optional[str] = Field(
+        None, title="Курсор",
+        description="Курсор следующей страницы (next_cursor из предыдущего ответа)"
+    )
+
+
+class GetTaskListResponse(BaseModel):
+    items: List[CreateTaskResponse] = Field(
+        ...,
+        title="Задачи",
+        description="Страница задач, упорядоченных по дате создания"
+    )
+    next_cursor: Optional[str] = Field(
+        None,
+        title="Курсор следующей страницы",
+        description="Передайте в параметр cursor, чтобы получить следующую страницу. Отсутствует на последней странице"
+    )
+
+
 class FileTaskDataUpdate(BaseModel):
-    task_type: TaskTypeEnum = Field(
+    task_type: Literal[
+        TaskTypeEnum.FILE_CREATE, TaskTypeEnum.FILE_COPY, TaskTypeEnum.FILE_DELETE, TaskTypeEnum.DIR_COPY
+    ] = Field(
         ...,
         title="Тип задачи",
-        description="Тип выполняемой задачи: создание файла(FILE_CREATE), копирование файла(FILE_COPY) и удаление файла(FILE_DELETE)",
+        description="Тип выполняемой задачи: создание файла(FILE_CREATE), копирование файла(FILE_COPY), "
+                    "удаление файла(FILE_DELETE) или рекурсивное копирование каталога(DIR_COPY). "
+                    "Данные задач остальных типов не описываются двумя путями, поэтому такие задачи "
+                    "не обновляются - создайте новую задачу",
     )
     source_path: str = Field(
         ...,
@@ -0,0 +1,80 @@
+import os
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, List
+
+DURABILITY_NONE = "none"
+DURABILITY_FSYNC = "fsync"
+DURABILITY_GROUP = "group"
+
+
+def temp_path(destination_path: str, suffix: str = "") -> str:
+    """
+    Путь временного файла в каталоге назначения (rename в пределах одной файловой системы атомарен).
+    Без suffix имя уникально, с suffix - постоянно, чтобы повтор задачи нашел файл предыдущей попытки.
+    """
+    directory, name = os.path.split(destination_path)
+    return os.path.join(directory, f".{name}.{suffix or uuid.uuid4().hex[:12]}.tmp")
+
+
+def discard_file(path: str) -> None:
+    """Удаляет временный файл, если он есть."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def fsync_path(path: str) -> None:
+    """Сбрасывает на диск файл или каталог (для каталога - записи о создании и переименовании)."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def commit_file(temp_file: str, destination_path: str, durability: str) -> None:
+    """
+    Переименовывает готовый временный файл в файл назначения.
+    При DURABILITY_FSYNC данные сбрасываются на диск до переименования, а каталог - после него.
+    При DURABILITY_GROUP синхронизация выполняется позже для всего пакета (DurabilityGroup).
+    """
+    if durability == DURABILITY_FSYNC:
+        fsync_path(temp_file)
+    os.replace(temp_file, destination_path)
+    if durability == DURABILITY_FSYNC:
+        fsync_path(os.path.dirname(destination_path) or ".")
+
+
+@contextmanager
+def atomic_write(destination_path: str, durability: str) -> Iterator[str]:
+    """
+    Выдает путь временного файла рядом с destination_path; после успешной записи переименовывает
+    его в destination_path, при ошибке удаляет. После сбоя воркера в назначении остается либо
+    прежний файл, либо новый целиком, но не обрезанный.
+    """
+    temp_file = temp_path(destination_path)
+    try:
+        yield temp_file
+        commit_file(temp_file, destination_path, durability)
+    except BaseException:
+        discard_file(temp_file)
+        raise
+
+
+@dataclass
+class DurabilityGroup:
+    """
+    Файлы, записанные в режиме DURABILITY_GROUP: сбрасываются на диск разом после пакета,
+    после чего каждый их каталог синхронизируется один раз.
+    """
+    paths: List[str] = field(default_factory=list)
+
+    def add(self, path: str) -> None:
+        self.paths.append(path)
+
+    @property
+    def directories(self) -> List[str]:
+        return sorted({os.path.dirname(path) or "." for path in self.paths})
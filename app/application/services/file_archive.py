@@ -0,0 +1,103 @@
+import gzip
+import os
+import stat
+import tarfile
+from typing import BinaryIO, List, Optional, Tuple
+
+ARCHIVE_CHUNK_SIZE = 1024 * 1024
+ARCHIVE_PROGRESS_INTERVAL = 1.0
+TAR_FORMAT = tarfile.PAX_FORMAT
+TAR_ENCODING = "utf-8"
+
+
+def open_archive(destination_path: str, compression: Optional[str], level: int) -> BinaryIO:
+    """Открывает файл архива на запись (через gzip, если задано сжатие)."""
+    if compression == "gzip":
+        return gzip.open(destination_path, "wb", compresslevel=level)
+    return open(destination_path, "wb")
+
+
+def check_archive_target(source_dir: str, destination_path: str) -> None:
+    """
+    Проверяет, что источник - каталог, а архив не создается внутри него (иначе архив попадет сам в себя).
+    Exception:
+        NotADirectoryError: Если источник не каталог.
+        ValueError: Если архив внутри источника.
+    """
+    if not os.path.isdir(source_dir):
+        raise NotADirectoryError(f"{source_dir} не является каталогом")
+    source_real = os.path.realpath(source_dir)
+    destination_real = os.path.realpath(destination_path)
+    if os.path.commonpath([source_real, destination_real]) == source_real:
+        raise ValueError(f"Архив {destination_path} находится внутри {source_dir}")
+
+
+def make_tarinfo(path: str, arcname: str, st: os.stat_result) -> Optional[tarfile.TarInfo]:
+    """
+    Строит заголовок tar по результату lstat. Специальные файлы (FIFO, сокеты, устройства) пропускаются.
+    Имена владельцев не запрашиваются, чтобы не обращаться к NSS на каждый файл.
+    """
+    info = tarfile.TarInfo(arcname)
+    info.mode = stat.S_IMODE(st.st_mode)
+    info.mtime = int(st.st_mtime)
+    info.uid, info.gid = st.st_uid, st.st_gid
+    if stat.S_ISREG(st.st_mode):
+        info.type, info.size = tarfile.REGTYPE, st.st_size
+    elif stat.S_ISDIR(st.st_mode):
+        info.type = tarfile.DIRTYPE
+    elif stat.S_ISLNK(st.st_mode):
+        info.type, info.linkname = tarfile.SYMTYPE, os.readlink(path)
+    else:
+        return None
+    return info
+
+
+def scan_archive_dir(
+    source_dir: str,
+    arcname: str
+) -> Tuple[List[Tuple[tarfile.TarInfo, str]], List[Tuple[str, str]]]:
+    """
+    Читает один уровень каталога через os.scandir в порядке имен.
+    Args:
+        source_dir (str): Каталог файловой системы.
+        arcname (str): Имя этого каталога внутри архива.
+    Return:
+        Tuple: Записи (заголовок, путь) и подкаталоги (путь, имя в архиве) для дальнейшего обхода.
+    """
+    entries, subdirs = [], []
+    with os.scandir(source_dir) as scanned:
+        for entry in sorted(scanned, key=lambda item: item.name):
+            name = f"{arcname}/{entry.name}"
+            info = make_tarinfo(entry.path, name, entry.stat(follow_symlinks=False))
+            if info is None:
+                continue
+            entries.append((info, entry.path))
+            if info.isdir():
+                subdirs.append((entry.path, name))
+    return entries, subdirs
+
+
+def read_range(path: str, offset: int, length: int) -> bytes:
+    """Читает участок файла через pread (без общего положения указателя, поэтому безопасно из разных потоков)."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.pread(fd, length, offset)
+    finally:
+        os.close(fd)
+
+
+def tar_header(info: tarfile.TarInfo) -> bytes:
+    return info.tobuf(TAR_FORMAT, TAR_ENCODING, "surrogateescape")
+
+
+def tar_padding(offset: int) -> bytes:
+    """Выравнивание конца данных записи (смещение в архиве) до границы блока tar."""
+    remainder = offset % tarfile.BLOCKSIZE
+    return tarfile.NUL * (tarfile.BLOCKSIZE - remainder) if remainder else b""
+
+
+def tar_trailer(offset: int) -> bytes:
+    """Два пустых блока конца архива с дополнением до размера записи tar (как в tarfile.close)."""
+    offset += 2 * tarfile.BLOCKSIZE
+    remainder = offset % tarfile.RECORDSIZE
+    return tarfile.NUL * (2 * tarfile.BLOCKSIZE + (tarfile.RECORDSIZE - remainder if remainder else 0))
@@ -0,0 +1,40 @@
+import gzip
+import lzma
+import shutil
+
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "xz": ".xz"}
+DEFAULT_COMPRESS_BLOCK_SIZE = 4 * 1024 * 1024
+DECOMPRESS_BUFFER_SIZE = 1024 * 1024
+
+
+def compress_block(compression_format: str, level: int, data: bytes) -> bytes:
+    """
+    Сжимает блок в самостоятельный gzip-член или xz-поток.
+    Конкатенация таких блоков - корректный .gz/.xz файл (как у pigz / xz -T).
+    zlib и lzma освобождают GIL на время сжатия, поэтому блоки сжимаются параллельно в пуле потоков.
+    """
+    if compression_format == "gzip":
+        return gzip.compress(data, compresslevel=level, mtime=0)
+    return lzma.compress(data, format=lzma.FORMAT_XZ, preset=level)
+
+
+def decompress_file(compression_format: str, source_path: str, destination_path: str) -> int:
+    """
+    Распаковывает файл из нескольких gzip-членов или xz-потоков потоково, буфером фиксированного размера.
+    Return:
+        int: Размер распакованных данных в байтах.
+    """
+    opener = gzip.open if compression_format == "gzip" else lzma.open
+    with opener(source_path, "rb") as src, open(destination_path, "wb") as dst:
+        shutil.copyfileobj(src, dst, DECOMPRESS_BUFFER_SIZE)
+        return dst.tell()
+
+
+def default_destination(source_path: str, compression_format: str, compress: bool) -> str:
+    """Путь результата по умолчанию: добавляет или отрезает суффикс формата."""
+    suffix = COMPRESSION_SUFFIXES[compression_format]
+    if compress:
+        return source_path + suffix
+    if source_path.endswith(suffix):
+        return source_path[:-len(suffix)]
+    return source_path + ".out"
@@ -0,0 +1,437 @@
+import errno
+import fcntl
+import mmap
+import os
+import stat
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Iterator, Optional, Tuple
+
+from app.domain.value_objects.copy_checkpoint import CopyCheckpoint
+
+# ioctl FICLONE из linux/fs.h: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+STRATEGY_REFLINK = "reflink"
+STRATEGY_COPY_FILE_RANGE = "copy_file_range"
+STRATEGY_SENDFILE = "sendfile"
+STRATEGY_CHUNKED = "chunked"
+STRATEGY_DELTA = "delta"
+
+# Ошибки, означающие "механизм не поддерживается для этой пары файлов", а не сбой копирования
+_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EINVAL,
+    errno.EBADF, errno.EPERM, errno.ENOTTY, errno.ETXTBSY,
+}
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+DEFAULT_CHECKPOINT_SIZE = 256 * 1024 * 1024
+DEFAULT_RESUMABLE_THRESHOLD = 1024 * 1024 * 1024
+DEFAULT_DELTA_BLOCK_SIZE = 1024 * 1024
+
+
+class CopyVerificationError(OSError):
+    """Содержимое скопированного файла не совпало с контрольной суммой источника."""
+
+
+@dataclass(frozen=True)
+class CopyStats:
+    """
+    Итог копирования файла.
+    Args:
+        strategy (str): Использованный механизм: reflink, copy_file_range, sendfile или chunked.
+        size (int): Логический размер файла в байтах.
+        bytes_copied (int): Количество фактически скопированных байт (без дыр разреженного файла).
+        duration (float): Длительность копирования в секундах.
+        resumed_from (int): Байт, с которого продолжено копирование после повтора.
+        checksum (Optional[int]): CRC32 файла, если копия проверялась.
+    """
+    strategy: str
+    size: int
+    bytes_copied: int
+    duration: float
+    resumed_from: int = 0
+    checksum: Optional[int] = None
+
+    @property
+    def throughput(self) -> float:
+        """Пропускная способность в байтах в секунду (по логическому размеру файла)."""
+        return self.size / self.duration if self.duration > 0 else 0.0
+
+    def as_generic_type(self) -> dict:
+        data = {
+            "strategy": self.strategy,
+            "size": self.size,
+            "bytes_copied": self.bytes_copied,
+            "duration_sec": round(self.duration, 6),
+            "throughput_mb_s": round(self.throughput / (1024 * 1024), 2),
+        }
+        if self.resumed_from:
+            data["resumed_from"] = self.resumed_from
+        if self.checksum is not None:
+            data["crc32"] = f"{self.checksum:08x}"
+            data["verified"] = True
+        return data
+
+
+@dataclass(frozen=True)
+class DeltaCopyStats:
+    """
+    Итог дельта-копирования файла поверх существующего.
+    Args:
+        size (int): Размер исходного файла в байтах.
+        bytes_written (int): Количество реально записанных байт.
+        blocks_total (int): Количество сравненных блоков.
+        blocks_changed (int): Количество перезаписанных блоков (включая дописанные в конец).
+        checksum (int): Накопительная CRC32 исходного файла.
+        duration (float): Длительность в секундах.
+    """
+    size: int
+    bytes_written: int
+    blocks_total: int
+    blocks_changed: int
+    checksum: int
+    duration: float
+
+    def as_generic_type(self) -> dict:
+        return {
+            "strategy": STRATEGY_DELTA,
+            "size": self.size,
+            "bytes_written": self.bytes_written,
+            "written_ratio": round(self.bytes_written / self.size, 6) if self.size else 0.0,
+            "blocks_total": self.blocks_total,
+            "blocks_changed": self.blocks_changed,
+            "crc32": f"{self.checksum:08x}",
+            "duration_sec": round(self.duration, 6),
+            "throughput_mb_s": round(self.size / self.duration / (1024 * 1024), 2) if self.duration > 0 else 0.0,
+        }
+
+
+def pwrite_all(fd: int, data, offset: int) -> int:
+    """Записывает буфер целиком по смещению offset, повторяя частичные записи."""
+    view = memoryview(data)
+    written = 0
+    while written < len(view):
+        written += os.pwrite(fd, view[written:], offset + written)
+    return written
+
+
+def iter_data_segments(fd: int, end: int, start: int = 0) -> Iterator[Tuple[int, int]]:
+    """
+    Возвращает участки файла с данными (offset, length) в диапазоне [start, end),
+    пропуская дыры разреженного файла. Если файловая система не поддерживает
+    SEEK_DATA/SEEK_HOLE, диапазон считается одним участком.
+    """
+    if not hasattr(os, "SEEK_DATA"):
+        if end > start:
+            yield start, end - start
+        return
+    offset = start
+    while offset < end:
+        try:
+            data = os.lseek(fd, offset, os.SEEK_DATA)
+        except OSError as e:
+            if e.errno == errno.ENXIO:  # дальше только дыра
+                return
+            yield offset, end - offset
+            return
+        if data >= end:
+            return
+        hole = min(os.lseek(fd, data, os.SEEK_HOLE), end)
+        if hole > data:
+            yield data, hole - data
+        offset = hole
+
+
+def crc32_range(fd: int, start: int, end: int, checksum: int = 0, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Продолжает накопительную CRC32 содержимым файла на участке [start, end)."""
+    offset = start
+    while offset < end:
+        data = os.pread(fd, min(chunk_size, end - offset), offset)
+        if not data:
+            raise CopyVerificationError(errno.EIO, f"Файл короче ожидаемого: {offset} < {end}")
+        checksum = zlib.crc32(data, checksum)
+        offset += len(data)
+    return checksum
+
+
+@dataclass(frozen=True)
+class FileCopyEngine:
+    """
+    Копирование файлов с минимальным участием пользовательского пространства.
+    Порядок попыток: FICLONE (reflink, данные не копируются вовсе), os.copy_file_range
+    (копирование в ядре, на части ФС - серверное), os.sendfile, и только затем
+    pread/pwrite блоками chunk_size. Дыры разреженных файлов сохраняются:
+    копируются только участки с данными, размер выставляется через ftruncate.
+    Возобновляемое копирование (begin_resumable / copy_chunk / verify) идет участками
+    checkpoint_size: после каждого участка вызывающий сохраняет контрольную точку. Оно нужно
+    только файлам от resumable_threshold: меньшие быстрее скопировать заново через copy.
+    Дельта-копирование (delta_copy) перезаписывает в существующем файле только изменившиеся блоки.
+    Args:
+        chunk_size (int): Максимальный размер одного системного вызова копирования.
+        checkpoint_size (int): Размер участка между контрольными точками возобновляемого копирования.
+        resumable_threshold (int): Минимальный размер файла для возобновляемого копирования.
+        delta_block_size (int): Размер блока сравнения при дельта-копировании.
+    """
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+    checkpoint_size: int = DEFAULT_CHECKPOINT_SIZE
+    resumable_threshold: int = DEFAULT_RESUMABLE_THRESHOLD
+    delta_block_size: int = DEFAULT_DELTA_BLOCK_SIZE
+
+    @staticmethod
+    def resolve_destination(source_path: str, destination_path: str) -> str:
+        """Если назначение - каталог, возвращает путь файла в нем (как shutil.copy)."""
+        if os.path.isdir(destination_path):
+            return os.path.join(destination_path, os.path.basename(source_path))
+        return destination_path
+
+    def copy(self, source_path: str, destination_path: str) -> CopyStats:
+        """
+        Копирует файл вместе с правами доступа (как shutil.copy).
+        Args:
+            source_path (str): Исходный файл.
+            destination_path (str): Файл или каталог назначения.
+        Return:
+            CopyStats: Использованный механизм, объем и длительность копирования.
+        Exception:
+            OSError: Ошибка файловой системы.
+        """
+        destination_path = self.resolve_destination(source_path, destination_path)
+
+        started = time.perf_counter()
+        with open(source_path, "rb") as src:
+            src_stat = os.fstat(src.fileno())
+            self.check_not_same_file(source_path, destination_path)
+            with open(destination_path, "wb") as dst:
+                src_fd, dst_fd = src.fileno(), dst.fileno()
+                if self._try_reflink(src_fd, dst_fd):
+                    strategy, copied = STRATEGY_REFLINK, 0
+                else:
+                    strategy, copied = self._copy_segments(src_fd, dst_fd, src_stat.st_size)
+                    os.ftruncate(dst_fd, src_stat.st_size)
+                os.fchmod(dst_fd, stat.S_IMODE(src_stat.st_mode))
+        return CopyStats(strategy, src_stat.st_size, copied, time.perf_counter() - started)
+
+    def copy_range(
+        self,
+        source_path: str,
+        destination_path: str,
+        start: int,
+        end: int,
+        destination_offset: int = 0
+    ) -> Tuple[str, int]:
+        """
+        Копирует диапазон [start, end) источника в существующий файл назначения начиная
+        с destination_offset, не открывая его на усечение: несколько вызовов могут параллельно
+        писать в разные участки одного файла. Данные копируются в ядре, дыры пропускаются,
+        поэтому файл назначения должен быть заранее усечен до итогового размера.
+        Return:
+            Tuple[str, int]: Использованный механизм и количество скопированных байт.
+        """
+        src_fd = os.open(source_path, os.O_RDONLY)
+        try:
+            dst_fd = os.open(destination_path, os.O_WRONLY)
+            try:
+                return self._copy_segments(src_fd, dst_fd, end, start, destination_offset - start)
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+
+    def delta_copy(self, source_path: str, destination_path: str) -> DeltaCopyStats:
+        """
+        Обновляет существующий файл назначения до содержимого источника, перезаписывая
+        только отличающиеся блоки. Оба файла читаются через mmap, блоки сравниваются по CRC32,
+        посчитанной от накопительной CRC32 источника (совпадение CRC блоков при одинаковом
+        начальном значении равносильно совпадению CRC самих блоков), изменившиеся блоки
+        записываются через pwrite. Хвост источника за пределами назначения дописывается
+        копированием в ядре, лишний хвост назначения отрезается.
+        Args:
+            source_path (str): Исходный файл.
+            destination_path (str): Существующий файл назначения.
+        Return:
+            DeltaCopyStats: Объем записи относительно размера файла и CRC32 источника.
+        """
+        destination_path = self.resolve_destination(source_path, destination_path)
+        self.check_not_same_file(source_path, destination_path)
+        started = time.perf_counter()
+        block = self.delta_block_size
+        with open(source_path, "rb") as src, open(destination_path, "r+b") as dst:
+            src_fd, dst_fd = src.fileno(), dst.fileno()
+            src_stat = os.fstat(src_fd)
+            size = src_stat.st_size
+            common = min(size, os.fstat(dst_fd).st_size)
+            checksum = written = blocks_total = blocks_changed = 0
+            if common:
+                with mmap.mmap(src_fd, size, access=mmap.ACCESS_READ) as src_map, \
+                        mmap.mmap(dst_fd, common, access=mmap.ACCESS_READ) as dst_map:
+                    src_view, dst_view = memoryview(src_map), memoryview(dst_map)
+                    try:
+                        for offset in range(0, common, block):
+                            end = min(offset + block, common)
+                            blocks_total += 1
+                            block_checksum = zlib.crc32(src_view[offset:end], checksum)
+                            if zlib.crc32(dst_view[offset:end], checksum) != block_checksum:
+                                written += pwrite_all(dst_fd, src_view[offset:end], offset)
+                                blocks_changed += 1
+                            checksum = block_checksum
+                    finally:
+                        src_view.release()
+                        dst_view.release()
+            if size > common:
+                _, appended = self._copy_segments(src_fd, dst_fd, size, common)
+                checksum = crc32_range(src_fd, common, size, checksum, self.chunk_size)
+                tail_blocks = -(-(size - common) // block)
+                blocks_total += tail_blocks
+                blocks_changed += tail_blocks
+                written += appended
+            os.ftruncate(dst_fd, size)
+            os.fchmod(dst_fd, stat.S_IMODE(src_stat.st_mode))
+        return DeltaCopyStats(size, written, blocks_total, blocks_changed, checksum, time.perf_counter() - started)
+
+    def needs_checkpoints(self, source_path: str, checkpoint: Optional[CopyCheckpoint] = None) -> bool:
+        """
+        Нужно ли копировать файл возобновляемо: есть контрольная точка предыдущей попытки
+        или файл не меньше resumable_threshold.
+        """
+        if checkpoint is not None:
+            return True
+        try:
+            return os.path.getsize(source_path) >= self.resumable_threshold
+        except OSError:
+            return False
+
+    def begin_resumable(
+        self,
+        source_path: str,
+        destination_path: str,
+        checkpoint: Optional[CopyCheckpoint] = None
+    ) -> Tuple[CopyCheckpoint, Optional[str]]:
+        """
+        Готовит возобновляемое копирование. Контрольная точка используется, только если
+        исходный файл не изменился и в назначении уже есть bytes_done байт; иначе копирование
+        начинается заново, и сначала пробуется reflink, который копирует файл целиком сразу.
+        Args:
+            source_path (str): Исходный файл.
+            destination_path (str): Файл назначения.
+            checkpoint (Optional[CopyCheckpoint]): Контрольная точка предыдущей попытки.
+        Return:
+            Tuple[CopyCheckpoint, Optional[str]]: Стартовая контрольная точка и "reflink",
+                если файл уже скопирован клонированием.
+        """
+        self.check_not_same_file(source_path, destination_path)
+        src_stat = os.stat(source_path)
+        if (
+            checkpoint is not None
+            and checkpoint.size == src_stat.st_size
+            and checkpoint.mtime_ns == src_stat.st_mtime_ns
+            and os.path.exists(destination_path)
+            and os.path.getsize(destination_path) >= checkpoint.bytes_done
+        ):
+            return checkpoint, None
+
+        start = CopyCheckpoint(size=src_stat.st_size, mtime_ns=src_stat.st_mtime_ns)
+        with open(source_path, "rb") as src, open(destination_path, "wb") as dst:
+            if self._try_reflink(src.fileno(), dst.fileno()):
+                os.fchmod(dst.fileno(), stat.S_IMODE(src_stat.st_mode))
+                return start.advance(start.size, 0), STRATEGY_REFLINK
+        return start, None
+
+    def copy_chunk(self, source_path: str, destination_path: str, checkpoint: CopyCheckpoint) -> Tuple[CopyCheckpoint, str, int]:
+        """
+        Копирует следующий участок размером checkpoint_size и продлевает контрольную сумму.
+        Return:
+            Tuple[CopyCheckpoint, str, int]: Новая контрольная точка, механизм и число скопированных байт.
+        """
+        start = checkpoint.bytes_done
+        end = min(checkpoint.size, start + self.checkpoint_size)
+        with open(source_path, "rb") as src, open(destination_path, "r+b") as dst:
+            src_fd, dst_fd = src.fileno(), dst.fileno()
+            src_stat = os.fstat(src_fd)
+            if src_stat.st_size != checkpoint.size or src_stat.st_mtime_ns != checkpoint.mtime_ns:
+                raise OSError(errno.EAGAIN, f"Файл {source_path} изменился во время копирования")
+            strategy, copied = self._copy_segments(src_fd, dst_fd, end, start)
+            checksum = crc32_range(src_fd, start, end, checkpoint.checksum, self.chunk_size)
+            if end == checkpoint.size:
+                os.ftruncate(dst_fd, checkpoint.size)
+                os.fchmod(dst_fd, stat.S_IMODE(src_stat.st_mode))
+            elif os.fstat(dst_fd).st_size < end:  # дыра в конце участка: иначе повтор не увидит bytes_done
+                os.ftruncate(dst_fd, end)
+        return checkpoint.advance(end, checksum), strategy, copied
+
+    def verify(self, destination_path: str, checkpoint: CopyCheckpoint) -> int:
+        """
+        Проверяет, что CRC32 и размер файла назначения совпадают с источником.
+        Return:
+            int: CRC32 файла.
+        Exception:
+            CopyVerificationError: Если содержимое не совпадает.
+        """
+        with open(destination_path, "rb") as dst:
+            if os.fstat(dst.fileno()).st_size != checkpoint.size:
+                raise CopyVerificationError(errno.EIO, f"Размер {destination_path} не совпадает с источником")
+            checksum = crc32_range(dst.fileno(), 0, checkpoint.size, 0, self.chunk_size)
+        if checksum != checkpoint.checksum:
+            raise CopyVerificationError(
+                errno.EIO,
+                f"Контрольная сумма {destination_path} ({checksum:08x}) "
+                f"не совпадает с источником ({checkpoint.checksum:08x})"
+            )
+        return checksum
+
+    @staticmethod
+    def check_not_same_file(source_path: str, destination_path: str) -> None:
+        if os.path.exists(destination_path) and os.path.samefile(source_path, destination_path):
+            raise OSError(errno.EINVAL, f"{source_path} и {destination_path} - один и тот же файл")
+
+    @staticmethod
+    def _try_reflink(src_fd: int, dst_fd: int) -> bool:
+        try:
+            fcntl.ioctl(dst_fd, FICLONE, src_fd)
+            return True
+        except OSError:
+            return False
+
+    def _copy_segments(self, src_fd: int, dst_fd: int, size: int, start: int = 0, shift: int = 0) -> Tuple[str, int]:
+        """
+        Копирует участки с данными из диапазона [start, size) по смещению + shift в назначении,
+        переходя к следующему механизму, если текущий не поддерживается. Дыры остаются незаписанными.
+        Return:
+            Tuple[str, int]: Последний использованный механизм и количество скопированных байт.
+        """
+        strategies = [STRATEGY_COPY_FILE_RANGE, STRATEGY_SENDFILE, STRATEGY_CHUNKED]
+        if not hasattr(os, "copy_file_range"):
+            strategies.remove(STRATEGY_COPY_FILE_RANGE)
+        if not hasattr(os, "sendfile"):
+            strategies.remove(STRATEGY_SENDFILE)
+
+        copied = 0
+        for offset, length in iter_data_segments(src_fd, size, start):
+            end = offset + length
+            while offset < end:
+                try:
+                    n = self._copy_range(
+                        strategies[0], src_fd, dst_fd, offset, min(end - offset, self.chunk_size), shift
+                    )
+                except OSError as e:
+                    if e.errno in _UNSUPPORTED_ERRNOS and len(strategies) > 1:
+                        strategies.pop(0)
+                        continue
+                    raise
+                if n == 0:  # источник укоротился во время копирования
+                    break
+                offset += n
+                copied += n
+        return strategies[0], copied
+
+    @staticmethod
+    def _copy_range(strategy: str, src_fd: int, dst_fd: int, offset: int, count: int, shift: int = 0) -> int:
+        if strategy == STRATEGY_COPY_FILE_RANGE:
+            return os.copy_file_range(src_fd, dst_fd, count, offset, offset + shift)
+        if strategy == STRATEGY_SENDFILE:
+            os.lseek(dst_fd, offset + shift, os.SEEK_SET)
+            return os.sendfile(dst_fd, src_fd, offset, count)
+        data = os.pread(src_fd, count, offset)
+        pwrite_all(dst_fd, data, offset + shift)
+        return len(data)
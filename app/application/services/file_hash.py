@@ -0,0 +1,33 @@
+import hashlib
+import mmap
+import os
+
+DEFAULT_HASH_ALGORITHM = "blake2b"
+HASH_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def file_digest(path: str, algorithm: str = DEFAULT_HASH_ALGORITHM, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """
+    Вычисляет хэш содержимого файла, проходя по нему участками через mmap без копирования
+    в буферы Python. hashlib освобождает GIL на больших буферах, поэтому несколько файлов,
+    хэшируемых в пуле потоков, загружают несколько ядер.
+    Args:
+        path (str): Путь к файлу.
+        algorithm (str): Алгоритм hashlib (blake2b, sha256, ...).
+        chunk_size (int): Размер участка, передаваемого в hashlib за один вызов.
+    Return:
+        str: Хэш в шестнадцатеричном виде.
+    """
+    hasher = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size:
+            with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mapped:
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+                view = memoryview(mapped)
+                try:
+                    for offset in range(0, size, chunk_size):
+                        hasher.update(view[offset:offset + chunk_size])
+                finally:
+                    view.release()
+    return hasher.hexdigest()
@@ -0,0 +1,187 @@
+import json
+import mmap
+import os
+import re
+import shutil
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+SEARCH_RANGE_SIZE = 64 * 1024 * 1024
+MAX_REPORTED_SEARCH_FILES = 1000
+
+
+class SearchRange(NamedTuple):
+    """Участок файла для одного обработчика поиска: номинальные границы [start, end) и файл частичных результатов."""
+    path: str
+    start: int
+    end: int
+    part_path: Optional[str] = None
+
+
+def collect_search_files(paths: Tuple[str, ...]) -> Tuple[List[Tuple[str, int]], List[Tuple[str, str]]]:
+    """
+    Перечисляет файлы для поиска: файлы из paths и рекурсивно содержимое каталогов (через os.scandir,
+    символические ссылки на каталоги не разыменовываются). Недоступный путь или каталог
+    попадает в ошибки и не прерывает перечисление остальных.
+    Return:
+        Tuple[List[Tuple[str, int]], List[Tuple[str, str]]]: Путь и размер каждого файла; путь и текст ошибки.
+    """
+    files, errors = [], []
+    for path in paths:
+        if not os.path.isdir(path):
+            try:
+                files.append((path, os.path.getsize(path)))
+            except OSError as e:
+                errors.append((path, str(e)))
+            continue
+        pending = [path]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in sorted(entries, key=lambda item: item.name, reverse=True):
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            files.append((entry.path, entry.stat(follow_symlinks=False).st_size))
+            except OSError as e:
+                errors.append((directory, str(e)))
+    return files, errors
+
+
+def split_ranges(path: str, size: int, range_size: int) -> List[Tuple[str, int, int]]:
+    """Делит файл на номинальные участки по range_size байт (пустой файл - один пустой участок)."""
+    return [(path, start, min(start + range_size, size)) for start in range(0, size, range_size)] or [(path, 0, 0)]
+
+
+def _line_boundary(mm: mmap.mmap, position: int) -> int:
+    """Начало строки, следующей за позицией position - 1 (соседние участки вычисляют одинаковую границу)."""
+    if position <= 0 or position >= len(mm):
+        return min(max(position, 0), len(mm))
+    newline = mm.find(b"\n", position - 1)
+    return len(mm) if newline < 0 else newline + 1
+
+
+def compile_pattern(pattern: str, regex: bool, ignore_case: bool) -> Optional[re.Pattern]:
+    """
+    Компилирует байтовое регулярное выражение (^ и $ действуют для каждой строки, совпадения
+    ограничиваются строкой в _iter_matches). Для литерала с учетом регистра возвращает None:
+    он ищется через mmap.find.
+    """
+    if not regex and not ignore_case:
+        return None
+    source = pattern.encode() if regex else re.escape(pattern.encode())
+    return re.compile(source, re.MULTILINE | (re.IGNORECASE if ignore_case else 0))
+
+
+def search_range(
+    search: SearchRange,
+    pattern: str,
+    regex: bool,
+    ignore_case: bool,
+    max_offsets: int
+) -> Tuple[int, List[int]]:
+    """
+    Ищет совпадения в участке файла, отображенного через mmap. Границы участка сдвигаются
+    к началу следующей строки, поэтому совпадения в пределах строки не теряются и не дублируются
+    соседними участками. Совпадение литерала принадлежит участку, в котором начинается, и может
+    выходить за его конец (литерал с переводом строки). Регулярное выражение сопоставляется
+    в пределах одной строки (как grep): классы символов (пробельные, [^a] и т. п.) не захватывают
+    перевод строки, поэтому результат не зависит от деления на участки, а шаблоны с переводом
+    строки отклоняются при валидации задачи.
+    Функция верхнего уровня, чтобы её можно было выполнять в пуле процессов.
+    Args:
+        search (SearchRange): Файл, номинальные границы участка и файл для всех смещений (JSON Lines).
+        pattern (str): Регулярное выражение или литерал.
+        regex (bool): pattern - регулярное выражение.
+        ignore_case (bool): Без учета регистра.
+        max_offsets (int): Сколько первых смещений вернуть.
+    Return:
+        Tuple[int, List[int]]: Количество совпадений и первые max_offsets смещений.
+    """
+    count, offsets = 0, []
+    if search.end <= search.start:
+        return count, offsets
+    part = open(search.part_path, "w") if search.part_path else None
+    try:
+        with open(search.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start, end = _line_boundary(mm, search.start), _line_boundary(mm, search.end)
+            compiled = compile_pattern(pattern, regex, ignore_case)
+            literal = pattern.encode()
+            scan_end = end if regex else min(len(mm), end + len(literal) - 1)
+            for offset, length in _iter_matches(mm, compiled, literal, regex, start, end, scan_end):
+                count += 1
+                if len(offsets) < max_offsets:
+                    offsets.append(offset)
+                if part is not None:
+                    part.write(json.dumps({"path": search.path, "offset": offset, "length": length}) + "\n")
+    finally:
+        if part is not None:
+            part.close()
+    return count, offsets
+
+
+def _iter_matches(
+    mm: mmap.mmap,
+    compiled: Optional[re.Pattern],
+    literal: bytes,
+    regex: bool,
+    start: int,
+    end: int,
+    scan_end: int
+) -> Iterator[Tuple[int, int]]:
+    """
+    Совпадения, начинающиеся в [start, end); сами совпадения могут заканчиваться до scan_end.
+    Регулярное выражение (regex) сопоставляется в пределах строки, литерал - как есть.
+    """
+    if compiled is not None and regex:
+        yield from _iter_line_matches(mm, compiled, start, end)
+        return
+    if compiled is not None:
+        for match in compiled.finditer(mm, start, scan_end):
+            if match.start() >= end:
+                return
+            if match.end() > match.start():
+                yield match.start(), match.end() - match.start()
+        return
+    position = mm.find(literal, start, scan_end)
+    while 0 <= position < end:
+        yield position, len(literal)
+        position = mm.find(literal, position + len(literal), scan_end)
+
+
+def _iter_line_matches(mm: mmap.mmap, compiled: re.Pattern, start: int, end: int) -> Iterator[Tuple[int, int]]:
+    """
+    Непустые совпадения регулярного выражения в [start, end), не выходящие за пределы строки.
+    Выражение ищется по всему участку сразу; если совпадение захватило перевод строки,
+    его строка просматривается заново отдельно, и поиск продолжается со следующей строки.
+    """
+    position = start
+    while position < end:
+        resume = None
+        for match in compiled.finditer(mm, position, end):
+            if match.end() == match.start():
+                continue
+            newline = mm.find(b"\n", match.start(), match.end())
+            if newline < 0:
+                yield match.start(), match.end() - match.start()
+                continue
+            for line_match in compiled.finditer(mm, match.start(), newline):
+                if line_match.end() > line_match.start():
+                    yield line_match.start(), line_match.end() - line_match.start()
+            resume = newline + 1
+            break
+        if resume is None:
+            return
+        position = resume
+
+
+def merge_parts(part_paths: List[str], output_path: str) -> None:
+    """Склеивает файлы частичных результатов в порядке участков и удаляет их (участки с ошибкой могут отсутствовать)."""
+    with open(output_path, "wb") as output:
+        for part_path in part_paths:
+            try:
+                with open(part_path, "rb") as part:
+                    shutil.copyfileobj(part, output)
+            except FileNotFoundError:
+                continue
+            os.remove(part_path)
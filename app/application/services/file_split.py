@@ -0,0 +1,49 @@
+import os
+from typing import List, Optional, Tuple
+
+MAX_SPLIT_PARTS = 10000
+
+
+def plan_split(size: int, parts: Optional[int], part_size: Optional[int]) -> List[Tuple[int, int]]:
+    """
+    Делит файл размером size на диапазоны [start, end): на parts почти равных частей
+    (первые size % parts частей на байт длиннее) или на части по part_size байт.
+    Пустой файл дает одну пустую часть.
+    Exception:
+        ValueError: Если частей получается больше MAX_SPLIT_PARTS.
+    """
+    if part_size is not None:
+        ranges = [(start, min(start + part_size, size)) for start in range(0, size, part_size)] or [(0, 0)]
+    else:
+        base, extra = divmod(size, parts)
+        ranges, start = [], 0
+        for index in range(parts):
+            end = start + base + (1 if index < extra else 0)
+            ranges.append((start, end))
+            start = end
+    if len(ranges) > MAX_SPLIT_PARTS:
+        raise ValueError(f"Файл делится на {len(ranges)} частей, допустимо не больше {MAX_SPLIT_PARTS}")
+    return ranges
+
+
+def part_path(prefix: str, index: int, count: int) -> str:
+    """Путь части: <префикс>.000, <префикс>.001, ... (ширина номера - не меньше трех цифр)."""
+    return f"{prefix}.{index:0{max(3, len(str(count - 1)))}d}"
+
+
+def check_concat_target(source_paths: Tuple[str, ...], destination_path: str) -> None:
+    """
+    Проверяет, что склеенный файл не совпадает ни с одной из частей (иначе часть будет усечена до чтения).
+    Exception:
+        ValueError: Если назначение - одна из частей.
+    """
+    destination_real = os.path.realpath(destination_path)
+    for path in source_paths:
+        if os.path.realpath(path) == destination_real:
+            raise ValueError(f"Файл назначения {destination_path} совпадает с частью {path}")
+
+
+def allocate_file(path: str, size: int) -> None:
+    """Создает (или усекает) файл заданного размера, в который затем параллельно пишутся участки."""
+    with open(path, "wb") as f:
+        os.ftruncate(f.fileno(), size)
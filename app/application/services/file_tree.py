@@ -0,0 +1,291 @@
+import os
+import re
+import shutil
+from dataclasses import dataclass, field
+from typing import List, NamedTuple, Optional, Tuple
+
+MAX_REPORTED_ERRORS = 100
+DELETE_BATCH_SIZE = 256
+
+
+@dataclass
+class TreeStats:
+    """
+    Накопительная статистика операции над деревом каталогов.
+    Args:
+        files (int): Количество обработанных файлов.
+        directories (int): Количество обработанных каталогов.
+        symlinks (int): Количество обработанных символических ссылок.
+        bytes (int): Суммарный размер обработанных файлов.
+        failed (int): Количество ошибок.
+        errors (List[dict]): Первые MAX_REPORTED_ERRORS ошибок (путь и текст).
+    """
+    files: int = 0
+    directories: int = 0
+    symlinks: int = 0
+    bytes: int = 0
+    failed: int = 0
+    errors: List[dict] = field(default_factory=list)
+
+    def add_failure(self, path: str, error: BaseException) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"path": path, "error": str(error)})
+
+    def as_generic_type(self, duration: float) -> dict:
+        return {
+            "files": self.files,
+            "directories": self.directories,
+            "symlinks": self.symlinks,
+            "bytes": self.bytes,
+            "failed": self.failed,
+            "errors": self.errors,
+            "duration_sec": round(duration, 6),
+            "throughput_mb_s": round(self.bytes / duration / (1024 * 1024), 2) if duration > 0 else 0.0,
+        }
+
+
+def check_not_nested(source_dir: str, destination_dir: str) -> None:
+    """
+    Проверяет, что каталог назначения не находится внутри исходного (иначе обход не закончится).
+    Exception:
+        NotADirectoryError: Если источник не каталог.
+        ValueError: Если назначение внутри источника.
+    """
+    if not os.path.isdir(source_dir):
+        raise NotADirectoryError(f"{source_dir} не является каталогом")
+    source_real = os.path.realpath(source_dir)
+    destination_real = os.path.realpath(destination_dir)
+    if os.path.commonpath([source_real, destination_real]) == source_real:
+        raise ValueError(f"Каталог назначения {destination_dir} находится внутри {source_dir}")
+
+
+def scan_copy_dir(
+    source_dir: str,
+    destination_dir: str
+) -> Tuple[List[Tuple[str, str, int]], List[Tuple[str, str]], int]:
+    """
+    Создает каталог назначения, воссоздает в нем символические ссылки
+    и возвращает содержимое одного уровня исходного каталога, прочитанное через os.scandir.
+    Специальные файлы (FIFO, сокеты, устройства) пропускаются.
+    Args:
+        source_dir (str): Исходный каталог.
+        destination_dir (str): Соответствующий каталог назначения.
+    Return:
+        Tuple: Файлы (источник, назначение, размер), подкаталоги (источник, назначение)
+            и количество воссозданных символических ссылок.
+    """
+    os.makedirs(destination_dir, exist_ok=True)
+
+    files, subdirs, symlinks = [], [], 0
+    with os.scandir(source_dir) as entries:
+        for entry in entries:
+            target = os.path.join(destination_dir, entry.name)
+            if entry.is_symlink():
+                if os.path.lexists(target):
+                    os.remove(target)
+                os.symlink(os.readlink(entry.path), target)
+                symlinks += 1
+            elif entry.is_dir(follow_symlinks=False):
+                subdirs.append((entry.path, target))
+            elif entry.is_file(follow_symlinks=False):
+                files.append((entry.path, target, entry.stat(follow_symlinks=False).st_size))
+    return files, subdirs, symlinks
+
+
+SYNC_COPY = "copy"
+SYNC_COMPARE = "compare"
+SYNC_DELETE = "delete"
+
+
+class SyncAction(NamedTuple):
+    """
+    Действие синхронизации, выполняемое обработчиком из пула.
+    kind: SYNC_COPY - скопировать файл, SYNC_COMPARE - сравнить по хэшу и скопировать при
+    различии, SYNC_DELETE - удалить лишний путь назначения.
+    """
+    kind: str
+    source_path: Optional[str]
+    destination_path: str
+    size: int = 0
+    atime_ns: int = 0
+    mtime_ns: int = 0
+
+
+@dataclass
+class SyncStats(TreeStats):
+    """
+    Статистика синхронизации каталога: files и bytes - скопированные файлы.
+    Args:
+        unchanged (int): Количество файлов, совпавших с источником.
+        deleted (int): Количество удаленных из назначения путей.
+    """
+    unchanged: int = 0
+    deleted: int = 0
+
+    def as_generic_type(self, duration: float) -> dict:
+        data = super().as_generic_type(duration)
+        data.update({"unchanged": self.unchanged, "deleted": self.deleted})
+        return data
+
+
+def _sorted_entries(path: str) -> List[os.DirEntry]:
+    try:
+        with os.scandir(path) as entries:
+            return sorted(entries, key=lambda entry: entry.name)
+    except FileNotFoundError:
+        return []
+
+
+def remove_path(path: str) -> None:
+    """Удаляет файл, символическую ссылку или каталог вместе с содержимым."""
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    else:
+        os.remove(path)
+
+
+def scan_sync_dir(
+    source_dir: str,
+    destination_dir: str,
+    delete: bool,
+    checksum: bool
+) -> Tuple[List[SyncAction], List[Tuple[str, str]], int, int]:
+    """
+    Сравнивает один уровень исходного каталога и каталога назначения слиянием
+    отсортированных по имени списков os.scandir. В памяти одновременно находится только
+    один уровень каждой стороны. Символические ссылки и конфликты типов (файл вместо
+    каталога и наоборот) исправляются сразу, копирование и удаление возвращаются как действия.
+    Args:
+        source_dir (str): Исходный каталог.
+        destination_dir (str): Каталог назначения (создается, если его нет).
+        delete (bool): Удалять пути, которых нет в источнике.
+        checksum (bool): Файлы одинакового размера сравнивать по хэшу, а не по mtime.
+    Return:
+        Tuple: Действия, пары подкаталогов для обхода, количество совпавших файлов
+            и количество синхронизированных символических ссылок.
+    """
+    os.makedirs(destination_dir, exist_ok=True)
+    source_entries = _sorted_entries(source_dir)
+    destination_entries = _sorted_entries(destination_dir)
+
+    actions: List[SyncAction] = []
+    subdirs: List[Tuple[str, str]] = []
+    unchanged = symlinks = 0
+    i = j = 0
+    while i < len(source_entries) or j < len(destination_entries):
+        source = source_entries[i] if i < len(source_entries) else None
+        destination = destination_entries[j] if j < len(destination_entries) else None
+        if source is None or (destination is not None and destination.name < source.name):
+            if delete:
+                actions.append(SyncAction(SYNC_DELETE, None, destination.path))
+            j += 1
+            continue
+        if destination is not None and destination.name == source.name:
+            j += 1
+        else:
+            destination = None
+        i += 1
+
+        target = os.path.join(destination_dir, source.name)
+        if source.is_symlink():
+            link = os.readlink(source.path)
+            if destination is not None and destination.is_symlink() and os.readlink(destination.path) == link:
+                continue
+            if destination is not None:
+                remove_path(destination.path)
+            os.symlink(link, target)
+            symlinks += 1
+        elif source.is_dir(follow_symlinks=False):
+            if destination is not None and not destination.is_dir(follow_symlinks=False):
+                remove_path(destination.path)
+            subdirs.append((source.path, target))
+        elif source.is_file(follow_symlinks=False):
+            source_stat = source.stat(follow_symlinks=False)
+            kind = SYNC_COPY
+            if destination is not None and not destination.is_file(follow_symlinks=False):
+                remove_path(destination.path)
+            elif destination is not None:
+                destination_stat = destination.stat(follow_symlinks=False)
+                if destination_stat.st_size == source_stat.st_size:
+                    if checksum:
+                        kind = SYNC_COMPARE
+                    elif destination_stat.st_mtime_ns == source_stat.st_mtime_ns:
+                        unchanged += 1
+                        continue
+            actions.append(SyncAction(
+                kind, source.path, target, source_stat.st_size, source_stat.st_atime_ns, source_stat.st_mtime_ns
+            ))
+    return actions, subdirs, unchanged, symlinks
+
+
+class DeleteFilter(NamedTuple):
+    """
+    Условие отбора файлов для FILE_DELETE_PATTERN.
+    matcher сопоставляется с именем файла, а если шаблон содержит "/", - с путем относительно root.
+    """
+    root: str
+    matcher: re.Pattern
+    match_path: bool
+    max_mtime: Optional[float] = None
+    min_size: Optional[int] = None
+    max_size: Optional[int] = None
+    recursive: bool = True
+
+
+def scan_delete_dir(
+    path: str,
+    delete_filter: DeleteFilter,
+    batch_size: int = DELETE_BATCH_SIZE
+) -> Tuple[List[Tuple[str, List[Tuple[str, int]]]], List[Tuple[str, str]]]:
+    """
+    Отбирает файлы и символические ссылки одного уровня каталога через os.scandir.
+    lstat выполняется только для файлов, подошедших по имени; каталоги не удаляются.
+    Args:
+        path (str): Каталог.
+        delete_filter (DeleteFilter): Условие отбора.
+        batch_size (int): Размер пакета удаления.
+    Return:
+        Tuple: Пакеты (каталог, [(путь, размер)]) и подкаталоги (путь, "") для дальнейшего обхода.
+    """
+    matched, subdirs = [], []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if delete_filter.recursive:
+                    subdirs.append((entry.path, ""))
+                continue
+            name = os.path.relpath(entry.path, delete_filter.root) if delete_filter.match_path else entry.name
+            if not delete_filter.matcher.match(name):
+                continue
+            entry_stat = entry.stat(follow_symlinks=False)
+            if delete_filter.max_mtime is not None and entry_stat.st_mtime > delete_filter.max_mtime:
+                continue
+            if delete_filter.min_size is not None and entry_stat.st_size < delete_filter.min_size:
+                continue
+            if delete_filter.max_size is not None and entry_stat.st_size > delete_filter.max_size:
+                continue
+            matched.append((entry.path, entry_stat.st_size))
+    batches = [(path, matched[start:start + batch_size]) for start in range(0, len(matched), batch_size)]
+    return batches, subdirs
+
+
+def delete_files(files: List[Tuple[str, int]]) -> Tuple[int, int, List[Tuple[str, OSError]]]:
+    """
+    Удаляет пакет файлов одним заданием пула потоков.
+    Return:
+        Tuple: Количество удаленных файлов, освобожденные байты и ошибки (путь, исключение).
+    """
+    deleted = freed = 0
+    errors = []
+    for path, size in files:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            errors.append((path, e))
+            continue
+        deleted += 1
+        freed += size
+    return deleted, freed, errors
@@ -0,0 +1,123 @@
+import fnmatch
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from app.domain.value_objects.task_type import TaskTypeEnum
+
+WATCH_EVENT_ADDED = "added"
+WATCH_EVENT_MODIFIED = "modified"
+WATCH_EVENT_DELETED = "deleted"
+WATCH_EVENTS = (WATCH_EVENT_ADDED, WATCH_EVENT_MODIFIED)
+
+
+@dataclass(frozen=True)
+class WatchRule:
+    """
+    Правило наблюдателя: для файлов каталога path, подходящих под pattern, создается задача task_type.
+    Args:
+        name (str): Название правила (входит в название задачи).
+        path (str): Наблюдаемый каталог.
+        task_type (TaskTypeEnum): Тип создаваемой задачи.
+        pattern (str): Glob-шаблон имени файла (с "/" - пути относительно path).
+            Скрытые файлы (в том числе временные файлы атомарной записи) не подходят никогда.
+        events (Tuple[str, ...]): События, на которые срабатывает правило: added и/или modified.
+        destination (Optional[str]): Каталог назначения: destination_path задачи - путь файла
+            относительно path внутри этого каталога.
+        recursive (bool): Учитывать файлы подкаталогов.
+        options (dict): Дополнительные поля данных задачи (например, verify или format).
+    """
+    name: str
+    path: str
+    task_type: TaskTypeEnum
+    pattern: str = "*"
+    events: Tuple[str, ...] = WATCH_EVENTS
+    destination: Optional[str] = None
+    recursive: bool = True
+    options: dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        if not os.path.isabs(self.path):
+            raise ValueError(f"Правило {self.name}: наблюдаемый каталог должен быть абсолютным путем")
+        if self.destination is not None and not os.path.isabs(self.destination):
+            raise ValueError(f"Правило {self.name}: каталог назначения должен быть абсолютным путем")
+        if not self.events or any(event not in WATCH_EVENTS for event in self.events):
+            raise ValueError(f"Правило {self.name}: допустимые события - {', '.join(WATCH_EVENTS)}")
+        object.__setattr__(self, "_matcher", re.compile(fnmatch.translate(self.pattern)))
+
+    def matches(self, path: str, event: str) -> bool:
+        """Проверяет, срабатывает ли правило на событие event для файла path."""
+        if event not in self.events:
+            return False
+        relative = os.path.relpath(path, self.path)
+        if relative.startswith(os.pardir) or os.path.basename(path).startswith("."):
+            return False
+        if not self.recursive and os.sep in relative:
+            return False
+        if self.destination is not None and os.path.commonpath([self.destination, path]) == self.destination:
+            return False
+        return bool(self._matcher.match(relative if "/" in self.pattern else os.path.basename(path)))
+
+    def build_task(self, path: str) -> Tuple[str, dict]:
+        """
+        Return:
+            Tuple[str, dict]: Название и данные задачи для файла path.
+        """
+        data = {**self.options, "task_type": self.task_type.value, "source_path": path}
+        if self.destination is not None:
+            data["destination_path"] = os.path.join(self.destination, os.path.relpath(path, self.path))
+        return f"watch:{self.name}:{os.path.basename(path)}", data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "WatchRule":
+        return cls(
+            name=data["name"],
+            path=data["path"],
+            task_type=TaskTypeEnum(data["task_type"]),
+            pattern=data.get("pattern") or "*",
+            events=tuple(data.get("events") or WATCH_EVENTS),
+            destination=data.get("destination"),
+            recursive=bool(data.get("recursive", True)),
+            options=dict(data.get("options") or {}),
+        )
+
+
+def load_watch_rules(path: str) -> List[WatchRule]:
+    """
+    Читает таблицу правил из JSON-файла (список объектов с полями WatchRule).
+    Exception:
+        ValueError: Если правило некорректно.
+    """
+    with open(path) as f:
+        return [WatchRule.from_dict(item) for item in json.load(f)]
+
+
+@dataclass
+class PendingEvents:
+    """
+    Объединяет события файловой системы до тех пор, пока файл не перестанет меняться settle секунд:
+    серия added/modified при записи одного файла превращается в одно событие, а удаленный
+    до истечения паузы файл не порождает задач. Событие added сохраняется, даже если за ним
+    последовали modified.
+    """
+    settle: float
+    events: Dict[str, Tuple[str, float]] = field(default_factory=dict)
+
+    def add(self, event: str, path: str, now: float) -> None:
+        if event == WATCH_EVENT_DELETED:
+            self.events.pop(path, None)
+            return
+        previous = self.events.get(path)
+        if previous is not None and previous[0] == WATCH_EVENT_ADDED:
+            event = WATCH_EVENT_ADDED
+        self.events[path] = (event, now)
+
+    def pop_ready(self, now: float) -> List[Tuple[str, str]]:
+        """
+        Return:
+            List[Tuple[str, str]]: Пары (событие, путь) файлов, не менявшихся settle секунд, в порядке путей.
+        """
+        ready = sorted(path for path, (_, changed_at) in self.events.items() if now - changed_at >= self.settle)
+        return [(self.events.pop(path)[0], path) for path in ready]
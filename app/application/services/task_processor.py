@@ -1,72 +1,1060 @@
+import asyncio
+import errno
+import fnmatch
 import os
-import shutil
+import re
 import time
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import Executor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import accumulate
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Tuple, TypeVar
 
+from app.application.services.atomic_write import DURABILITY_FSYNC, DURABILITY_GROUP, DURABILITY_NONE, \
+    DurabilityGroup, atomic_write, commit_file, discard_file, fsync_path, temp_path
+from app.application.services.file_archive import ARCHIVE_CHUNK_SIZE, ARCHIVE_PROGRESS_INTERVAL, \
+    check_archive_target, make_tarinfo, open_archive, read_range, scan_archive_dir, tar_header, tar_padding, tar_trailer
+from app.application.services.file_compress import compress_block, decompress_file, default_destination
+from app.application.services.file_copy import FileCopyEngine, CopyStats, CopyVerificationError, STRATEGY_CHUNKED
+from app.application.services.file_hash import file_digest, DEFAULT_HASH_ALGORITHM
+from app.application.services.file_search import MAX_REPORTED_SEARCH_FILES, SEARCH_RANGE_SIZE, SearchRange, collect_search_files, \
+    merge_parts, search_range, split_ranges
+from app.application.services.file_split import allocate_file, check_concat_target, part_path, plan_split
+from app.application.services.file_tree import TreeStats, SyncStats, SyncAction, SYNC_COMPARE, SYNC_DELETE, \
+    DeleteFilter, check_not_nested, delete_files, scan_copy_dir, scan_delete_dir, scan_sync_dir, remove_path
+from app.domain.exceptions.base import DomainException
 from app.domain.exceptions.entity import TaskProcessingException
 from app.domain.exceptions.value_object import TaskTypeException
+from app.domain.value_objects.copy_checkpoint import CopyCheckpoint
+from app.domain.value_objects.dir_archive_task_data import DirArchiveTaskData
+from app.domain.value_objects.dir_sync_task_data import DirSyncTaskData
+from app.domain.value_objects.file_compress_task_data import FileCompressTaskData
+from app.domain.value_objects.file_batch_task_data import FileBatchTaskData
+from app.domain.value_objects.file_delete_pattern_task_data import FileDeletePatternTaskData
+from app.domain.value_objects.file_hash_task_data import FileHashTaskData
+from app.domain.value_objects.file_parts_task_data import FilePartsTaskData
+from app.domain.value_objects.file_search_task_data import FileSearchTaskData
 from app.domain.value_objects.file_task_data import FileTaskData
+from app.domain.value_objects.task_data import TaskData
 from app.domain.value_objects.task_type import TaskTypeEnum
-from pathlib import Path
+
+T = TypeVar("T")
+
 
 @dataclass
 class TaskProcessor:
     """
     Класс для обработки файловых задач: создания, копирования и удаления файлов.
+    Блокирующие операции с файловой системой выполняются в пуле потоков executor,
+    поэтому несколько задач в одном процессе выполняются параллельно и не блокируют event loop.
+    Args:
+        executor (Optional[Executor]): Ограниченный пул потоков воркера для файлового ввода-вывода.
+            Если не задан, используется пул по умолчанию текущего event loop.
+        copy_engine (FileCopyEngine): Механизм копирования файлов (reflink / копирование в ядре).
+        parallelism (int): Максимум одновременных файловых операций внутри одной задачи над каталогом.
+        search_executor (Optional[Executor]): Пул процессов для поиска в файлах (FILE_SEARCH).
+            Если не задан, поиск выполняется в executor.
+        durability (str): Надежность записи файлов: none - только атомарное переименование,
+            fsync - сброс каждого файла и его каталога на диск, group - сброс всех файлов
+            и их каталогов разом после пакета (задачи).
     """
-    async def _validate_path(self, path: str, must_exist: bool = False) -> None:
-        """Валидация пути перед выполнением операции"""
-        path_obj = Path(path)
-        print(path_obj)
-        print(path_obj.exists())
-        print(os.access(path, os.W_OK))
-
-        if must_exist and not path_obj.exists():
+    executor: Optional[Executor] = None
+    copy_engine: FileCopyEngine = field(default_factory=FileCopyEngine)
+    parallelism: int = 8
+    search_executor: Optional[Executor] = None
+    durability: str = DURABILITY_NONE
+
+    async def _run_blocking(self, func: Callable[..., T], *args) -> T:
+        """Выполняет блокирующую функцию в пуле потоков и возвращает её результат."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args))
+
+    @staticmethod
+    def _validate_path(path: str, must_exist: bool = False) -> None:
+        """Валидация пути перед выполнением операции (выполняется в пуле потоков)"""
+        exists = os.path.exists(path)
+
+        if must_exist and not exists:
             raise FileNotFoundError(f"Файл {path} не найден")
 
         if must_exist and not os.access(path, os.R_OK):
             raise PermissionError(f"Нет прав на чтение файла {path}")
 
-        if not must_exist and path_obj.exists() and not os.access(path, os.W_OK):
+        if not must_exist and exists and not os.access(path, os.W_OK):
             raise PermissionError(f"Нет прав на запись в {path}")
 
-    async def create_file(self, file: FileTaskData) -> None:
-        try:
-            await self._validate_path(file.source_path, must_exist=False)
-            with open(file.source_path, 'w') as f:
+    def _create_file_sync(self, source_path: str, group: DurabilityGroup) -> None:
+        self._validate_path(source_path, must_exist=False)
+        with atomic_write(source_path, self.durability) as temp_file:
+            with open(temp_file, 'w') as f:
                 f.write('')
+        self._track(source_path, group)
+
+    def _copy_file_sync(self, source_path: str, destination_path: str, group: DurabilityGroup) -> dict:
+        destination_path = self._prepare_copy_sync(source_path, destination_path)
+        return self._atomic_copy_sync(source_path, destination_path, group).as_generic_type()
+
+    def _delta_copy_sync(self, source_path: str, destination_path: str, group: DurabilityGroup) -> dict:
+        destination_path = self._prepare_copy_sync(source_path, destination_path)
+        if not os.path.isfile(destination_path):
+            return self._atomic_copy_sync(source_path, destination_path, group).as_generic_type()
+        result = self.copy_engine.delta_copy(source_path, destination_path).as_generic_type()
+        if self.durability == DURABILITY_FSYNC:
+            fsync_path(destination_path)
+        self._track(destination_path, group)
+        return result
+
+    def _prepare_copy_sync(self, source_path: str, destination_path: str) -> str:
+        self._validate_path(source_path, must_exist=True)
+        self._validate_path(destination_path, must_exist=False)
+        destination_path = self.copy_engine.resolve_destination(source_path, destination_path)
+        self.copy_engine.check_not_same_file(source_path, destination_path)
+        return destination_path
+
+    def _atomic_copy_sync(self, source_path: str, destination_path: str, group: DurabilityGroup) -> CopyStats:
+        """Копирует файл во временный файл в каталоге назначения и переименовывает его на место."""
+        with atomic_write(destination_path, self.durability) as temp_file:
+            stats = self.copy_engine.copy(source_path, temp_file)
+        self._track(destination_path, group)
+        return stats
+
+    def _commit_sync(self, temp_file: str, destination_path: str, group: DurabilityGroup) -> None:
+        commit_file(temp_file, destination_path, self.durability)
+        self._track(destination_path, group)
+
+    def _track(self, path: str, group: DurabilityGroup) -> None:
+        if self.durability == DURABILITY_GROUP:
+            group.add(path)
+
+    @asynccontextmanager
+    async def _durability_group(self, group: Optional[DurabilityGroup] = None) -> AsyncIterator[DurabilityGroup]:
+        """
+        Группа синхронизации операции: переданная пакетом (сбрасывается пакетом)
+        или собственная, которая сбрасывается на диск по завершении операции.
+        """
+        if group is not None:
+            yield group
+            return
+        own_group = DurabilityGroup()
+        yield own_group
+        await self._sync_group(own_group)
+
+    async def _sync_group(self, group: DurabilityGroup) -> None:
+        """Сбрасывает на диск файлы группы (параллельно), затем один раз каждый их каталог."""
+        if not group.paths:
+            return
+        await self._gather_limited(partial(fsync_path, path) for path in group.paths)
+        await self._gather_limited(partial(fsync_path, directory) for directory in group.directories)
+
+    async def _copy_file_resumable(
+        self,
+        source_path: str,
+        destination_path: str,
+        checkpoint: Optional[CopyCheckpoint],
+        on_checkpoint: Callable[[Optional[CopyCheckpoint]], Awaitable[None]],
+        group: DurabilityGroup,
+        last_attempt: bool = False
+    ) -> dict:
+        """
+        Копирует файл участками, сохраняя контрольную точку после каждого участка,
+        и проверяет CRC32 готового файла. При несовпадении контрольная точка сбрасывается,
+        чтобы следующая попытка копировала файл заново.
+        Участки пишутся в постоянный временный файл рядом с назначением (его продолжает
+        следующая попытка), который переименовывается на место после проверки. Файл удаляется
+        вместе со сбросом контрольной точки и при ошибке последней попытки (продолжать его некому).
+        """
+        started = time.perf_counter()
+        destination_path = await self._run_blocking(self._prepare_copy_sync, source_path, destination_path)
+        partial_path = temp_path(destination_path, "partial")
+        state, strategy = await self._run_blocking(
+            self.copy_engine.begin_resumable, source_path, partial_path, checkpoint
+        )
+        resumed_from = state.bytes_done if state is checkpoint else 0
+        copied, checksum = 0, None
+        try:
+            if strategy is None:
+                while not state.is_done:
+                    state, strategy, chunk_copied = await self._run_blocking(
+                        self.copy_engine.copy_chunk, source_path, partial_path, state
+                    )
+                    copied += chunk_copied
+                    await on_checkpoint(state)
+                checksum = await self._run_blocking(self.copy_engine.verify, partial_path, state)
+            await self._run_blocking(self._commit_sync, partial_path, destination_path, group)
+        except CopyVerificationError:
+            await self._run_blocking(discard_file, partial_path)
+            await on_checkpoint(None)
+            raise
+        except Exception:
+            if last_attempt:
+                await self._run_blocking(discard_file, partial_path)
+            raise
+        return CopyStats(
+            strategy=strategy or STRATEGY_CHUNKED,
+            size=state.size,
+            bytes_copied=copied,
+            duration=time.perf_counter() - started,
+            resumed_from=resumed_from,
+            checksum=checksum,
+        ).as_generic_type()
+
+    @classmethod
+    def _delete_file_sync(cls, source_path: str) -> None:
+        cls._validate_path(source_path, must_exist=True)
+        os.remove(source_path)
+
+    async def create_file(self, file: FileTaskData, group: Optional[DurabilityGroup] = None) -> None:
+        """
+        Создание пустого файла: временный файл в том же каталоге переименовывается на место.
+        Args:
+            file (FileTaskData): Данные задачи создания.
+            group (Optional[DurabilityGroup]): Группа синхронизации пакета (для durability=group).
+        """
+        try:
+            async with self._durability_group(group) as group:
+                await self._run_blocking(self._create_file_sync, file.source_path, group)
         except Exception as e:
             raise TaskProcessingException(f"Ошибка при создании файла {file.source_path}: {str(e)}")
 
 
-    async def copy_file(self, file: FileTaskData) -> None:
-        """Копирование файла"""
+    async def copy_file(
+        self,
+        file: FileTaskData,
+        checkpoint: Optional[CopyCheckpoint] = None,
+        on_checkpoint: Optional[Callable[[Optional[CopyCheckpoint]], Awaitable[None]]] = None,
+        group: Optional[DurabilityGroup] = None,
+        last_attempt: bool = False
+    ) -> dict:
+        """
+        Копирование файла.
+        Копия пишется во временный файл в каталоге назначения и переименовывается на место,
+        поэтому после сбоя воркера в назначении нет обрезанного файла.
+        Если передан on_checkpoint, файлы от copy_engine.resumable_threshold (и продолжение
+        по checkpoint) копируются возобновляемо: участками с сохранением контрольной точки,
+        а готовый файл проверяется по CRC32. Меньшие файлы копируются обычным путем
+        (reflink / копирование в ядре) - повторить их целиком дешевле контрольных точек.
+        При delta существующий файл назначения обновляется на месте только в изменившихся блоках
+        (повтор после сбоя просто сравнивает блоки заново, контрольные точки не нужны).
+        При verify хэши источника и копии считаются параллельно и сравниваются.
+        Args:
+            file (FileTaskData): Данные задачи копирования (FileCopyTaskData для delta).
+            checkpoint (Optional[CopyCheckpoint]): Контрольная точка предыдущей попытки.
+            on_checkpoint (Optional[Callable]): Сохраняет контрольную точку (None - сброс).
+            group (Optional[DurabilityGroup]): Группа синхронизации пакета (для durability=group).
+            last_attempt (bool): Последняя попытка: при ошибке недокопированный файл удаляется.
+        Return:
+            dict: Использованный механизм копирования, объем и пропускная способность.
+        """
         try:
-            await self._validate_path(file.source_path, must_exist=True)
-            await self._validate_path(file.destination_path, must_exist=False)
-            shutil.copy(file.source_path, file.destination_path)
+            async with self._durability_group(group) as group:
+                if getattr(file, "delta", False):
+                    result = await self._run_blocking(
+                        self._delta_copy_sync, file.source_path, file.destination_path, group
+                    )
+                elif on_checkpoint is not None and await self._run_blocking(
+                    self.copy_engine.needs_checkpoints, file.source_path, checkpoint
+                ):
+                    result = await self._copy_file_resumable(
+                        file.source_path, file.destination_path, checkpoint, on_checkpoint, group, last_attempt
+                    )
+                else:
+                    result = await self._run_blocking(
+                        self._copy_file_sync, file.source_path, file.destination_path, group
+                    )
+            if getattr(file, "verify", False):
+                result.update(await self._verify_copy(file.source_path, file.destination_path))
+            return result
         except Exception as e:
             raise TaskProcessingException(
                 f"Ошибка при копировании файла {file.source_path} -> {file.destination_path}: {str(e)}")
 
 
+    async def _verify_copy(self, source_path: str, destination_path: str) -> dict:
+        """
+        Сверяет BLAKE2b источника и копии.
+        Exception:
+            CopyVerificationError: Если хэши не совпадают.
+        """
+        destination_path = await self._run_blocking(
+            self.copy_engine.resolve_destination, source_path, destination_path
+        )
+        source_digest, destination_digest = await asyncio.gather(
+            self._run_blocking(file_digest, source_path, DEFAULT_HASH_ALGORITHM),
+            self._run_blocking(file_digest, destination_path, DEFAULT_HASH_ALGORITHM),
+        )
+        if source_digest != destination_digest:
+            raise CopyVerificationError(
+                errno.EIO, f"Хэш копии {destination_path} не совпадает с хэшем источника {source_path}"
+            )
+        return {"verified": True, "hash_algorithm": DEFAULT_HASH_ALGORITHM, "digest": source_digest}
+
+    async def hash_files(self, hash_data: FileHashTaskData) -> dict:
+        """
+        Вычисляет контрольные суммы файлов.
+        Файлы читаются через mmap и хэшируются не более чем по parallelism одновременно
+        в пуле потоков воркера: hashlib освобождает GIL, поэтому пакет файлов загружает
+        несколько ядер. Ошибка отдельного файла не прерывает остальные.
+        Args:
+            hash_data (FileHashTaskData): Пути файлов и алгоритм.
+        Return:
+            dict: Хэш и размер каждого файла (или ошибка), итоговые объем и пропускная способность.
+        """
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.parallelism)
+
+        async def hash_one(path: str) -> dict:
+            async with semaphore:
+                try:
+                    size, digest = await self._run_blocking(self._hash_file_sync, path, hash_data.algorithm)
+                except Exception as e:
+                    return {"path": path, "error": str(e)}
+                return {"path": path, "size": size, "digest": digest}
+
+        files = await asyncio.gather(*(hash_one(path) for path in hash_data.paths))
+        failed = [item for item in files if "error" in item]
+        if len(failed) == len(files):
+            raise TaskProcessingException(
+                f"Ошибка при хэшировании файлов: {'; '.join(item['error'] for item in failed[:10])}")
+        total_bytes = sum(item.get("size", 0) for item in files)
+        duration = time.perf_counter() - started
+        result = {
+            "algorithm": hash_data.algorithm,
+            "total": len(files),
+            "failed": len(failed),
+            "bytes": total_bytes,
+            "duration_sec": round(duration, 6),
+            "throughput_mb_s": round(total_bytes / duration / (1024 * 1024), 2) if duration > 0 else 0.0,
+            "files": list(files),
+        }
+        if len(files) == 1:
+            result["digest"] = files[0]["digest"]
+        return result
+
+    @staticmethod
+    def _hash_file_sync(path: str, algorithm: str) -> Tuple[int, str]:
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"Файл {path} не найден")
+        return os.path.getsize(path), file_digest(path, algorithm)
+
+    async def compress_file(self, compress: FileCompressTaskData) -> dict:
+        """
+        Сжатие файла в gzip или xz.
+        Файл читается блоками block_size, блоки сжимаются в пуле потоков воркера независимо
+        (как pigz): zlib и lzma освобождают GIL, поэтому сжатие загружает до parallelism ядер.
+        Одновременно в работе не более parallelism блоков, готовые блоки пишутся строго
+        по порядку, поэтому память ограничена примерно 2 * parallelism * block_size.
+        Args:
+            compress (FileCompressTaskData): Исходный файл, формат, уровень и размер блока.
+        Return:
+            dict: Размеры до и после сжатия, количество блоков, длительность и пропускная способность.
+        """
+        try:
+            return await self._compress_blocks(compress)
+        except Exception as e:
+            raise TaskProcessingException(f"Ошибка при сжатии файла {compress.source_path}: {str(e)}")
+
+    async def _compress_blocks(self, compress: FileCompressTaskData) -> dict:
+        started = time.perf_counter()
+        destination_path = compress.destination_path or default_destination(
+            compress.source_path, compress.format, compress=True
+        )
+        await self._run_blocking(self._validate_path, compress.source_path, True)
+        await self._run_blocking(self._validate_path, destination_path, False)
+        source = await self._run_blocking(open, compress.source_path, "rb")
+        try:
+            destination = await self._run_blocking(open, destination_path, "wb")
+        except BaseException:
+            await self._run_blocking(source.close)
+            raise
+
+        window: deque = deque()
+        size_in = size_out = blocks = 0
+
+        async def flush_oldest() -> None:
+            nonlocal size_out
+            data = await window.popleft()
+            await self._run_blocking(destination.write, data)
+            size_out += len(data)
+
+        try:
+            while True:
+                block = await self._run_blocking(source.read, compress.block_size)
+                if not block and blocks:
+                    break
+                window.append(asyncio.ensure_future(self._run_blocking(
+                    compress_block, compress.format, compress.effective_level, block
+                )))
+                size_in += len(block)
+                blocks += 1
+                if len(window) >= self.parallelism:
+                    await flush_oldest()
+                if not block:
+                    break
+            while window:
+                await flush_oldest()
+        finally:
+            for pending in window:
+                pending.cancel()
+            await asyncio.gather(*window, return_exceptions=True)
+            await self._run_blocking(destination.close)
+            await self._run_blocking(source.close)
+
+        duration = time.perf_counter() - started
+        return {
+            "format": compress.format,
+            "level": compress.effective_level,
+            "destination_path": destination_path,
+            "blocks": blocks,
+            "size_in": size_in,
+            "size_out": size_out,
+            "ratio": round(size_out / size_in, 4) if size_in else 0.0,
+            "duration_sec": round(duration, 6),
+            "throughput_mb_s": round(size_in / duration / (1024 * 1024), 2) if duration > 0 else 0.0,
+        }
+
+    async def decompress_file(self, compress: FileCompressTaskData) -> dict:
+        """
+        Распаковка gzip или xz файла, в том числе из нескольких членов/потоков (результат compress_file, pigz, xz -T).
+        Распаковка deflate последовательна по природе формата, поэтому идет потоково в одном
+        потоке пула с буфером фиксированного размера.
+        Args:
+            compress (FileCompressTaskData): Сжатый файл и формат.
+        Return:
+            dict: Размеры до и после распаковки, длительность и пропускная способность.
+        """
+        started = time.perf_counter()
+        destination_path = compress.destination_path or default_destination(
+            compress.source_path, compress.format, compress=False
+        )
+        try:
+            await self._run_blocking(self._validate_path, compress.source_path, True)
+            await self._run_blocking(self._validate_path, destination_path, False)
+            size_out = await self._run_blocking(
+                decompress_file, compress.format, compress.source_path, destination_path
+            )
+            size_in = await self._run_blocking(os.path.getsize, compress.source_path)
+        except Exception as e:
+            raise TaskProcessingException(f"Ошибка при распаковке файла {compress.source_path}: {str(e)}")
+        duration = time.perf_counter() - started
+        return {
+            "format": compress.format,
+            "destination_path": destination_path,
+            "size_in": size_in,
+            "size_out": size_out,
+            "duration_sec": round(duration, 6),
+            "throughput_mb_s": round(size_out / duration / (1024 * 1024), 2) if duration > 0 else 0.0,
+        }
+
+    async def archive_dir(
+        self,
+        archive: DirArchiveTaskData,
+        on_progress: Optional[Callable[[dict], Awaitable[None]]] = None
+    ) -> dict:
+        """
+        Потоковая упаковка каталога в tar (при compression=gzip - tar.gz).
+        Каталоги обходятся в ширину через os.scandir, участки файлов читаются заранее
+        в пуле потоков воркера, а архив пишется последовательно. Очередь между чтением
+        и записью ограничена parallelism участками по ARCHIVE_CHUNK_SIZE, поэтому память
+        не зависит ни от размера файлов, ни от размера дерева. Ошибки отдельных записей
+        не прерывают архивацию: файл, изменившийся во время чтения, дополняется нулями
+        до размера из заголовка и попадает в ошибки.
+        Args:
+            archive (DirArchiveTaskData): Каталог, путь архива и сжатие.
+            on_progress (Optional[Callable]): Получает сведения о ходе архивации после записи
+                очередного элемента, не чаще раза в ARCHIVE_PROGRESS_INTERVAL секунд.
+        Return:
+            dict: Количество файлов, каталогов и байт, размер архива, ошибки, длительность
+                и пропускная способность.
+        """
+        try:
+            await self._run_blocking(check_archive_target, archive.source_path, archive.destination_path)
+            await self._run_blocking(self._validate_path, archive.destination_path, False)
+            return await self._write_archive(archive, on_progress)
+        except Exception as e:
+            raise TaskProcessingException(
+                f"Ошибка при архивации каталога {archive.source_path} -> {archive.destination_path}: {str(e)}")
+
+    async def _write_archive(
+        self,
+        archive: DirArchiveTaskData,
+        on_progress: Optional[Callable[[dict], Awaitable[None]]]
+    ) -> dict:
+        started = time.perf_counter()
+        stats = TreeStats()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.parallelism)
+        source_dir = os.path.normpath(archive.source_path)
+
+        async def produce() -> None:
+            try:
+                root_name = os.path.basename(source_dir) or "."
+                root_stat = await self._run_blocking(os.lstat, source_dir)
+                await queue.put((make_tarinfo(source_dir, root_name, root_stat), source_dir, None))
+                pending = deque([(source_dir, root_name)])
+                while pending:
+                    path, arcname = pending.popleft()
+                    try:
+                        entries, subdirs = await self._run_blocking(scan_archive_dir, path, arcname)
+                    except Exception as e:
+                        stats.add_failure(path, e)
+                        continue
+                    pending.extend(subdirs)
+                    for info, entry_path in entries:
+                        await queue.put((info, entry_path, None))
+                        for offset in range(0, info.size if info.isreg() else 0, ARCHIVE_CHUNK_SIZE):
+                            length = min(ARCHIVE_CHUNK_SIZE, info.size - offset)
+                            chunk = asyncio.ensure_future(self._run_blocking(read_range, entry_path, offset, length))
+                            await queue.put((None, entry_path, (chunk, length)))
+            except Exception as e:
+                stats.add_failure(source_dir, e)
+            await queue.put(None)
+
+        output = await self._run_blocking(open_archive, archive.destination_path, archive.compression, archive.level)
+        producer = asyncio.ensure_future(produce())
+        offset = remaining = 0
+        entry_failed = False
+        last_progress = float("-inf")
+        try:
+            while (item := await queue.get()) is not None:
+                info, path, chunk = item
+                if info is not None:
+                    data = tar_header(info)
+                    remaining, entry_failed = info.size if info.isreg() else 0, False
+                    if info.isdir():
+                        stats.directories += 1
+                    elif info.issym():
+                        stats.symlinks += 1
+                    else:
+                        stats.files += 1
+                        stats.bytes += info.size
+                else:
+                    future, length = chunk
+                    try:
+                        data = await future
+                    except Exception as e:
+                        data, entry_failed = b"", True
+                        stats.add_failure(path, e)
+                    if len(data) != length:
+                        if not entry_failed:
+                            entry_failed = True
+                            stats.add_failure(path, OSError(f"Файл {path} изменился во время чтения"))
+                        data = data[:length].ljust(length, b"\0")
+                    remaining -= length
+                    if not remaining:
+                        data += tar_padding(offset + len(data))
+                await self._run_blocking(output.write, data)
+                offset += len(data)
+                entry_done = not remaining
+                if on_progress is not None and entry_done and time.monotonic() - last_progress >= ARCHIVE_PROGRESS_INTERVAL:
+                    last_progress = time.monotonic()
+                    await on_progress({**stats.as_generic_type(time.perf_counter() - started), "current": path})
+            await self._run_blocking(output.write, tar_trailer(offset))
+        except BaseException:
+            await self._run_blocking(output.close)
+            await self._run_blocking(remove_path, archive.destination_path)
+            raise
+        finally:
+            producer.cancel()
+            while not queue.empty():
+                item = queue.get_nowait()
+                if item is not None and item[2] is not None:
+                    item[2][0].cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+        await self._run_blocking(output.close)
+
+        result = stats.as_generic_type(time.perf_counter() - started)
+        result["archive_size"] = await self._run_blocking(os.path.getsize, archive.destination_path)
+        return result
+
+    async def search_files(self, search: FileSearchTaskData) -> dict:
+        """
+        Поиск литерала или регулярного выражения в файлах и каталогах.
+        Файлы отображаются через mmap и делятся на участки по SEARCH_RANGE_SIZE, участки
+        сканируются не более чем по parallelism одновременно в search_executor (пул процессов:
+        re удерживает GIL), а без него - в пуле потоков воркера. Пул процессов создает только
+        исполнитель очереди PostgreSQL; дочерние процессы Celery (prefork) - демоны и не могут
+        запускать свои процессы, поэтому там участки сканируются в потоках, фактически на одном
+        ядре. Границы участков выравниваются по строкам. В результат попадают количество совпадений
+        по файлам и первые max_offsets смещений; при output_path все совпадения пишутся в файл
+        JSON Lines. Ошибка отдельного файла или недоступный путь не прерывают поиск.
+        Args:
+            search (FileSearchTaskData): Пути, шаблон и параметры поиска.
+        Return:
+            dict: Совпадения по файлам, итоговые количество, объем и пропускная способность.
+        """
+        try:
+            return await self._search(search)
+        except Exception as e:
+            raise TaskProcessingException(f"Ошибка при поиске в файлах: {str(e)}")
+
+    async def _search(self, search: FileSearchTaskData) -> dict:
+        started = time.perf_counter()
+        files, collect_errors = await self._run_blocking(collect_search_files, search.paths)
+        ranges = [
+            SearchRange(path, start, end, f"{search.output_path}.{index}.part" if search.output_path else None)
+            for index, (path, start, end) in enumerate(
+                item for path, size in files for item in split_ranges(path, size, SEARCH_RANGE_SIZE)
+            )
+        ]
+        loop = asyncio.get_running_loop()
+        executor = self.search_executor or self.executor
+        semaphore = asyncio.Semaphore(self.parallelism)
+
+        async def scan(part: SearchRange) -> Any:
+            async with semaphore:
+                try:
+                    return await loop.run_in_executor(executor, partial(
+                        search_range, part, search.pattern, search.regex, search.ignore_case,
+                        search.max_offsets
+                    ))
+                except Exception as e:
+                    return e
+
+        outcomes = await asyncio.gather(*(scan(item) for item in ranges))
+        if search.output_path:
+            await self._run_blocking(merge_parts, [item.part_path for item in ranges], search.output_path)
+
+        per_file = {
+            path: {"path": path, "matches": 0, "offsets": [], "error": error} for path, error in collect_errors
+        }
+        failed, total, reported = len(collect_errors), 0, 0
+        for item, outcome in zip(ranges, outcomes):
+            entry = per_file.setdefault(item.path, {"path": item.path, "matches": 0, "offsets": []})
+            if isinstance(outcome, Exception):
+                if "error" not in entry:
+                    entry["error"] = str(outcome)
+                    failed += 1
+                continue
+            count, offsets = outcome
+            entry["matches"] += count
+            total += count
+            offsets = offsets[:search.max_offsets - reported]
+            entry["offsets"].extend(offsets)
+            reported += len(offsets)
+        if per_file and failed == len(per_file):
+            raise TaskProcessingException(
+                "; ".join(entry["error"] for entry in list(per_file.values())[:10]))
+
+        scanned_bytes = sum(size for _, size in files)
+        duration = time.perf_counter() - started
+        return {
+            "pattern": search.pattern,
+            "regex": search.regex,
+            "files_scanned": len(files),
+            "bytes_scanned": scanned_bytes,
+            "matches": total,
+            "failed": failed,
+            "truncated": total > reported,
+            "output_path": search.output_path,
+            "duration_sec": round(duration, 6),
+            "throughput_mb_s": round(scanned_bytes / duration / (1024 * 1024), 2) if duration > 0 else 0.0,
+            "files": [
+                entry for entry in per_file.values() if entry["matches"] or "error" in entry
+            ][:MAX_REPORTED_SEARCH_FILES],
+        }
+
+    async def split_file(self, split: FilePartsTaskData) -> dict:
+        """
+        Разделение файла на parts частей или на части по part_size байт.
+        Части записываются параллельно (не более parallelism одновременно) через
+        copy_file_range/sendfile со смещениями, поэтому данные не проходят через буферы Python.
+        Args:
+            split (FilePartsTaskData): Исходный файл, префикс частей и способ разделения.
+        Return:
+            dict: Пути и размеры частей, объем, длительность и пропускная способность.
+        """
+        started = time.perf_counter()
+        try:
+            await self._run_blocking(self._validate_path, split.source_path, True)
+            size = await self._run_blocking(os.path.getsize, split.source_path)
+            ranges = plan_split(size, split.parts, split.part_size)
+            paths = [part_path(split.destination_path, index, len(ranges)) for index in range(len(ranges))]
+            strategies = await self._gather_limited(
+                self._copy_part(split.source_path, path, start, end, 0, end - start)
+                for path, (start, end) in zip(paths, ranges)
+            )
+        except Exception as e:
+            raise TaskProcessingException(f"Ошибка при разделении файла {split.source_path}: {str(e)}")
+        return self._parts_result(
+            strategies, size, started,
+            parts=[{"path": path, "size": end - start} for path, (start, end) in zip(paths, ranges)]
+        )
+
+    async def concat_files(self, concat: FilePartsTaskData) -> dict:
+        """
+        Склейка частей в один файл в заданном порядке.
+        Файл назначения заранее усекается до суммарного размера, после чего части копируются
+        в свои смещения параллельно (не более parallelism одновременно) через copy_file_range/sendfile.
+        Args:
+            concat (FilePartsTaskData): Части по порядку и склеенный файл.
+        Return:
+            dict: Количество частей, объем, длительность и пропускная способность.
+        """
+        started = time.perf_counter()
+        try:
+            await self._run_blocking(self._validate_path, concat.destination_path, False)
+            await self._run_blocking(check_concat_target, concat.source_paths, concat.destination_path)
+            sizes = []
+            for path in concat.source_paths:
+                await self._run_blocking(self._validate_path, path, True)
+                sizes.append(await self._run_blocking(os.path.getsize, path))
+            await self._run_blocking(allocate_file, concat.destination_path, sum(sizes))
+            offsets = accumulate([0] + sizes[:-1])
+            strategies = await self._gather_limited(
+                self._copy_part(path, concat.destination_path, 0, size, offset, None)
+                for path, size, offset in zip(concat.source_paths, sizes, offsets)
+            )
+        except Exception as e:
+            raise TaskProcessingException(f"Ошибка при склейке файлов в {concat.destination_path}: {str(e)}")
+        return self._parts_result(strategies, sum(sizes), started, parts=len(sizes))
+
+    def _copy_part(
+        self,
+        source_path: str,
+        destination_path: str,
+        start: int,
+        end: int,
+        destination_offset: int,
+        allocate: Optional[int]
+    ) -> Callable[[], str]:
+        """Возвращает блокирующую функцию копирования одного участка; allocate - размер создаваемой части."""
+        def copy_part() -> str:
+            if allocate is not None:
+                allocate_file(destination_path, allocate)
+            strategy, _ = self.copy_engine.copy_range(source_path, destination_path, start, end, destination_offset)
+            return strategy
+        return copy_part
+
+    async def _gather_limited(self, funcs) -> list:
+        """Выполняет блокирующие функции в пуле потоков не более чем по parallelism одновременно."""
+        semaphore = asyncio.Semaphore(self.parallelism)
+
+        async def run(func: Callable[[], T]) -> T:
+            async with semaphore:
+                return await self._run_blocking(func)
+
+        return await asyncio.gather(*(run(func) for func in funcs))
+
+    @staticmethod
+    def _parts_result(strategies: list, total_bytes: int, started: float, parts: Any) -> dict:
+        duration = time.perf_counter() - started
+        return {
+            "strategy": strategies[-1] if strategies else STRATEGY_CHUNKED,
+            "parts": parts,
+            "bytes": total_bytes,
+            "duration_sec": round(duration, 6),
+            "throughput_mb_s": round(total_bytes / duration / (1024 * 1024), 2) if duration > 0 else 0.0,
+        }
+
+    async def copy_dir(self, file: FileTaskData) -> dict:
+        """
+        Рекурсивное копирование каталога.
+        Каталоги обходятся в ширину через os.scandir и создаются раньше своего содержимого,
+        файлы копируются parallelism обработчиками через ограниченную очередь, поэтому память
+        не зависит от размера дерева. Ошибки отдельных файлов не прерывают копирование,
+        а попадают в итог.
+        Args:
+            file (FileTaskData): Исходный каталог и каталог назначения.
+        Return:
+            dict: Количество файлов, каталогов и байт, ошибки, длительность и пропускная способность.
+        """
+        try:
+            return await self._copy_tree(file.source_path, file.destination_path)
+        except Exception as e:
+            raise TaskProcessingException(
+                f"Ошибка при копировании каталога {file.source_path} -> {file.destination_path}: {str(e)}")
+
+    async def _walk_with_workers(
+        self,
+        root: Tuple[str, str],
+        scan: Callable[[str, str], Awaitable[Tuple[list, list]]],
+        handle: Callable[[Any], Awaitable[None]],
+        item_path: Callable[[Any], str],
+        stats: TreeStats
+    ) -> None:
+        """
+        Обходит пары каталогов (источник, назначение) в ширину и передает найденные элементы
+        parallelism обработчикам через ограниченную очередь: память не зависит от размера дерева.
+        Args:
+            root (Tuple[str, str]): Корневая пара каталогов.
+            scan (Callable): Читает один уровень пары и возвращает (элементы, подкаталоги).
+            handle (Callable): Обрабатывает один элемент; ошибки записываются в stats.
+            item_path (Callable): Путь элемента, под которым его ошибка попадает в stats.
+            stats (TreeStats): Накопительная статистика.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.parallelism * 4)
+
+        async def worker() -> None:
+            while (item := await queue.get()) is not None:
+                try:
+                    await handle(item)
+                except Exception as e:
+                    stats.add_failure(item_path(item), e)
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.parallelism)]
+        try:
+            pending_dirs = deque([root])
+            while pending_dirs:
+                source_path, destination_path = pending_dirs.popleft()
+                try:
+                    items, subdirs = await scan(source_path, destination_path)
+                except OSError as e:
+                    if (source_path, destination_path) == root:
+                        raise
+                    stats.add_failure(source_path, e)
+                    continue
+                stats.directories += 1
+                pending_dirs.extend(subdirs)
+                for item in items:
+                    await queue.put(item)
+        finally:
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+
+    async def _copy_tree(self, source_dir: str, destination_dir: str) -> dict:
+        started = time.perf_counter()
+        await self._run_blocking(check_not_nested, source_dir, destination_dir)
+        stats = TreeStats()
+
+        async def scan(source_path: str, destination_path: str) -> Tuple[list, list]:
+            files, subdirs, symlinks = await self._run_blocking(scan_copy_dir, source_path, destination_path)
+            stats.symlinks += symlinks
+            return files, subdirs
+
+        async def copy(item: Tuple[str, str, int]) -> None:
+            source_path, destination_path, size = item
+            await self._run_blocking(self._atomic_copy_sync, source_path, destination_path, group)
+            stats.files += 1
+            stats.bytes += size
+
+        async with self._durability_group() as group:
+            await self._walk_with_workers(
+                (source_dir, destination_dir), scan, copy, lambda item: item[0], stats
+            )
+        return stats.as_generic_type(time.perf_counter() - started)
+
+    async def sync_dir(self, sync: DirSyncTaskData) -> dict:
+        """
+        Инкрементальная синхронизация каталога (как rsync).
+        Каждый уровень обеих сторон читается через os.scandir и сравнивается слиянием
+        отсортированных списков; копируются только файлы, отличающиеся размером или mtime
+        (при checksum - хэшем содержимого), а при delete удаляется то, чего нет в источнике.
+        Скопированным файлам выставляется mtime источника, чтобы следующий запуск их пропустил.
+        Args:
+            sync (DirSyncTaskData): Каталоги и параметры синхронизации.
+        Return:
+            dict: Количество скопированных, совпавших и удаленных путей, объем, ошибки.
+        """
+        try:
+            return await self._sync_tree(sync)
+        except Exception as e:
+            raise TaskProcessingException(
+                f"Ошибка при синхронизации каталога {sync.source_path} -> {sync.destination_path}: {str(e)}")
+
+    async def _sync_tree(self, sync: DirSyncTaskData) -> dict:
+        started = time.perf_counter()
+        await self._run_blocking(check_not_nested, sync.source_path, sync.destination_path)
+        stats = SyncStats()
+
+        async def scan(source_path: str, destination_path: str) -> Tuple[list, list]:
+            actions, subdirs, unchanged, symlinks = await self._run_blocking(
+                scan_sync_dir, source_path, destination_path, sync.delete, sync.checksum
+            )
+            stats.unchanged += unchanged
+            stats.symlinks += symlinks
+            return actions, subdirs
+
+        async def apply(action: SyncAction) -> None:
+            if action.kind == SYNC_DELETE:
+                await self._run_blocking(remove_path, action.destination_path)
+                stats.deleted += 1
+                return
+            if action.kind == SYNC_COMPARE:
+                source_digest, destination_digest = await asyncio.gather(
+                    self._run_blocking(file_digest, action.source_path),
+                    self._run_blocking(file_digest, action.destination_path),
+                )
+                if source_digest == destination_digest:
+                    stats.unchanged += 1
+                    return
+            await self._run_blocking(self._sync_file_sync, action, group)
+            stats.files += 1
+            stats.bytes += action.size
+
+        async with self._durability_group() as group:
+            await self._walk_with_workers(
+                (sync.source_path, sync.destination_path), scan, apply, lambda action: action.destination_path, stats
+            )
+        return stats.as_generic_type(time.perf_counter() - started)
+
+    def _sync_file_sync(self, action: SyncAction, group: DurabilityGroup) -> None:
+        with atomic_write(action.destination_path, self.durability) as temp_file:
+            self.copy_engine.copy(action.source_path, temp_file)
+            os.utime(temp_file, ns=(action.atime_ns, action.mtime_ns))
+        self._track(action.destination_path, group)
+
     async def delete_file(self, file: FileTaskData) -> None:
         try:
-            await self._validate_path(file.source_path, must_exist=True)
-            os.remove(file.source_path)
+            await self._run_blocking(self._delete_file_sync, file.source_path)
         except Exception as e:
             raise TaskProcessingException(f"Ошибка при удалении файла {file.source_path}: {str(e)}")
 
-    async def process(self, task_data: FileTaskData):
-        """Общий метод обработки задач"""
+    async def delete_pattern(self, delete: FileDeletePatternTaskData) -> dict:
+        """
+        Удаление файлов под корневым каталогом по glob-шаблону, возрасту и размеру.
+        Каталоги обходятся в ширину через os.scandir, lstat выполняется только для файлов,
+        подошедших по имени. Отобранные файлы удаляются пакетами по DELETE_BATCH_SIZE
+        parallelism обработчиками, каталоги не удаляются. При dry_run файлы только подсчитываются.
+        Args:
+            delete (FileDeletePatternTaskData): Корень, условие отбора и dry_run.
+        Return:
+            dict: Количество подходящих и удаленных файлов, освобожденные байты, ошибки,
+                длительность и пропускная способность.
+        """
+        started = time.perf_counter()
+        stats = TreeStats()
+        deleted = freed = 0
+        delete_filter = DeleteFilter(
+            root=delete.source_path,
+            matcher=re.compile(fnmatch.translate(delete.pattern)),
+            match_path="/" in delete.pattern,
+            max_mtime=time.time() - delete.min_age_sec if delete.min_age_sec is not None else None,
+            min_size=delete.min_size,
+            max_size=delete.max_size,
+            recursive=delete.recursive,
+        )
+
+        async def scan(path: str, _: str) -> Tuple[list, list]:
+            return await self._run_blocking(scan_delete_dir, path, delete_filter)
+
+        async def remove(item: Tuple[str, list]) -> None:
+            nonlocal deleted, freed
+            _, files = item
+            stats.files += len(files)
+            stats.bytes += sum(size for _, size in files)
+            if delete.dry_run:
+                return
+            batch_deleted, batch_freed, errors = await self._run_blocking(delete_files, files)
+            deleted += batch_deleted
+            freed += batch_freed
+            for path, error in errors:
+                stats.add_failure(path, error)
+
+        try:
+            if not await self._run_blocking(os.path.isdir, delete.source_path):
+                raise NotADirectoryError(f"{delete.source_path} не является каталогом")
+            await self._walk_with_workers((delete.source_path, ""), scan, remove, lambda item: item[0], stats)
+        except Exception as e:
+            raise TaskProcessingException(
+                f"Ошибка при удалении файлов по шаблону {delete.pattern} в {delete.source_path}: {str(e)}")
+
+        result = stats.as_generic_type(time.perf_counter() - started)
+        result.update({"dry_run": delete.dry_run, "deleted": deleted, "bytes_freed": freed})
+        return result
+
+    async def run_batch(self, batch: FileBatchTaskData) -> dict:
+        """
+        Выполняет пакет файловых операций одной задачей.
+        Операции запускаются в порядке пакета не более чем по batch.parallelism
+        (или self.parallelism) одновременно. При stop_on_error после первой ошибки новые
+        операции не запускаются и помечаются SKIPPED; уже начатые завершаются.
+        Args:
+            batch (FileBatchTaskData): Пакет операций.
+        Return:
+            dict: Итоги по пакету и статус каждой операции в порядке пакета.
+        """
+        started = time.perf_counter()
+        group = DurabilityGroup()
+        handlers = {
+            TaskTypeEnum.FILE_CREATE.value: partial(self.create_file, group=group),
+            TaskTypeEnum.FILE_COPY.value: partial(self.copy_file, group=group),
+            TaskTypeEnum.FILE_DELETE.value: self.delete_file,
+        }
+        items = [
+            {
+                "index": index,
+                "task_type": operation.task_type.value,
+                "source_path": operation.source_path,
+                "status": "SKIPPED",
+            }
+            for index, operation in enumerate(batch.operations)
+        ]
+        pending = iter(enumerate(batch.operations))
+        failed = asyncio.Event()
+
+        async def batch_worker() -> None:
+            for index, operation in pending:
+                if batch.stop_on_error and failed.is_set():
+                    return
+                try:
+                    details = await handlers[operation.task_type.value](operation)
+                except (Exception, DomainException) as e:
+                    items[index].update(status="FAILED", error=str(e))
+                    failed.set()
+                else:
+                    items[index]["status"] = "COMPLETED"
+                    if details:
+                        items[index]["details"] = details
+
+        await asyncio.gather(*(batch_worker() for _ in range(batch.parallelism or self.parallelism)))
+        try:
+            await self._sync_group(group)
+        except Exception as e:
+            raise TaskProcessingException(f"Ошибка при сбросе пакета файлов на диск: {str(e)}")
+        statuses = [item["status"] for item in items]
+        return {
+            "total": len(items),
+            "completed": statuses.count("COMPLETED"),
+            "failed": statuses.count("FAILED"),
+            "skipped": statuses.count("SKIPPED"),
+            "duration_sec": round(time.perf_counter() - started, 6),
+            "items": items,
+        }
+
+    async def process(
+        self,
+        task_data: TaskData,
+        checkpoint: Optional[CopyCheckpoint] = None,
+        on_checkpoint: Optional[Callable[[Optional[CopyCheckpoint]], Awaitable[None]]] = None,
+        on_progress: Optional[Callable[[dict], Awaitable[None]]] = None,
+        last_attempt: bool = False
+    ) -> Optional[dict]:
+        """
+        Выполняет обработчик, соответствующий типу задачи (единственная таблица обработчиков).
+        Args:
+            task_data (TaskData): Данные задачи.
+            checkpoint (Optional[CopyCheckpoint]): Контрольная точка прерванного копирования (FILE_COPY).
+            on_checkpoint (Optional[Callable]): Сохранение контрольных точек копирования (FILE_COPY).
+            on_progress (Optional[Callable]): Сохранение хода архивации (DIR_ARCHIVE).
+            last_attempt (bool): Последняя попытка: недокопированный файл не сохраняется (FILE_COPY).
+        Return:
+            Optional[dict]: Сведения о выполнении, если обработчик их возвращает.
+        Exception:
+            TaskTypeException: Если тип задачи не поддерживается.
+        """
         task_handlers = {
             TaskTypeEnum.FILE_CREATE.value: self.create_file,
-            TaskTypeEnum.FILE_COPY.value: self.copy_file,
+            TaskTypeEnum.FILE_COPY.value: partial(
+                self.copy_file, checkpoint=checkpoint, on_checkpoint=on_checkpoint, last_attempt=last_attempt
+            ),
             TaskTypeEnum.FILE_DELETE.value: self.delete_file,
+            TaskTypeEnum.DIR_COPY.value: self.copy_dir,
+            TaskTypeEnum.FILE_BATCH.value: self.run_batch,
+            TaskTypeEnum.DIR_SYNC.value: self.sync_dir,
+            TaskTypeEnum.FILE_HASH.value: self.hash_files,
+            TaskTypeEnum.FILE_COMPRESS.value: self.compress_file,
+            TaskTypeEnum.FILE_DECOMPRESS.value: self.decompress_file,
+            TaskTypeEnum.DIR_ARCHIVE.value: partial(self.archive_dir, on_progress=on_progress),
+            TaskTypeEnum.FILE_SEARCH.value: self.search_files,
+            TaskTypeEnum.FILE_SPLIT.value: self.split_file,
+            TaskTypeEnum.FILE_CONCAT.value: self.concat_files,
+            TaskTypeEnum.FILE_DELETE_PATTERN.value: self.delete_pattern,
         }
 
         handler = task_handlers.get(task_data.task_type)
         if handler:
-            await handler(task_data)
+            return await handler(task_data)
         else:
             raise TaskTypeException(f"Неподдерживаемый тип задачи: {task_data.task_type}")
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from app.domain.exceptions.entity import TaskException, TaskNotFoundException
 from app.domain.exceptions.value_object import TaskTypeException
-from app.domain.value_objects.task_status import TaskStatus, TaskStatusEnum
+from app.domain.value_objects.task_status import TaskStatusEnum
 from app.domain.repositories.task_repository import TaskRepository
 
 
@@ -12,7 +12,7 @@ class CancelTaskUseCase:
     Use case для отмены задачи.
     """
     task_repository: TaskRepository
-    async def execute(self, task_id: str) -> None:
+    async def execute(self, task_id: str) -> dict:
         """
         Отменяет задачу, если она находится в статусе 'PENDING'.
         Args:
@@ -22,17 +22,23 @@ class CancelTaskUseCase:
         Exception:
             TaskNotFoundException: Если задача с указанным ID не найдена.
             TaskTypeException: Если статус задачи не позволяет отмену.
+            TaskException: Если задачу успели захватить на выполнение до отмены.
         """
         task = await self.task_repository.get_task_by_id(task_id)
-        if task:
-            if task.status != TaskStatusEnum.PENDING:
-                raise TaskTypeException(message=f"Отмена задачи с статусом - {task.status.value} невозможна")
-            task.update_status(TaskStatus(TaskStatusEnum.CANCELED).as_generic_type())
-            new_task=await self.task_repository.update_task(task)
-            return {
-                "id": new_task.id,
-                "status": new_task.status,
-                "updated_at": new_task.updated_at
-            }
-        else:
+        if not task:
             raise TaskNotFoundException(message=f"Задачи с таким ID - {task_id} не найдено.")
+        if task.status != TaskStatusEnum.PENDING:
+            raise TaskTypeException(message=f"Отмена задачи с статусом - {task.status.value} невозможна")
+
+        canceled = await self.task_repository.cancel_task(task_id)
+        if canceled is None:
+            # Между чтением и отменой задачу захватил исполнитель (или удалили)
+            task = await self.task_repository.get_task_by_id(task_id)
+            if not task:
+                raise TaskNotFoundException(message=f"Задачи с таким ID - {task_id} не найдено.")
+            raise TaskException(message=f"Отмена задачи с статусом - {task.status.value} невозможна")
+        return {
+            "id": canceled.id,
+            "status": canceled.status,
+            "updated_at": canceled.updated_at
+        }
@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from app.application.use_cases.create_task import CreateTaskUseCase
+from app.domain.entities.task import Task
+from app.domain.exceptions.base import DomainException
+from app.domain.exceptions.value_object import TaskBatchValidationException
+from app.domain.repositories.task_repository import TaskRepository
+
+
+@dataclass
+class CreateTaskBatchUseCase:
+    """
+    Use case для пакетного создания задач.
+    """
+    task_repository: TaskRepository
+
+    async def execute(self, items: List[Tuple[str, dict]]) -> List[Task]:
+        """
+        Валидирует все задачи пакета за один проход и сохраняет их одним запросом.
+        Args:
+            items (List[Tuple[str, dict]]): Пары (название задачи, данные задачи).
+
+        Return:
+            List[Task]: Созданные задачи в порядке входного пакета.
+
+        Exception:
+            TaskBatchValidationException: Если хотя бы одна задача невалидна.
+                Сообщение содержит ошибки всех невалидных задач с их индексами.
+        """
+        builder = CreateTaskUseCase(self.task_repository)
+        tasks: List[Task] = []
+        errors: List[str] = []
+        for index, (name, data) in enumerate(items):
+            try:
+                tasks.append(builder.build_task(name, data))
+            except DomainException as e:
+                errors.append(f"[{index}] {e}")
+
+        if errors:
+            raise TaskBatchValidationException(message="; ".join(errors))
+
+        return await self.task_repository.create_tasks(tasks)
@@ -0,0 +1,48 @@
+import logging
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from app.application.services.file_watch import WatchRule
+from app.application.use_cases.create_task import CreateTaskUseCase
+from app.domain.entities.task import Task
+from app.domain.exceptions.base import DomainException
+from app.domain.repositories.task_repository import TaskRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CreateWatchTasksUseCase:
+    """
+    Use case для создания задач по событиям файловой системы.
+    """
+    task_repository: TaskRepository
+    rules: List[WatchRule]
+    batch_size: int = 500
+
+    async def execute(self, events: List[Tuple[str, str]]) -> List[Task]:
+        """
+        Сопоставляет события с правилами и сохраняет задачи пакетами по batch_size.
+        Файл может породить по задаче на каждое сработавшее правило. Задачи с невалидными
+        данными пропускаются с предупреждением в журнале, не мешая остальным.
+        Args:
+            events (List[Tuple[str, str]]): Пары (событие, путь файла).
+        Return:
+            List[Task]: Созданные задачи.
+        """
+        builder = CreateTaskUseCase(self.task_repository)
+        tasks: List[Task] = []
+        for event, path in events:
+            for rule in self.rules:
+                if not rule.matches(path, event):
+                    continue
+                name, data = rule.build_task(path)
+                try:
+                    tasks.append(builder.build_task(name, data))
+                except (DomainException, ValueError) as e:
+                    logger.warning(f"Правило {rule.name}: не удалось создать задачу для {path}: {e}")
+
+        created: List[Task] = []
+        for start in range(0, len(tasks), self.batch_size):
+            created.extend(await self.task_repository.create_tasks(tasks[start:start + self.batch_size]))
+        return created
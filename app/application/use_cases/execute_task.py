@@ -1,25 +1,29 @@
 from dataclasses import dataclass
-from typing import Any, Optional
+from functools import partial
+from typing import Any, Awaitable, Callable, Optional
 
 from app.application.services.task_processor import TaskProcessor
 from app.domain.entities.task import Task
+from app.domain.exceptions.base import DomainException
 from app.domain.exceptions.entity import TaskException, TaskNotFoundException, TaskAlreadyRunningException, \
     TaskProcessingException
 from app.domain.exceptions.value_object import TaskTypeException, ValidationException, TaskStatusException
 from app.domain.repositories.task_repository import TaskRepository
-from app.domain.value_objects.file_task_data import FileTaskData
+from app.domain.value_objects.copy_checkpoint import CopyCheckpoint
+from app.domain.value_objects.task_data_factory import build_task_data
 from app.domain.value_objects.task_result import TaskResult
 from app.domain.value_objects.task_status import TaskStatusEnum, TaskStatus
-from app.domain.value_objects.task_type import TaskTypeEnum
 
 
 @dataclass
 class ExecuteTaskUseCase:
     """
     Use case для выполнения задачи.
+    on_status_change вызывается после каждой записи статуса (например, для инвалидации кэша).
     """
     task_repository: TaskRepository
     task_processor: TaskProcessor
+    on_status_change: Optional[Callable[[str], Awaitable[None]]] = None
 
     async def execute(
         self,
@@ -45,62 +49,129 @@ class ExecuteTaskUseCase:
             TaskProcessingException: Ошибка при выполнении задачи.
         """
 
-        task=await self.task_repository.get_task_by_id(task_id)
-        if not task:
-            raise TaskNotFoundException(message=f"Задачи с таким ID - {task_id} не найдено.")
-
-        if task.status in {TaskStatusEnum.COMPLETED, TaskStatusEnum.FAILED, TaskStatusEnum.CANCELED}:
-            raise TaskStatusException(f"Запуск задачи {task_id} c статусом {task.status.value} невозможен.")
-
-        if task.status == TaskStatusEnum.IN_PROGRESS and not is_retry:
-            if is_celery:
+        task = await self.task_repository.claim_task(task_id)
+        if task:
+            await self._notify(task.id)
+        else:
+            task = await self._check_not_claimed(task_id, is_retry, is_celery)
+            if task.status == TaskStatusEnum.IN_PROGRESS and not is_retry:
                 return task
-            else:
-                raise TaskAlreadyRunningException(f"Задача {task_id} уже выполняется!")
 
-        task_data=task.task_data
-        if not isinstance(task_data, dict) or "task_type" not in task_data:
-            raise ValidationException(f"Некорректный формат данных: {task_data}")
-
-        task_handlers = {
-            TaskTypeEnum.FILE_CREATE.value: self.task_processor.create_file,
-            TaskTypeEnum.FILE_COPY.value: self.task_processor.copy_file,
-            TaskTypeEnum.FILE_DELETE.value: self.task_processor.delete_file,
-        }
-
-        if not is_retry:
-            await self._set_status(task, TaskStatusEnum.IN_PROGRESS)
+        try:
+            self.validate_task_data(task)
+        except ValidationException as e:
+            # Задача уже захвачена: некорректные данные сразу завершают её с ошибкой, повтор не поможет
+            await self._complete(task, TaskStatusEnum.FAILED, f"Ошибка выполнения задачи {task_id}: {str(e)}")
+            raise
 
         try:
-            task_type = TaskTypeEnum(task_data["task_type"]).value  # Переводим в Enum
-            handler = task_handlers.get(task_type)
-            await handler(FileTaskData(
-                    task_type=TaskTypeEnum(task_data["task_type"]),
-                    source_path=task_data["source_path"],
-                    destination_path=task_data["destination_path"]
-
-            ))
-            await self._set_status(task, TaskStatusEnum.COMPLETED, "Задача выполнена успешно")
-        except Exception as e:
+            details = await self.run_task(task, checkpoints=is_celery, last_attempt=is_last_attempt)
+        except (Exception, DomainException) as e:
             error_message = f"Ошибка выполнения задачи {task_id}: {str(e)}"
 
             if is_celery and not is_last_attempt:
                 raise TaskProcessingException(error_message)
 
-            await self._set_status(task, TaskStatusEnum.FAILED, error_message)
+            await self._complete(task, TaskStatusEnum.FAILED, error_message)
             raise TaskProcessingException(error_message)
 
-        return task
-
-    async def _set_status(self, task: Task, status: TaskStatusEnum, message: Optional[str] = None) -> None:
-        task.update_status(status)
-        if message:
-            task.update_result(TaskResult(message).as_generic_type())
-        await self.task_repository.update_task(task)
-
+        return await self._complete(task, TaskStatusEnum.COMPLETED, self.success_result(details))
 
+    def validate_task_data(self, task: Task) -> None:
+        """
+        Проверяет формат данных задачи перед выполнением.
+        Exception:
+            ValidationException: Если формат данных задачи некорректен.
+        """
+        task_data = task.task_data
+        if not isinstance(task_data, dict) or "task_type" not in task_data:
+            raise ValidationException(f"Некорректный формат данных: {task_data}")
 
+    @staticmethod
+    def success_result(details: Optional[dict] = None) -> Any:
+        """
+        Формирует результат успешно выполненной задачи.
+        Args:
+            details (Optional[dict]): Сведения, которые вернул обработчик (например, статистика копирования).
+        Return:
+            Any: Строка с сообщением или словарь с сообщением и сведениями обработчика.
+        """
+        message = "Задача выполнена успешно"
+        if isinstance(details, dict) and details:
+            return TaskResult({"message": message, **details}).as_generic_type()
+        return TaskResult(message).as_generic_type()
 
+    async def run_task(self, task: Task, checkpoints: bool = False, last_attempt: bool = False) -> Optional[dict]:
+        """
+        Выполняет обработчик, соответствующий типу задачи, без изменения её статуса.
+        Args:
+            task (Task): Захваченная задача.
+            checkpoints (bool): Сохранять контрольные точки копирования, чтобы повтор
+                (Celery retry) продолжил копирование с места сбоя, и ход архивации каталога.
+            last_attempt (bool): Последняя попытка: повтора не будет, недокопированный файл удаляется.
+        Return:
+            Optional[dict]: Сведения о выполнении, если обработчик их возвращает.
+        """
+        task_data = build_task_data(task.task_data)
+        if not checkpoints:
+            return await self.task_processor.process(task_data)
+        return await self.task_processor.process(
+            task_data,
+            checkpoint=CopyCheckpoint.from_task_result(task.result),
+            on_checkpoint=partial(self._save_checkpoint, task.id),
+            on_progress=partial(self._save_progress, task.id),
+            last_attempt=last_attempt
+        )
+
+    async def _save_checkpoint(self, task_id: str, checkpoint: Optional[CopyCheckpoint]) -> None:
+        await self.task_repository.save_checkpoint(
+            task_id, checkpoint.as_generic_type() if checkpoint is not None else None
+        )
+
+    async def _save_progress(self, task_id: str, progress: dict) -> None:
+        await self.task_repository.save_progress(task_id, progress)
+        await self._notify(task_id)
+
+    async def _check_not_claimed(self, task_id: str, is_retry: bool, is_celery: bool) -> Task:
+        """
+        Определяет, почему задачу не удалось захватить. Вызывается только при неудачном захвате.
+        Return:
+            Task: Задача в статусе IN_PROGRESS, которую можно продолжить (повтор) или пропустить (Celery).
+        Exception:
+            TaskNotFoundException: Если задача не найдена.
+            TaskStatusException: Если задача уже завершена.
+            TaskAlreadyRunningException: Если задача уже выполняется.
+        """
+        task = await self.task_repository.get_task_by_id(task_id)
+        if not task:
+            raise TaskNotFoundException(message=f"Задачи с таким ID - {task_id} не найдено.")
 
+        if task.status != TaskStatusEnum.IN_PROGRESS:
+            raise TaskStatusException(f"Запуск задачи {task_id} c статусом {task.status.value} невозможен.")
 
+        if not is_retry and not is_celery:
+            raise TaskAlreadyRunningException(f"Задача {task_id} уже выполняется!")
+        return task
 
+    async def _complete(self, task: Task, status: TaskStatusEnum, result: Any) -> Task:
+        """
+        Завершает задачу, если она всё ещё выполняется.
+        Return:
+            Task: Завершенная задача, а если её уже завершили или отменили - состояние из хранилища.
+        Exception:
+            TaskNotFoundException: Если задача была удалена.
+        """
+        if isinstance(result, str):
+            result = TaskResult(result).as_generic_type()
+        completed = await self.task_repository.complete_task(task.id, status, result)
+        if completed is None:
+            stored = await self.task_repository.get_task_by_id(task.id)
+            if stored is None:
+                raise TaskNotFoundException(message=f"Задачи с таким ID - {task.id} не найдено.")
+            return stored
+        await self._notify(task.id)
+        return completed
+
+    async def _notify(self, task_id: str) -> None:
+        if self.on_status_change:
+            await self.on_status_change(task_id)
@@ -0,0 +1,118 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+from app.application.services.task_processor import TaskProcessor
+from app.application.use_cases.execute_task import ExecuteTaskUseCase
+from app.domain.entities.task import Task
+from app.domain.exceptions.base import DomainException
+from app.domain.repositories.task_repository import TaskRepository
+from app.domain.value_objects.task_result import TaskResult
+from app.domain.value_objects.task_status import TaskStatusEnum
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ExecuteTaskBatchUseCase:
+    """
+    Use case для выполнения пакета задач из очереди в PostgreSQL.
+    Результаты записываются пакетными запросами по мере завершения задач (раз в flush_interval),
+    поэтому медленная задача не задерживает запись остальных, а после падения исполнителя
+    повторно выполняются только незаписанные задачи. Пока результат задачи не записан,
+    её аренда продлевается каждую треть lease_seconds.
+    on_status_change вызывается с идентификаторами задач после каждой пакетной записи статусов.
+    """
+    task_repository: TaskRepository
+    task_processor: TaskProcessor
+    concurrency: int = 16
+    lease_seconds: float = 300.0
+    flush_interval: float = 1.0
+    on_status_change: Optional[Callable[[List[str]], Awaitable[None]]] = None
+
+    async def execute(self, batch_size: int) -> int:
+        """
+        Захватывает до batch_size задач, выполняет их параллельно и записывает результаты пакетами.
+        Args:
+            batch_size (int): Максимальный размер пакета.
+        Return:
+            int: Количество обработанных задач (0, если очередь пуста).
+        """
+        tasks = await self.task_repository.claim_tasks(batch_size, self.lease_seconds)
+        if not tasks:
+            return 0
+        await self._notify([task.id for task in tasks])
+
+        executor = ExecuteTaskUseCase(self.task_repository, self.task_processor)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        unwritten = {task.id for task in tasks}
+        finished: List[Tuple[str, TaskStatusEnum, Any]] = []
+
+        async def run(task: Task) -> None:
+            async with semaphore:
+                try:
+                    executor.validate_task_data(task)
+                    details = await executor.run_task(task)
+                except (Exception, DomainException) as e:
+                    error_message = f"Ошибка выполнения задачи {task.id}: {str(e)}"
+                    finished.append((task.id, TaskStatusEnum.FAILED, TaskResult(error_message).as_generic_type()))
+                    return
+                finished.append((task.id, TaskStatusEnum.COMPLETED, executor.success_result(details)))
+
+        done = asyncio.Event()
+        maintenance = asyncio.create_task(self._maintain(unwritten, finished, done))
+        try:
+            await asyncio.gather(*(run(task) for task in tasks))
+        finally:
+            done.set()
+            await maintenance
+        await self._flush(unwritten, finished)
+        return len(tasks)
+
+    async def _maintain(
+        self,
+        unwritten: Set[str],
+        finished: List[Tuple[str, TaskStatusEnum, Any]],
+        done: asyncio.Event
+    ) -> None:
+        """
+        Пока пакет выполняется, записывает завершенные задачи и продлевает аренду незаписанных.
+        Единственная корутина, обращающаяся к общей сессии во время выполнения пакета; она
+        останавливается только в точке ожидания, чтобы не прерывать запрос.
+        """
+        loop = asyncio.get_running_loop()
+        renew_interval = self.lease_seconds / 3
+        renewed_at = loop.time()
+        while True:
+            try:
+                await asyncio.wait_for(done.wait(), timeout=min(self.flush_interval, renew_interval))
+                return
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self._flush(unwritten, finished)
+                if unwritten and loop.time() - renewed_at >= renew_interval:
+                    await self.task_repository.renew_claims(sorted(unwritten))
+                    renewed_at = loop.time()
+            except Exception:
+                logger.warning("Не удалось записать результаты или продлить аренду задач пакета", exc_info=True)
+
+    async def _flush(self, unwritten: Set[str], finished: List[Tuple[str, TaskStatusEnum, Any]]) -> None:
+        """Записывает накопленные результаты одним запросом; при ошибке они остаются для следующей записи."""
+        if not finished:
+            return
+        results = finished[:]
+        del finished[:len(results)]
+        try:
+            await self.task_repository.complete_tasks(results)
+        except Exception:
+            finished[:0] = results
+            raise
+        task_ids = [task_id for task_id, _, _ in results]
+        unwritten.difference_update(task_ids)
+        await self._notify(task_ids)
+
+    async def _notify(self, task_ids: List[str]) -> None:
+        if self.on_status_change:
+            await self.on_status_change(task_ids)
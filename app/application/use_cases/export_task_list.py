@@ -0,0 +1,60 @@
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, AsyncIterator
+
+from app.domain.value_objects.task_name import TaskName
+from app.domain.value_objects.task_status import TaskStatusEnum
+from app.domain.value_objects.task_type import TaskTypeEnum
+from app.domain.repositories.task_repository import TaskRepository
+
+
+@dataclass(frozen=True)
+class ExportTaskListUseCase:
+    """
+    Use case для потоковой выгрузки задач в формате NDJSON.
+    """
+    task_repository: TaskRepository
+
+    async def execute(
+        self,
+        name: Optional[TaskName] = None,
+        created_at_from:Optional[datetime]=None,
+        created_at_to:Optional[datetime]=None,
+        updated_at_from: Optional[datetime] = None,
+        updated_at_to: Optional[datetime] = None,
+        status: Optional[TaskStatusEnum] = None,
+        task_type: Optional[TaskTypeEnum] = None
+    ) -> AsyncIterator[str]:
+        """
+        Выгружает задачи, подходящие под фильтры, по одной JSON-строке на задачу.
+        Память не растет с размером выборки: строки отдаются по мере чтения из БД.
+
+        Args:
+            name (Optional[TaskName]): Фильтр по имени задачи.
+            created_at_from (Optional[datetime]): Фильтр по дате создания (от).
+            created_at_to (Optional[datetime]): Фильтр по дате создания (до).
+            updated_at_from (Optional[datetime]): Фильтр по дате обновления (от).
+            updated_at_to (Optional[datetime]): Фильтр по дате обновления (до).
+            status (Optional[TaskStatusEnum]): Фильтр по статусу задачи.
+            task_type (Optional[TaskTypeEnum]): Фильтр по типу задачи.
+
+        Return:
+            AsyncIterator[str]: Строки NDJSON, каждая завершается переводом строки.
+        """
+        async for task in self.task_repository.stream_tasks(
+            name=name,
+            created_at_from=created_at_from,
+            created_at_to=created_at_to,
+            updated_at_from=updated_at_from,
+            updated_at_to=updated_at_to,
+            status=status,
+            task_type=task_type
+        ):
+            yield json.dumps(task, ensure_ascii=False, default=self._default) + "\n"
+
+    @staticmethod
+    def _default(value):
+        if isinstance(value, datetime):
+            return value.isoformat()
+        raise TypeError(f"Тип {type(value).__name__} не сериализуется в JSON")
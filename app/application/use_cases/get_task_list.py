@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Optional, List
 
 from app.domain.entities.task import Task
+from app.domain.value_objects.task_cursor import TaskCursor
 from app.domain.value_objects.task_name import TaskName
 from app.domain.value_objects.task_status import TaskStatusEnum
 from app.domain.value_objects.task_type import TaskTypeEnum
@@ -24,10 +25,12 @@ class GetTaskListUseCase:
         updated_at_from: Optional[datetime] = None,
         updated_at_to: Optional[datetime] = None,
         status: Optional[TaskStatusEnum] = None,
-        task_type: Optional[TaskTypeEnum] = None
-    ) -> List[Task]:
+        task_type: Optional[TaskTypeEnum] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> dict:
         """
-        Получает список задач с возможными фильтрами.
+        Получает страницу списка задач с возможными фильтрами.
 
         Args:
             name (Optional[TaskName]): Фильтр по имени задачи.
@@ -37,17 +40,32 @@ class GetTaskListUseCase:
             updated_at_to (Optional[datetime]): Фильтр по дате обновления (до).
             status (Optional[TaskStatusEnum]): Фильтр по статусу задачи.
             task_type (Optional[TaskTypeEnum]): Фильтр по типу задачи.
+            limit (int): Размер страницы.
+            cursor (Optional[str]): Курсор, полученный вместе с предыдущей страницей.
 
         Return:
-            List[Task]: Список найденных задач.
+            dict: Найденные задачи (items) и курсор следующей страницы (next_cursor).
+
+        Exception:
+            TaskCursorException: Если курсор поврежден.
         """
-        return await self.task_repository.get_tasks(
+        tasks: List[Task] = await self.task_repository.get_tasks(
             name=name,
             created_at_from=created_at_from,
             created_at_to=created_at_to,
             updated_at_from=updated_at_from,
             updated_at_to=updated_at_to,
             status=status,
-            task_type=task_type
+            task_type=task_type,
+            limit=limit + 1,
+            cursor=TaskCursor.decode(cursor) if cursor else None
         )
-
+        next_cursor = None
+        if len(tasks) > limit:
+            tasks = tasks[:limit]
+            last_task = tasks[-1]
+            next_cursor = TaskCursor(created_at=last_task.created_at, id=last_task.id).as_generic_type()
+        return {
+            "items": tasks,
+            "next_cursor": next_cursor
+        }
@@ -5,13 +5,21 @@ from typing import Optional
 from app.domain.entities.task import Task
 from app.domain.exceptions.entity import TaskException, TaskNotFoundException
 from app.domain.exceptions.value_object import TaskTypeException
-from app.domain.value_objects.file_task_data import FileTaskData
+from app.domain.value_objects.task_data_factory import build_task_data
 from app.domain.value_objects.task_name import TaskName
 from app.domain.value_objects.task_result import TaskResult
 from app.domain.value_objects.task_status import TaskStatus, TaskStatusEnum
 from app.domain.repositories.task_repository import TaskRepository
 from app.domain.value_objects.task_type import TaskTypeEnum
 
+# Типы, данные которых целиком описываются source_path и destination_path; задачи других типов
+# заменяются созданием новой задачи
+UPDATABLE_TASK_TYPES = (
+    TaskTypeEnum.FILE_CREATE,
+    TaskTypeEnum.FILE_COPY,
+    TaskTypeEnum.FILE_DELETE,
+    TaskTypeEnum.DIR_COPY,
+)
 
 @dataclass
 class UpdateTaskUseCase:
@@ -36,7 +44,9 @@ class UpdateTaskUseCase:
             Task: Обновленный объект задачи.
         Exception:
             TaskNotFoundException: Если задача с таким ID не найдена.
-            TaskException: Если статус задачи не позволяет её обновление.
+            TaskTypeException: Если статус задачи не позволяет её обновление или новый тип задачи
+                нельзя задать обновлением.
+            ValidationException: Если новые данные задачи невалидны.
         """
         task = await self.task_repository.get_task_by_id(task_id)
         if not task:
@@ -49,12 +59,15 @@ class UpdateTaskUseCase:
             task.update_name(TaskName(name).as_generic_type())
         if data:
             if data.task_type:
-                new_task_data=FileTaskData(
-                    task_type=TaskTypeEnum(data.task_type),
-                    source_path=data.source_path,
-                    destination_path=data.destination_path
-
-                )
+                if TaskTypeEnum(data.task_type) not in UPDATABLE_TASK_TYPES:
+                    raise TaskTypeException(
+                        message=f"Тип задачи {TaskTypeEnum(data.task_type).value} нельзя задать обновлением"
+                    )
+                new_task_data = build_task_data({
+                    "task_type": TaskTypeEnum(data.task_type).value,
+                    "source_path": data.source_path,
+                    "destination_path": data.destination_path
+                })
                 task.update_task_data(new_task_data.as_generic_type())
         updated_task = await self.task_repository.update_task(task)
         return updated_task
\ No newline at end of file
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -7,6 +9,45 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
     DATABASE_URL: str
+    DB_ECHO: bool = True
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+
+    # Пул соединений дочернего процесса Celery (prefork): процесс выполняет одну задачу за раз
+    WORKER_DB_POOL_SIZE: int = 1
+    WORKER_DB_MAX_OVERFLOW: int = 1
+
+    # Очередь выполнения задач: celery (RabbitMQ) или postgres (таблица tasks, SKIP LOCKED)
+    TASK_QUEUE_BACKEND: Literal["celery", "postgres"] = "celery"
+    PG_QUEUE_BATCH_SIZE: int = 100
+    PG_QUEUE_CONCURRENCY: int = 16
+    PG_QUEUE_POLL_INTERVAL: float = 1.0
+    # Аренда захваченной задачи: исполнитель продлевает её, пока задача выполняется; задачу с истекшей
+    # арендой (исполнитель упал) забирает другой исполнитель
+    PG_QUEUE_LEASE_SECONDS: float = 300.0
+    # Как часто записывать результаты завершившихся задач пакета, не дожидаясь остальных
+    PG_QUEUE_FLUSH_INTERVAL: float = 1.0
+
+    # Размер пула потоков для файлового ввода-вывода (один пул на процесс воркера)
+    FILE_IO_THREADS: int = 8
+    # Размер участка между контрольными точками возобновляемого копирования (повторы Celery)
+    FILE_COPY_CHECKPOINT_SIZE: int = 256 * 1024 * 1024
+    # Файлы меньше этого размера копируются без контрольных точек (reflink / копирование в ядре)
+    FILE_COPY_RESUMABLE_THRESHOLD: int = 1024 * 1024 * 1024
+    # Максимум одновременных файловых операций внутри одной задачи над каталогом
+    FILE_TASK_PARALLELISM: int = 8
+    # Надежность записи файлов: none - атомарное переименование без fsync, fsync - сброс каждого
+    # файла и каталога, group - сброс всех записанных файлов и их каталогов после пакета (задачи)
+    FILE_WRITE_DURABILITY: Literal["none", "fsync", "group"] = "none"
+    # Размер пула процессов для поиска в файлах в исполнителе очереди PostgreSQL (0 - искать в пуле потоков)
+    FILE_SEARCH_PROCESSES: int = 4
+
+    # Наблюдатель за каталогами (file_watcher): таблица правил, окно объединения событий watchfiles,
+    # пауза без изменений файла перед созданием задачи и размер пакета вставки задач
+    WATCH_RULES_PATH: str = "watch_rules.json"
+    WATCH_DEBOUNCE_MS: int = 1600
+    WATCH_SETTLE_SECONDS: float = 2.0
+    WATCH_BATCH_SIZE: int = 500
 
     RABBITMQ_URL: str
     REDIS_URL: str
@@ -17,4 +58,4 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
-settings = Settings()
\ No newline at end of file
+settings = Settings()
@@ -1,8 +1,27 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.core.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, echo=True)
+
+def create_db_engine(pool_size: int = settings.DB_POOL_SIZE, max_overflow: int = settings.DB_MAX_OVERFLOW) -> AsyncEngine:
+    """
+    Создает асинхронный движок БД с пулом соединений заданного размера.
+    Args:
+        pool_size (int): Количество постоянных соединений в пуле.
+        max_overflow (int): Количество дополнительных соединений сверх пула.
+    Return:
+        AsyncEngine: Движок БД.
+    """
+    return create_async_engine(
+        settings.DATABASE_URL,
+        echo=settings.DB_ECHO,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_pre_ping=True,
+    )
+
+
+engine = create_db_engine()
 async_session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 Base = declarative_base()
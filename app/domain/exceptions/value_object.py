@@ -53,5 +53,23 @@ class InvalidPathException(FileValidationException):
     message: str = "FileTaskData - путь должен быть абсолютным"
 
 
+@dataclass
+class FileBatchValidationException(FileValidationException):
+    """ Исключение, возникающее если пакет файловых операций невалиден """
+    message: str = "FileBatchTaskData - невалидный пакет операций"
+
+
+@dataclass
+class TaskCursorException(ValidationException):
+    """ Исключение, возникающее если курсор пагинации невалиден """
+    message: str = "Невалидный курсор пагинации"
 
+@dataclass
+class TaskBatchValidationException(ValidationException):
+    """ Исключение, возникающее если часть задач пакета невалидна """
+    message: str = "Невалидные задачи в пакете"
 
+@dataclass
+class CopyCheckpointException(ValidationException):
+    """ Исключение, возникающее если контрольная точка копирования невалидна """
+    message: str = "Невалидная контрольная точка копирования"
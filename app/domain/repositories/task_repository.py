@@ -1,9 +1,10 @@
 from dataclasses import dataclass
 from abc import ABC,abstractmethod
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, Optional, List, AsyncIterator, Tuple
 
 from app.domain.entities.task import Task
+from app.domain.value_objects.task_cursor import TaskCursor
 from app.domain.value_objects.task_name import TaskName
 from app.domain.value_objects.task_status import TaskStatusEnum
 from app.domain.value_objects.task_type import TaskTypeEnum
@@ -23,6 +24,15 @@ class TaskRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def create_tasks(self, tasks: List[Task]) -> List[Task]:
+        """
+        Создает пакет задач в хранилище за одну операцию.
+        Args:tasks (List[Task]): Объекты задач.
+        Returns: List[Task]: Созданные задачи в порядке входного списка.
+        """
+        pass
+
     @abstractmethod
     async def get_task_by_id(self, task_id:str)->Optional[Task]:
         """
@@ -41,10 +51,13 @@ class TaskRepository(ABC):
         updated_at_from: Optional[datetime] = None,
         updated_at_to: Optional[datetime] = None,
         status: Optional[TaskStatusEnum] = None,
-        task_type: Optional[TaskTypeEnum] = None
+        task_type: Optional[TaskTypeEnum] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[TaskCursor] = None
     ) -> List[Task]:
         """
         Получает список задач с возможностью фильтрации.
+        Задачи упорядочены по (created_at, id), что позволяет листать их keyset-пагинацией.
         Args:
             name (Optional[TaskName]): Фильтр по имени.
             created_at_from (Optional[datetime]): Фильтр по дате создания (от).
@@ -53,10 +66,37 @@ class TaskRepository(ABC):
             updated_at_to (Optional[datetime]): Фильтр по дате обновления (до).
             status (Optional[TaskStatusEnum]): Фильтр по статусу задачи.
             task_type (Optional[TaskTypeEnum]): Фильтр по типу задачи.
+            limit (Optional[int]): Максимальное количество задач.
+            cursor (Optional[TaskCursor]): Курсор - вернуть задачи строго после него.
         Returns:List[Task]: Список найденных задач.
         """
         pass
 
+    @abstractmethod
+    def stream_tasks(
+        self,
+        name: Optional[TaskName] = None,
+        created_at_from:Optional[datetime]=None,
+        created_at_to:Optional[datetime]=None,
+        updated_at_from: Optional[datetime] = None,
+        updated_at_to: Optional[datetime] = None,
+        status: Optional[TaskStatusEnum] = None,
+        task_type: Optional[TaskTypeEnum] = None
+    ) -> AsyncIterator[dict]:
+        """
+        Потоково отдает данные задач с возможностью фильтрации, не материализуя выборку.
+        Args:
+            name (Optional[TaskName]): Фильтр по имени.
+            created_at_from (Optional[datetime]): Фильтр по дате создания (от).
+            created_at_to (Optional[datetime]): Фильтр по дате создания (до).
+            updated_at_from (Optional[datetime]): Фильтр по дате обновления (от).
+            updated_at_to (Optional[datetime]): Фильтр по дате обновления (до).
+            status (Optional[TaskStatusEnum]): Фильтр по статусу задачи.
+            task_type (Optional[TaskTypeEnum]): Фильтр по типу задачи.
+        Returns:AsyncIterator[dict]: Данные задач (id, name, task_data, status, result, created_at, updated_at).
+        """
+        pass
+
     @abstractmethod
     async def update_task(self,task: Task) -> Task:
         """
@@ -66,6 +106,86 @@ class TaskRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def claim_task(self, task_id: str) -> Optional[Task]:
+        """
+        Атомарно захватывает задачу на выполнение: PENDING -> IN_PROGRESS.
+        Args:task_id (str): Идентификатор задачи.
+        Returns:Optional[Task]: Захваченная задача или None, если задача не найдена или не в статусе PENDING.
+        """
+        pass
+
+    @abstractmethod
+    async def cancel_task(self, task_id: str) -> Optional[Task]:
+        """
+        Атомарно отменяет задачу: PENDING -> CANCELED.
+        Args:task_id (str): Идентификатор задачи.
+        Returns:Optional[Task]: Отмененная задача или None, если задача не найдена или не в статусе PENDING.
+        """
+        pass
+
+    @abstractmethod
+    async def complete_task(self, task_id: str, status: TaskStatusEnum, result: Any) -> Optional[Task]:
+        """
+        Атомарно завершает выполняющуюся задачу: IN_PROGRESS -> status.
+        Args:
+            task_id (str): Идентификатор задачи.
+            status (TaskStatusEnum): Итоговый статус (COMPLETED или FAILED).
+            result (Any): Результат выполнения или описание ошибки.
+        Returns:Optional[Task]: Завершенная задача или None, если задача не в статусе IN_PROGRESS.
+        """
+        pass
+
+    @abstractmethod
+    async def save_checkpoint(self, task_id: str, checkpoint: Optional[dict]) -> bool:
+        """
+        Сохраняет контрольную точку выполняющейся задачи в её результат.
+        Args:
+            task_id (str): Идентификатор задачи.
+            checkpoint (Optional[dict]): Контрольная точка или None для сброса.
+        Returns:bool: True, если задача в статусе IN_PROGRESS и точка сохранена.
+        """
+        pass
+
+    @abstractmethod
+    async def save_progress(self, task_id: str, progress: dict) -> bool:
+        """
+        Сохраняет сведения о ходе выполнения задачи в её результат.
+        Args:
+            task_id (str): Идентификатор задачи.
+            progress (dict): Сведения о ходе выполнения.
+        Returns:bool: True, если задача в статусе IN_PROGRESS и сведения сохранены.
+        """
+        pass
+
+    @abstractmethod
+    async def claim_tasks(self, limit: int, lease_seconds: float) -> List[Task]:
+        """
+        Атомарно захватывает пакет задач в статусе PENDING, а также выполняющихся задач с истекшей арендой
+        (их исполнитель остановился), пропуская захваченные другими исполнителями.
+        Args:
+            limit (int): Максимальный размер пакета.
+            lease_seconds (float): Срок аренды: задача, аренду которой не продлевали дольше, захватывается заново.
+        Returns:List[Task]: Захваченные задачи в статусе IN_PROGRESS.
+        """
+        pass
+
+    @abstractmethod
+    async def renew_claims(self, task_ids: List[str]) -> None:
+        """
+        Продлевает аренду выполняющихся задач.
+        Args:task_ids (List[str]): Идентификаторы задач.
+        """
+        pass
+
+    @abstractmethod
+    async def complete_tasks(self, results: List[Tuple[str, TaskStatusEnum, Any]]) -> None:
+        """
+        Завершает пакет выполняющихся задач одной операцией.
+        Args:results (List[Tuple[str, TaskStatusEnum, Any]]): Тройки (идентификатор, итоговый статус, результат).
+        """
+        pass
+
     @abstractmethod
     async def delete_task(self,task_id:str)->None:
         """
@@ -0,0 +1,68 @@
+from dataclasses import dataclass, replace
+from typing import Optional
+
+from app.domain.exceptions.value_object import CopyCheckpointException
+
+
+@dataclass(frozen=True)
+class CopyCheckpoint:
+    """
+    Объект значения для контрольной точки возобновляемого копирования файла.
+    Хранится в результате выполняющейся задачи и позволяет повтору продолжить копирование
+    с bytes_done вместо нулевого байта. size и mtime_ns фиксируют версию исходного файла:
+    если файл изменился, контрольная точка не используется.
+    Args:
+        size (int): Размер исходного файла в байтах.
+        mtime_ns (int): Время изменения исходного файла в наносекундах.
+        bytes_done (int): Количество уже скопированных байт от начала файла.
+        checksum (int): Накопительная CRC32 исходного файла на участке [0, bytes_done).
+    """
+    size: int
+    mtime_ns: int
+    bytes_done: int = 0
+    checksum: int = 0
+
+    def __post_init__(self):
+        self.validate()
+
+    def validate(self) -> None:
+        for name in ("size", "mtime_ns", "bytes_done", "checksum"):
+            value = getattr(self, name)
+            if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+                raise CopyCheckpointException(message=f"Невалидное значение {name} в контрольной точке: {value}")
+        if self.bytes_done > self.size:
+            raise CopyCheckpointException(
+                message=f"Скопировано больше байт ({self.bytes_done}), чем размер файла ({self.size})"
+            )
+
+    @property
+    def is_done(self) -> bool:
+        return self.bytes_done >= self.size
+
+    def advance(self, bytes_done: int, checksum: int) -> "CopyCheckpoint":
+        """Возвращает контрольную точку после копирования очередного участка."""
+        return replace(self, bytes_done=bytes_done, checksum=checksum)
+
+    def as_generic_type(self) -> dict:
+        return {
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "bytes_done": self.bytes_done,
+            "checksum": self.checksum,
+        }
+
+    @classmethod
+    def from_task_result(cls, result) -> Optional["CopyCheckpoint"]:
+        """
+        Извлекает контрольную точку из результата выполняющейся задачи.
+        Args:
+            result: Результат задачи ({"checkpoint": {...}} для прерванного копирования).
+        Return:
+            Optional[CopyCheckpoint]: Контрольная точка или None, если её нет или она повреждена.
+        """
+        if not isinstance(result, dict) or not isinstance(result.get("checkpoint"), dict):
+            return None
+        try:
+            return cls(**result["checkpoint"])
+        except (TypeError, CopyCheckpointException):
+            return None
@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from app.domain.exceptions.value_object import FileValidationException
+from app.domain.value_objects.file_task_data import FileTaskData
+from app.domain.value_objects.task_type import TaskTypeEnum
+
+ARCHIVE_COMPRESSIONS = ("gzip",)
+
+
+@dataclass(frozen=True)
+class DirArchiveTaskData(FileTaskData):
+    """
+    Объект значения для упаковки каталога в tar-архив (DIR_ARCHIVE).
+    Args:
+        source_path (str): Архивируемый каталог.
+        destination_path (Optional[str]): Путь файла архива.
+        compression (Optional[str]): Сжатие архива (gzip) или None для обычного tar.
+        level (int): Уровень сжатия gzip.
+    """
+    compression: Optional[str] = None
+    level: int = 6
+
+    def validate(self) -> None:
+        super().validate()
+        if self.task_type != TaskTypeEnum.DIR_ARCHIVE:
+            raise FileValidationException(message=f"Невалидный тип архивации каталога: {self.task_type}")
+        if not self.destination_path:
+            raise FileValidationException(message="Destination path не может быть пустым для архивации")
+        if self.compression is not None and self.compression not in ARCHIVE_COMPRESSIONS:
+            raise FileValidationException(message=f"Неподдерживаемое сжатие архива: {self.compression}")
+        if not isinstance(self.level, int) or not 1 <= self.level <= 9:
+            raise FileValidationException(message="Уровень сжатия архива должен быть от 1 до 9")
+
+    def as_generic_type(self) -> dict:
+        base_data = super().as_generic_type()
+        base_data.update({
+            "compression": self.compression,
+            "level": self.level
+        })
+        return base_data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DirArchiveTaskData":
+        return cls(
+            task_type=TaskTypeEnum(data.get("task_type")),
+            source_path=data.get("source_path"),
+            destination_path=data.get("destination_path"),
+            compression=data.get("compression"),
+            level=data.get("level") or 6
+        )
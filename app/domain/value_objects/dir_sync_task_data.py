@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+
+from app.domain.exceptions.value_object import FileValidationException
+from app.domain.value_objects.file_task_data import FileTaskData
+from app.domain.value_objects.task_type import TaskTypeEnum
+
+
+@dataclass(frozen=True)
+class DirSyncTaskData(FileTaskData):
+    """
+    Объект значения для инкрементальной синхронизации каталога (DIR_SYNC).
+    Args:
+        source_path (str): Исходный каталог.
+        destination_path (Optional[str]): Синхронизируемый каталог назначения.
+        delete (bool): Удалять из назначения то, чего нет в источнике.
+        checksum (bool): Сравнивать файлы одинакового размера по хэшу содержимого, а не по mtime.
+    """
+    delete: bool = True
+    checksum: bool = False
+
+    def validate(self) -> None:
+        super().validate()
+        if self.task_type != TaskTypeEnum.DIR_SYNC:
+            raise FileValidationException(message=f"Невалидный тип синхронизации каталога: {self.task_type}")
+        if not self.destination_path:
+            raise FileValidationException(message="Destination path не может быть пустым для синхронизации")
+
+    def as_generic_type(self) -> dict:
+        base_data = super().as_generic_type()
+        base_data.update({
+            "delete": self.delete,
+            "checksum": self.checksum
+        })
+        return base_data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DirSyncTaskData":
+        return cls(
+            task_type=TaskTypeEnum(data.get("task_type")),
+            source_path=data.get("source_path"),
+            destination_path=data.get("destination_path"),
+            delete=bool(data.get("delete", True)),
+            checksum=bool(data.get("checksum", False))
+        )
@@ -0,0 +1,94 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from app.domain.exceptions.base import DomainException
+from app.domain.exceptions.value_object import FileBatchValidationException
+from app.domain.value_objects.file_copy_task_data import FileCopyTaskData
+from app.domain.value_objects.file_task_data import FileTaskData
+from app.domain.value_objects.task_data import TaskData
+from app.domain.value_objects.task_type import TaskTypeEnum
+
+BATCH_OPERATION_DATA_TYPES = {
+    TaskTypeEnum.FILE_CREATE: FileTaskData,
+    TaskTypeEnum.FILE_COPY: FileCopyTaskData,
+    TaskTypeEnum.FILE_DELETE: FileTaskData,
+}
+BATCH_OPERATION_TYPES = tuple(BATCH_OPERATION_DATA_TYPES)
+MAX_BATCH_OPERATIONS = 10000
+MAX_BATCH_PARALLELISM = 64
+
+
+@dataclass(frozen=True)
+class FileBatchTaskData(TaskData):
+    """
+    Объект значения для пакета файловых операций, выполняемых одной задачей.
+    Args:
+        operations (Tuple[FileTaskData, ...]): Операции создания, копирования и удаления файлов.
+        parallelism (Optional[int]): Максимум одновременно выполняемых операций
+            (по умолчанию - настройка исполнителя).
+        stop_on_error (bool): Не запускать новые операции после первой ошибки.
+    """
+    operations: Tuple[FileTaskData, ...] = ()
+    parallelism: Optional[int] = None
+    stop_on_error: bool = False
+
+    def validate(self) -> None:
+        super().validate()
+        if self.task_type != TaskTypeEnum.FILE_BATCH:
+            raise FileBatchValidationException(message=f"Невалидный тип пакета операций: {self.task_type}")
+        if not self.operations:
+            raise FileBatchValidationException(message="Пакет операций не может быть пустым")
+        if len(self.operations) > MAX_BATCH_OPERATIONS:
+            raise FileBatchValidationException(
+                message=f"Пакет не может содержать больше {MAX_BATCH_OPERATIONS} операций"
+            )
+        for index, operation in enumerate(self.operations):
+            if not isinstance(operation, FileTaskData) or operation.task_type not in BATCH_OPERATION_TYPES:
+                raise FileBatchValidationException(
+                    message=f"operations[{index}]: допустимы только операции "
+                            f"{', '.join(task_type.value for task_type in BATCH_OPERATION_TYPES)}"
+                )
+        if self.parallelism is not None and (
+            not isinstance(self.parallelism, int) or not 1 <= self.parallelism <= MAX_BATCH_PARALLELISM
+        ):
+            raise FileBatchValidationException(
+                message=f"parallelism должен быть от 1 до {MAX_BATCH_PARALLELISM}"
+            )
+
+    def as_generic_type(self) -> dict:
+        base_data = super().as_generic_type()
+        base_data.update({
+            "operations": [operation.as_generic_type() for operation in self.operations],
+            "parallelism": self.parallelism,
+            "stop_on_error": self.stop_on_error
+        })
+        return base_data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FileBatchTaskData":
+        """
+        Собирает пакет из словаря данных задачи, проверяя каждую операцию.
+        Операция собирается классом своего типа (FILE_COPY - FileCopyTaskData с delta и verify).
+        Exception:
+            FileBatchValidationException: Если пакет или одна из операций невалидны.
+        """
+        raw_operations = data.get("operations")
+        if not isinstance(raw_operations, (list, tuple)):
+            raise FileBatchValidationException(message="operations должен быть списком операций")
+        operations = []
+        for index, operation in enumerate(raw_operations):
+            try:
+                operation_type = BATCH_OPERATION_DATA_TYPES.get(TaskTypeEnum(operation.get("task_type")))
+                if operation_type is None:
+                    raise ValueError(
+                        f"допустимы только операции {', '.join(task_type.value for task_type in BATCH_OPERATION_TYPES)}"
+                    )
+                operations.append(operation_type.from_dict(operation))
+            except (DomainException, ValueError, AttributeError) as e:
+                raise FileBatchValidationException(message=f"operations[{index}]: {e}")
+        return cls(
+            task_type=TaskTypeEnum(data.get("task_type")),
+            operations=tuple(operations),
+            parallelism=data.get("parallelism"),
+            stop_on_error=bool(data.get("stop_on_error", False))
+        )
@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from app.domain.exceptions.value_object import FileValidationException
+from app.domain.value_objects.file_task_data import FileTaskData
+from app.domain.value_objects.task_type import TaskTypeEnum
+
+COMPRESSION_FORMATS = ("gzip", "xz")
+MIN_COMPRESS_BLOCK_SIZE = 64 * 1024
+MAX_COMPRESS_BLOCK_SIZE = 64 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class FileCompressTaskData(FileTaskData):
+    """
+    Объект значения для сжатия (FILE_COMPRESS) и распаковки (FILE_DECOMPRESS) файла.
+    Args:
+        source_path (str): Исходный файл.
+        destination_path (Optional[str]): Результат (по умолчанию - с добавленным или отрезанным суффиксом).
+        format (str): Формат: gzip или xz.
+        level (Optional[int]): Уровень сжатия (gzip 1-9, xz 0-9).
+        block_size (int): Размер независимо сжимаемого блока в байтах.
+    """
+    format: str = "gzip"
+    level: Optional[int] = None
+    block_size: int = 4 * 1024 * 1024
+
+    def validate(self) -> None:
+        super().validate()
+        if self.task_type not in (TaskTypeEnum.FILE_COMPRESS, TaskTypeEnum.FILE_DECOMPRESS):
+            raise FileValidationException(message=f"Невалидный тип задачи сжатия: {self.task_type}")
+        if self.format not in COMPRESSION_FORMATS:
+            raise FileValidationException(
+                message=f"Неподдерживаемый формат сжатия: {self.format}. Допустимы: {', '.join(COMPRESSION_FORMATS)}"
+            )
+        min_level = 1 if self.format == "gzip" else 0
+        if self.level is not None and (not isinstance(self.level, int) or not min_level <= self.level <= 9):
+            raise FileValidationException(message=f"Уровень сжатия {self.format} должен быть от {min_level} до 9")
+        if not isinstance(self.block_size, int) or not MIN_COMPRESS_BLOCK_SIZE <= self.block_size <= MAX_COMPRESS_BLOCK_SIZE:
+            raise FileValidationException(
+                message=f"block_size должен быть от {MIN_COMPRESS_BLOCK_SIZE} до {MAX_COMPRESS_BLOCK_SIZE} байт"
+            )
+
+    @property
+    def effective_level(self) -> int:
+        if self.level is not None:
+            return self.level
+        return 6
+
+    def as_generic_type(self) -> dict:
+        base_data = super().as_generic_type()
+        base_data.update({
+            "format": self.format,
+            "level": self.level,
+            "block_size": self.block_size
+        })
+        return base_data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FileCompressTaskData":
+        return cls(
+            task_type=TaskTypeEnum(data.get("task_type")),
+            source_path=data.get("source_path"),
+            destination_path=data.get("destination_path"),
+            format=data.get("format") or "gzip",
+            level=data.get("level"),
+            block_size=data.get("block_size") or 4 * 1024 * 1024
+        )
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+
+from app.domain.exceptions.value_object import FileValidationException
+from app.domain.value_objects.file_task_data import FileTaskData
+from app.domain.value_objects.task_type import TaskTypeEnum
+
+
+@dataclass(frozen=True)
+class FileCopyTaskData(FileTaskData):
+    """
+    Объект значения для копирования файла (FILE_COPY) с параметрами копирования.
+    Args:
+        source_path (str): Исходный файл.
+        destination_path (Optional[str]): Путь назначения.
+        delta (bool): Если файл назначения существует, перезаписать только изменившиеся блоки.
+        verify (bool): После копирования сверить хэши источника и копии.
+    """
+    delta: bool = False
+    verify: bool = False
+
+    def validate(self) -> None:
+        super().validate()
+        if self.task_type != TaskTypeEnum.FILE_COPY:
+            raise FileValidationException(message=f"Невалидный тип копирования файла: {self.task_type}")
+
+    def as_generic_type(self) -> dict:
+        base_data = super().as_generic_type()
+        base_data.update({
+            "delta": self.delta,
+            "verify": self.verify
+        })
+        return base_data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FileCopyTaskData":
+        return cls(
+            task_type=TaskTypeEnum(data.get("task_type")),
+            source_path=data.get("source_path"),
+            destination_path=data.get("destination_path"),
+            delta=bool(data.get("delta", False)),
+            verify=bool(data.get("verify", False))
+        )
@@ -0,0 +1,69 @@
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from app.domain.exceptions.value_object import FileValidationException
+from app.domain.value_objects.file_task_data import FileTaskData
+from app.domain.value_objects.task_type import TaskTypeEnum
+
+
+@dataclass(frozen=True)
+class FileDeletePatternTaskData(FileTaskData):
+    """
+    Объект значения для удаления файлов по условию (FILE_DELETE_PATTERN).
+    Args:
+        source_path (str): Корневой каталог.
+        pattern (str): Glob-шаблон имени файла (с "/" - пути относительно корня).
+        min_age_sec (Optional[int]): Удалять только файлы, измененные не менее min_age_sec секунд назад.
+        min_size (Optional[int]): Минимальный размер файла в байтах.
+        max_size (Optional[int]): Максимальный размер файла в байтах.
+        recursive (bool): Обходить подкаталоги.
+        dry_run (bool): Только подсчитать подходящие файлы, ничего не удаляя.
+    """
+    pattern: str = "*"
+    min_age_sec: Optional[int] = None
+    min_size: Optional[int] = None
+    max_size: Optional[int] = None
+    recursive: bool = True
+    dry_run: bool = False
+
+    def validate(self) -> None:
+        super().validate()
+        if self.task_type != TaskTypeEnum.FILE_DELETE_PATTERN:
+            raise FileValidationException(message=f"Невалидный тип удаления по условию: {self.task_type}")
+        if os.path.realpath(self.source_path) == os.path.sep:
+            raise FileValidationException(message="Удаление по условию от корня файловой системы запрещено")
+        if not isinstance(self.pattern, str) or not self.pattern:
+            raise FileValidationException(message="Шаблон имени не может быть пустым")
+        for name in ("min_age_sec", "min_size", "max_size"):
+            value = getattr(self, name)
+            if value is not None and (not isinstance(value, int) or value < 0):
+                raise FileValidationException(message=f"{name} должен быть неотрицательным целым")
+        if self.min_size is not None and self.max_size is not None and self.min_size > self.max_size:
+            raise FileValidationException(message="min_size не может быть больше max_size")
+
+    def as_generic_type(self) -> dict:
+        base_data = super().as_generic_type()
+        base_data.update({
+            "pattern": self.pattern,
+            "min_age_sec": self.min_age_sec,
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "recursive": self.recursive,
+            "dry_run": self.dry_run
+        })
+        return base_data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FileDeletePatternTaskData":
+        return cls(
+            task_type=TaskTypeEnum(data.get("task_type")),
+            source_path=data.get("source_path"),
+            destination_path=data.get("destination_path"),
+            pattern=data.get("pattern") or "*",
+            min_age_sec=data.get("min_age_sec"),
+            min_size=data.get("min_size"),
+            max_size=data.get("max_size"),
+            recursive=bool(data.get("recursive", True)),
+            dry_run=bool(data.get("dry_run", False))
+        )
@@ -0,0 +1,60 @@
+import os
+from dataclasses import dataclass
+from typing import Tuple
+
+from app.domain.exceptions.value_object import FileValidationException, PathEmptyException, InvalidPathException
+from app.domain.value_objects.task_data import TaskData
+from app.domain.value_objects.task_type import TaskTypeEnum
+
+HASH_ALGORITHMS = ("sha256", "sha512", "blake2b", "blake2s")
+MAX_HASH_FILES = 10000
+
+
+@dataclass(frozen=True)
+class FileHashTaskData(TaskData):
+    """
+    Объект значения для вычисления контрольных сумм файлов (FILE_HASH).
+    Args:
+        paths (Tuple[str, ...]): Абсолютные пути файлов.
+        algorithm (str): Алгоритм хэширования: sha256, sha512, blake2b или blake2s.
+    """
+    paths: Tuple[str, ...] = ()
+    algorithm: str = "sha256"
+
+    def validate(self) -> None:
+        super().validate()
+        if self.task_type != TaskTypeEnum.FILE_HASH:
+            raise FileValidationException(message=f"Невалидный тип задачи хэширования: {self.task_type}")
+        if not self.paths:
+            raise PathEmptyException(message="Список файлов для хэширования не может быть пустым")
+        if len(self.paths) > MAX_HASH_FILES:
+            raise FileValidationException(message=f"Нельзя хэшировать больше {MAX_HASH_FILES} файлов в одной задаче")
+        for index, path in enumerate(self.paths):
+            if not isinstance(path, str) or not path:
+                raise PathEmptyException(message=f"paths[{index}]: путь не может быть пустым")
+            if not os.path.isabs(path):
+                raise InvalidPathException(f"paths[{index}]: путь должен быть абсолютным")
+        if self.algorithm not in HASH_ALGORITHMS:
+            raise FileValidationException(
+                message=f"Неподдерживаемый алгоритм хэширования: {self.algorithm}. "
+                        f"Допустимы: {', '.join(HASH_ALGORITHMS)}"
+            )
+
+    def as_generic_type(self) -> dict:
+        base_data = super().as_generic_type()
+        base_data.update({
+            "paths": list(self.paths),
+            "algorithm": self.algorithm
+        })
+        return base_data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FileHashTaskData":
+        paths = data.get("paths")
+        if not isinstance(paths, (list, tuple)):
+            raise FileValidationException(message="paths должен быть списком путей")
+        return cls(
+            task_type=TaskTypeEnum(data.get("task_type")),
+            paths=tuple(paths),
+            algorithm=data.get("algorithm") or "sha256"
+        )
@@ -0,0 +1,92 @@
+import os
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from app.domain.exceptions.value_object import FileValidationException, PathEmptyException, InvalidPathException
+from app.domain.value_objects.task_data import TaskData
+from app.domain.value_objects.task_type import TaskTypeEnum
+
+MAX_FILE_PARTS = 10000
+
+
+@dataclass(frozen=True)
+class FilePartsTaskData(TaskData):
+    """
+    Объект значения для разделения файла на части (FILE_SPLIT) и склейки частей (FILE_CONCAT).
+    Args:
+        source_paths (Tuple[str, ...]): Для FILE_SPLIT - один исходный файл, для FILE_CONCAT - части по порядку.
+        destination_path (str): Для FILE_SPLIT - префикс частей (<префикс>.000, <префикс>.001, ...),
+            для FILE_CONCAT - склеенный файл.
+        parts (Optional[int]): Количество частей FILE_SPLIT.
+        part_size (Optional[int]): Размер части FILE_SPLIT в байтах (вместо parts).
+    """
+    source_paths: Tuple[str, ...] = ()
+    destination_path: str = ""
+    parts: Optional[int] = None
+    part_size: Optional[int] = None
+
+    def validate(self) -> None:
+        super().validate()
+        if self.task_type not in (TaskTypeEnum.FILE_SPLIT, TaskTypeEnum.FILE_CONCAT):
+            raise FileValidationException(message=f"Невалидный тип задачи с частями файла: {self.task_type}")
+        if not self.source_paths:
+            raise PathEmptyException(message="Source path не может быть пустым")
+        if len(self.source_paths) > MAX_FILE_PARTS:
+            raise FileValidationException(message=f"Нельзя склеить больше {MAX_FILE_PARTS} частей в одной задаче")
+        for index, path in enumerate(self.source_paths):
+            if not isinstance(path, str) or not path:
+                raise PathEmptyException(message=f"source_paths[{index}]: путь не может быть пустым")
+            if not os.path.isabs(path):
+                raise InvalidPathException(f"source_paths[{index}]: путь должен быть абсолютным")
+        if not self.destination_path:
+            raise PathEmptyException(message="Destination path не может быть пустым")
+        if not os.path.isabs(self.destination_path):
+            raise InvalidPathException("Destination path - путь должен быть абсолютным")
+
+        if self.task_type == TaskTypeEnum.FILE_CONCAT:
+            if self.parts is not None or self.part_size is not None:
+                raise FileValidationException(message="parts и part_size задаются только для FILE_SPLIT")
+            return
+        if len(self.source_paths) != 1:
+            raise FileValidationException(message="FILE_SPLIT разделяет ровно один файл")
+        if (self.parts is None) == (self.part_size is None):
+            raise FileValidationException(message="Для FILE_SPLIT нужно задать либо parts, либо part_size")
+        if self.parts is not None and (not isinstance(self.parts, int) or not 1 <= self.parts <= MAX_FILE_PARTS):
+            raise FileValidationException(message=f"parts должен быть от 1 до {MAX_FILE_PARTS}")
+        if self.part_size is not None and (not isinstance(self.part_size, int) or self.part_size < 1):
+            raise FileValidationException(message="part_size должен быть положительным")
+
+    @property
+    def source_path(self) -> str:
+        return self.source_paths[0]
+
+    def as_generic_type(self) -> dict:
+        base_data = super().as_generic_type()
+        if self.task_type == TaskTypeEnum.FILE_SPLIT:
+            base_data.update({
+                "source_path": self.source_path,
+                "destination_path": self.destination_path,
+                "parts": self.parts,
+                "part_size": self.part_size
+            })
+        else:
+            base_data.update({
+                "source_paths": list(self.source_paths),
+                "destination_path": self.destination_path
+            })
+        return base_data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FilePartsTaskData":
+        source_paths = data.get("source_paths")
+        if source_paths is None and data.get("source_path"):
+            source_paths = [data.get("source_path")]
+        if not isinstance(source_paths, (list, tuple)):
+            raise FileValidationException(message="source_paths должен быть списком путей")
+        return cls(
+            task_type=TaskTypeEnum(data.get("task_type")),
+            source_paths=tuple(source_paths),
+            destination_path=data.get("destination_path") or "",
+            parts=data.get("parts"),
+            part_size=data.get("part_size")
+        )
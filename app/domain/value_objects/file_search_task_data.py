@@ -0,0 +1,88 @@
+import os
+import re
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from app.domain.exceptions.value_object import FileValidationException, PathEmptyException, InvalidPathException
+from app.domain.value_objects.task_data import TaskData
+from app.domain.value_objects.task_type import TaskTypeEnum
+
+MAX_SEARCH_PATHS = 10000
+MAX_SEARCH_OFFSETS = 100000
+
+
+@dataclass(frozen=True)
+class FileSearchTaskData(TaskData):
+    """
+    Объект значения для поиска в файлах (FILE_SEARCH).
+    Args:
+        paths (Tuple[str, ...]): Абсолютные пути файлов или каталогов (обходятся рекурсивно).
+        pattern (str): Регулярное выражение или литерал. Регулярное выражение не может содержать перевод строки.
+        regex (bool): pattern - регулярное выражение.
+        ignore_case (bool): Без учета регистра.
+        max_offsets (int): Сколько смещений совпадений вернуть в результате задачи.
+        output_path (Optional[str]): Файл JSON Lines, в который пишутся все совпадения.
+    """
+    paths: Tuple[str, ...] = ()
+    pattern: str = ""
+    regex: bool = False
+    ignore_case: bool = False
+    max_offsets: int = 1000
+    output_path: Optional[str] = None
+
+    def validate(self) -> None:
+        super().validate()
+        if self.task_type != TaskTypeEnum.FILE_SEARCH:
+            raise FileValidationException(message=f"Невалидный тип задачи поиска: {self.task_type}")
+        if not self.paths:
+            raise PathEmptyException(message="Список путей для поиска не может быть пустым")
+        if len(self.paths) > MAX_SEARCH_PATHS:
+            raise FileValidationException(message=f"Нельзя искать больше чем в {MAX_SEARCH_PATHS} путях в одной задаче")
+        for index, path in enumerate(self.paths):
+            if not isinstance(path, str) or not path:
+                raise PathEmptyException(message=f"paths[{index}]: путь не может быть пустым")
+            if not os.path.isabs(path):
+                raise InvalidPathException(f"paths[{index}]: путь должен быть абсолютным")
+        if not isinstance(self.pattern, str) or not self.pattern:
+            raise FileValidationException(message="Шаблон поиска не может быть пустым")
+        if self.regex:
+            if "\n" in self.pattern or "\\n" in self.pattern:
+                raise FileValidationException(
+                    message="Регулярное выражение не может содержать перевод строки: файлы ищутся по участкам строк"
+                )
+            try:
+                re.compile(self.pattern.encode())
+            except re.error as e:
+                raise FileValidationException(message=f"Некорректное регулярное выражение: {str(e)}")
+        if not isinstance(self.max_offsets, int) or not 0 <= self.max_offsets <= MAX_SEARCH_OFFSETS:
+            raise FileValidationException(message=f"max_offsets должен быть от 0 до {MAX_SEARCH_OFFSETS}")
+        if self.output_path is not None and not os.path.isabs(self.output_path):
+            raise InvalidPathException("Output path - путь должен быть абсолютным")
+
+    def as_generic_type(self) -> dict:
+        base_data = super().as_generic_type()
+        base_data.update({
+            "paths": list(self.paths),
+            "pattern": self.pattern,
+            "regex": self.regex,
+            "ignore_case": self.ignore_case,
+            "max_offsets": self.max_offsets,
+            "output_path": self.output_path
+        })
+        return base_data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FileSearchTaskData":
+        paths = data.get("paths")
+        if not isinstance(paths, (list, tuple)):
+            raise FileValidationException(message="paths должен быть списком путей")
+        max_offsets = data.get("max_offsets")
+        return cls(
+            task_type=TaskTypeEnum(data.get("task_type")),
+            paths=tuple(paths),
+            pattern=data.get("pattern") or "",
+            regex=bool(data.get("regex", False)),
+            ignore_case=bool(data.get("ignore_case", False)),
+            max_offsets=1000 if max_offsets is None else max_offsets,
+            output_path=data.get("output_path")
+        )
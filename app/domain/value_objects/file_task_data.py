@@ -33,7 +33,7 @@ class FileTaskData(TaskData):
         normalized_source_path = os.path.abspath(self.source_path)
         if not os.path.isabs(normalized_source_path):
             raise InvalidPathException("Source path - путь должен быть абсолютным")
-        if self.task_type == TaskTypeEnum.FILE_COPY and not self.destination_path:
+        if self.task_type in (TaskTypeEnum.FILE_COPY, TaskTypeEnum.DIR_COPY) and not self.destination_path:
             raise PathEmptyException(message="Destination path не может быть пустым для операции копирования")
         # Валидация для destination_path
         if self.destination_path:
@@ -52,3 +52,11 @@ class FileTaskData(TaskData):
             "destination_path": self.destination_path
         })
         return base_data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FileTaskData":
+        return cls(
+            task_type=TaskTypeEnum(data.get("task_type")),
+            source_path=data.get("source_path"),
+            destination_path=data.get("destination_path")
+        )
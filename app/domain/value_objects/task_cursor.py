@@ -0,0 +1,55 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from app.domain.exceptions.value_object import TaskCursorException
+
+
+@dataclass(frozen=True)
+class TaskCursor:
+    """
+    Объект значения для курсора keyset-пагинации списка задач.
+    Курсор указывает на последнюю отданную задачу в порядке (created_at, id).
+    Args:
+        created_at (datetime): Дата и время создания последней задачи страницы.
+        id (str): Идентификатор последней задачи страницы.
+    """
+    created_at: datetime
+    id: str
+
+    def __post_init__(self):
+        self.validate()
+
+    def validate(self) -> None:
+        if not isinstance(self.created_at, datetime):
+            raise TaskCursorException(message=f"Невалидная дата в курсоре: {self.created_at}")
+        try:
+            UUID(str(self.id))
+        except ValueError:
+            raise TaskCursorException(message=f"Невалидный идентификатор в курсоре: {self.id}")
+
+    def as_generic_type(self) -> str:
+        """Возвращает непрозрачный токен курсора для передачи клиенту."""
+        payload = json.dumps([self.created_at.isoformat(), str(self.id)], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "TaskCursor":
+        """
+        Восстанавливает курсор из токена, полученного от клиента.
+        Args:
+            token (str): Непрозрачный токен курсора.
+        Return:
+            TaskCursor: Курсор пагинации.
+        Exception:
+            TaskCursorException: Если токен поврежден.
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            created_at, task_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            return cls(created_at=datetime.fromisoformat(created_at), id=task_id)
+        except (ValueError, TypeError, binascii.Error):
+            raise TaskCursorException(message=f"Невалидный курсор пагинации: {token}")
@@ -0,0 +1,54 @@
+from typing import Dict, Type
+
+from app.domain.exceptions.value_object import TaskTypeException
+from app.domain.value_objects.dir_archive_task_data import DirArchiveTaskData
+from app.domain.value_objects.dir_sync_task_data import DirSyncTaskData
+from app.domain.value_objects.file_batch_task_data import FileBatchTaskData
+from app.domain.value_objects.file_compress_task_data import FileCompressTaskData
+from app.domain.value_objects.file_copy_task_data import FileCopyTaskData
+from app.domain.value_objects.file_delete_pattern_task_data import FileDeletePatternTaskData
+from app.domain.value_objects.file_hash_task_data import FileHashTaskData
+from app.domain.value_objects.file_parts_task_data import FilePartsTaskData
+from app.domain.value_objects.file_search_task_data import FileSearchTaskData
+from app.domain.value_objects.file_task_data import FileTaskData
+from app.domain.value_objects.task_data import TaskData
+from app.domain.value_objects.task_type import TaskTypeEnum
+
+TASK_DATA_TYPES: Dict[TaskTypeEnum, Type[TaskData]] = {
+    TaskTypeEnum.FILE_CREATE: FileTaskData,
+    TaskTypeEnum.FILE_COPY: FileCopyTaskData,
+    TaskTypeEnum.FILE_DELETE: FileTaskData,
+    TaskTypeEnum.DIR_COPY: FileTaskData,
+    TaskTypeEnum.FILE_BATCH: FileBatchTaskData,
+    TaskTypeEnum.DIR_SYNC: DirSyncTaskData,
+    TaskTypeEnum.FILE_HASH: FileHashTaskData,
+    TaskTypeEnum.FILE_COMPRESS: FileCompressTaskData,
+    TaskTypeEnum.FILE_DECOMPRESS: FileCompressTaskData,
+    TaskTypeEnum.DIR_ARCHIVE: DirArchiveTaskData,
+    TaskTypeEnum.FILE_SEARCH: FileSearchTaskData,
+    TaskTypeEnum.FILE_SPLIT: FilePartsTaskData,
+    TaskTypeEnum.FILE_CONCAT: FilePartsTaskData,
+    TaskTypeEnum.FILE_DELETE_PATTERN: FileDeletePatternTaskData,
+}
+
+
+def build_task_data(data: dict) -> TaskData:
+    """
+    Собирает объект значения данных задачи по её типу.
+    Args:
+        data (dict): Данные задачи с ключом task_type.
+    Return:
+        TaskData: Провалидированные данные задачи.
+    Exception:
+        TaskTypeException: Если тип задачи не поддерживается.
+        ValidationException: Если данные задачи невалидны.
+    """
+    try:
+        task_type = TaskTypeEnum(data.get("task_type"))
+    except ValueError:
+        raise TaskTypeException(message=f"Неподдерживаемый тип задачи: {data.get('task_type')}")
+
+    task_data_type = TASK_DATA_TYPES.get(task_type)
+    if task_data_type is None:
+        raise TaskTypeException(message=f"Неподдерживаемый тип задачи: {task_type}")
+    return task_data_type.from_dict(data)
@@ -4,4 +4,15 @@ class TaskTypeEnum(str, Enum):
     FILE_CREATE = "FILE_CREATE"
     FILE_COPY = "FILE_COPY"
     FILE_DELETE = "FILE_DELETE"
+    DIR_COPY = "DIR_COPY"
+    FILE_BATCH = "FILE_BATCH"
+    DIR_SYNC = "DIR_SYNC"
+    FILE_HASH = "FILE_HASH"
+    FILE_COMPRESS = "FILE_COMPRESS"
+    FILE_DECOMPRESS = "FILE_DECOMPRESS"
+    DIR_ARCHIVE = "DIR_ARCHIVE"
+    FILE_SEARCH = "FILE_SEARCH"
+    FILE_SPLIT = "FILE_SPLIT"
+    FILE_CONCAT = "FILE_CONCAT"
+    FILE_DELETE_PATTERN = "FILE_DELETE_PATTERN"
 
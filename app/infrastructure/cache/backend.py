@@ -0,0 +1,26 @@
+from typing import Optional, Tuple
+
+from fastapi_cache.backends.redis import RedisBackend
+
+from app.infrastructure.cache.metrics import CACHE_HITS, CACHE_MISSES
+
+
+class InstrumentedRedisBackend(RedisBackend):
+    """
+    Redis-бэкенд fastapi-cache, считающий попадания и промахи по маршрутам.
+    Маршрут определяется по пространству имен ключа: <prefix>:<namespace>:...
+    """
+
+    async def get_with_ttl(self, key: str) -> Tuple[int, Optional[bytes]]:
+        ttl, cached = await super().get_with_ttl(key)
+        route = self._route(key)
+        if cached is None:
+            CACHE_MISSES.labels(route=route).inc()
+        else:
+            CACHE_HITS.labels(route=route).inc()
+        return ttl, cached
+
+    @staticmethod
+    def _route(key: str) -> str:
+        parts = key.split(":", 2)
+        return parts[1] if len(parts) > 2 else "unknown"
@@ -0,0 +1,17 @@
+from prometheus_client import Counter
+
+CACHE_HITS = Counter(
+    "task_cache_hits_total",
+    "Количество попаданий в кэш эндпоинтов задач",
+    ["route"],
+)
+CACHE_MISSES = Counter(
+    "task_cache_misses_total",
+    "Количество промахов кэша эндпоинтов задач",
+    ["route"],
+)
+CACHE_EVICTIONS = Counter(
+    "task_cache_evictions_total",
+    "Количество инвалидаций кэша эндпоинтов задач",
+    ["route"],
+)
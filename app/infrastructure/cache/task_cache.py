@@ -0,0 +1,193 @@
+import hashlib
+import json
+import logging
+import uuid
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import redis.asyncio as redis
+from pydantic import BaseModel
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.config import settings
+from app.infrastructure.cache.metrics import CACHE_EVICTIONS
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "fastapi-cache"
+TASK_STATUS_NAMESPACE = "task-status"
+TASK_LIST_NAMESPACE = "task-list"
+TASK_LIST_GENERATION_KEY = f"{CACHE_PREFIX}:{TASK_LIST_NAMESPACE}:generation"
+
+_redis_client: Optional[redis.Redis] = None
+_backend_redis_client: Optional[redis.Redis] = None
+
+
+def get_cache_redis() -> redis.Redis:
+    """
+    Возвращает клиент Redis для поколения списка задач и инвалидации кэша из API и воркеров.
+    Ответы декодируются в строки.
+    Return:
+        redis.Redis: Асинхронный клиент Redis.
+    """
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.from_url(settings.REDIS_URL, encoding="utf-8", decode_responses=True)
+    return _redis_client
+
+
+def get_cache_backend_redis() -> redis.Redis:
+    """
+    Возвращает клиент Redis для бэкенда fastapi-cache. Закэшированные ответы хранятся как байты
+    JSON, и JsonCoder декодирует их сам, поэтому ответы этого клиента не декодируются.
+    Return:
+        redis.Redis: Асинхронный клиент Redis.
+    """
+    global _backend_redis_client
+    if _backend_redis_client is None:
+        _backend_redis_client = redis.from_url(settings.REDIS_URL, decode_responses=False)
+    return _backend_redis_client
+
+
+def task_status_key(task_id: str) -> str:
+    """Ключ кэша ответа GET /tasks/id/{task_id}."""
+    return f"{CACHE_PREFIX}:{TASK_STATUS_NAMESPACE}:{task_id}"
+
+
+def normalize_cache_value(value: Any) -> Any:
+    """
+    Приводит значение параметра запроса к канонической форме для ключа кэша:
+    модели раскрываются без пустых полей, словари сортируются по ключам,
+    datetime переводится в UTC ISO-формат, перечисления - в их значения.
+    """
+    if isinstance(value, BaseModel):
+        return normalize_cache_value(value.model_dump(exclude_none=True))
+    if isinstance(value, dict):
+        return {str(key): normalize_cache_value(value[key]) for key in sorted(value)}
+    if isinstance(value, (list, tuple)):
+        return [normalize_cache_value(item) for item in value]
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def build_query_key(namespace: str, path: str, params: Dict[str, Any]) -> str:
+    """
+    Строит детерминированный ключ кэша из пути и нормализованных параметров запроса.
+    Args:
+        namespace (str): Пространство имен ключа.
+        path (str): Путь запроса.
+        params (Dict[str, Any]): Параметры запроса.
+    Return:
+        str: Ключ кэша.
+    """
+    payload = json.dumps(
+        {"path": path, "params": normalize_cache_value(params)},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return f"{namespace}:{hashlib.md5(payload.encode()).hexdigest()}"  # noqa: S324
+
+
+def task_status_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> str:
+    """Строит ключ кэша статуса задачи только по её идентификатору."""
+    return task_status_key(str(kwargs["task_id"]))
+
+
+async def task_list_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> str:
+    """
+    Строит ключ кэша списка задач из текущего поколения списка и нормализованных фильтров.
+    Внедренные зависимости (репозиторий, сессия) в ключ не попадают.
+    Любая запись в задачи увеличивает поколение, после чего старые ключи
+    перестают читаться и истекают по TTL. Если поколение прочитать не удалось, возвращается
+    одноразовый ключ: запрос выполняется мимо кэша, а не завершается ошибкой.
+    """
+    try:
+        generation = await get_cache_redis().get(TASK_LIST_GENERATION_KEY) or 0
+    except Exception:
+        logger.warning("Не удалось прочитать поколение кэша списка задач", exc_info=True)
+        return f"{CACHE_PREFIX}:{TASK_LIST_NAMESPACE}:uncached:{uuid.uuid4().hex}"
+    return build_query_key(
+        f"{CACHE_PREFIX}:{TASK_LIST_NAMESPACE}:{generation}",
+        request.url.path if request else func.__name__,
+        {"filters": kwargs.get("filters")},
+    )
+
+
+async def invalidate_task_list() -> None:
+    """Инвалидирует все закэшированные страницы списка задач."""
+    try:
+        await get_cache_redis().incr(TASK_LIST_GENERATION_KEY)
+        CACHE_EVICTIONS.labels(route=TASK_LIST_NAMESPACE).inc()
+    except Exception:
+        logger.warning("Не удалось инвалидировать кэш списка задач", exc_info=True)
+
+
+async def invalidate_task(task_id: str) -> None:
+    """
+    Инвалидирует кэш статуса задачи и страницы списка задач.
+    Args:
+        task_id (str): Идентификатор измененной задачи.
+    """
+    try:
+        async with get_cache_redis().pipeline(transaction=False) as pipe:
+            deleted, _ = await pipe.delete(task_status_key(str(task_id))).incr(TASK_LIST_GENERATION_KEY).execute()
+        if deleted:
+            CACHE_EVICTIONS.labels(route=TASK_STATUS_NAMESPACE).inc()
+        CACHE_EVICTIONS.labels(route=TASK_LIST_NAMESPACE).inc()
+    except Exception:
+        logger.warning(f"Не удалось инвалидировать кэш задачи {task_id}", exc_info=True)
+
+
+async def invalidate_tasks(task_ids: List[str]) -> None:
+    """
+    Инвалидирует кэш статусов пакета задач и страницы списка задач одним обращением к Redis.
+    Args:
+        task_ids (List[str]): Идентификаторы измененных задач.
+    """
+    if not task_ids:
+        return
+    try:
+        async with get_cache_redis().pipeline(transaction=False) as pipe:
+            deleted, _ = await pipe.delete(
+                *(task_status_key(str(task_id)) for task_id in task_ids)
+            ).incr(TASK_LIST_GENERATION_KEY).execute()
+        if deleted:
+            CACHE_EVICTIONS.labels(route=TASK_STATUS_NAMESPACE).inc(deleted)
+        CACHE_EVICTIONS.labels(route=TASK_LIST_NAMESPACE).inc()
+    except Exception:
+        logger.warning("Не удалось инвалидировать кэш пакета задач", exc_info=True)
+
+
+async def close_cache_redis() -> None:
+    """Закрывает клиенты Redis (при остановке процесса, которому они принадлежат)."""
+    global _redis_client, _backend_redis_client
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        _redis_client = None
+    if _backend_redis_client is not None:
+        await _backend_redis_client.aclose()
+        _backend_redis_client = None
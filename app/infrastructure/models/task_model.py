@@ -1,5 +1,5 @@
-from sqlalchemy import Column, String, Enum, DateTime, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Enum, DateTime, Index, Computed
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from datetime import datetime
 import uuid
 
@@ -9,11 +9,24 @@ from app.domain.value_objects.task_type import TaskTypeEnum
 
 class TaskModel(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # keyset-пагинация списка задач по (created_at, id)
+        Index("ix_tasks_created_at_id", "created_at", "id"),
+        # фильтры GetTaskListRequest + keyset-пагинация
+        Index("ix_tasks_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_tasks_task_type_created_at_id", "task_type", "created_at", "id"),
+        Index("ix_tasks_status_task_type_created_at_id", "status", "task_type", "created_at", "id"),
+        Index("ix_tasks_updated_at", "updated_at"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, nullable=False)
-    task_data = Column(JSON, nullable=False)
+    task_data = Column(JSONB, nullable=False)
+    # вычисляемая колонка для индексируемого фильтра по типу задачи
+    task_type = Column(String, Computed("task_data ->> 'task_type'", persisted=True))
     status = Column(Enum(TaskStatusEnum), nullable=False, default=TaskStatusEnum.PENDING)
-    result = Column(JSON, nullable=True)
+    result = Column(JSONB, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
\ No newline at end of file
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # время захвата или последнего продления аренды задачи исполнителем очереди PostgreSQL
+    claimed_at = Column(DateTime, nullable=True)
@@ -1,14 +1,15 @@
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional, List
-from sqlalchemy import select
+from datetime import datetime, timedelta
+from typing import Any, Optional, List, AsyncIterator, Tuple
+from uuid import UUID
+from sqlalchemy import select, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import update, delete,and_
+from sqlalchemy import update, delete,and_, tuple_, insert, bindparam
 
 from app.domain.entities.task import Task
-from app.domain.exceptions.value_object import TaskTypeException
 from app.domain.repositories.task_repository import TaskRepository
-from app.domain.value_objects.file_task_data import FileTaskData
+from app.domain.value_objects.task_cursor import TaskCursor
+from app.domain.value_objects.task_data_factory import build_task_data
 from app.domain.value_objects.task_name import TaskName
 from app.domain.value_objects.task_result import TaskResult
 from app.domain.value_objects.task_status import TaskStatusEnum, TaskStatus
@@ -22,10 +23,11 @@ class PostgresTaskRepository(TaskRepository):
     Репозиторий задач для работы с PostgreSQL.
     """
     session: AsyncSession
+    stream_batch_size: int = 1000
 
     async def create_task(self, task: Task) -> Task:
         """
-        Создает новую задачу в базе данных.
+        Создает новую задачу в базе данных одним INSERT ... RETURNING.
 
         Args:
             task (Task): Объект задачи.
@@ -33,19 +35,35 @@ class PostgresTaskRepository(TaskRepository):
         Return:
             Task: Созданная задача.
         """
-        task_model = TaskModel(
-            id=task.id,
-            name=task.name.as_generic_type(),
-            task_data=task.task_data.as_generic_type(),
-            status=task.status.as_generic_type(),
-            result=task.result.as_generic_type(),
-            created_at=task.created_at,
-            updated_at=task.updated_at,
+        result = await self.session.execute(
+            insert(TaskModel)
+            .values(self._map_to_row(task))
+            .returning(TaskModel)
         )
-        self.session.add(task_model)
+        task_model = result.scalar_one()
         await self.session.commit()
-        await self.session.refresh(task_model)
-        return await self.get_task_by_id(task_model.id)
+        return self._map_to_domain(task_model)
+
+    async def create_tasks(self, tasks: List[Task]) -> List[Task]:
+        """
+        Создает пакет задач одним многострочным INSERT ... RETURNING.
+
+        Args:
+            tasks (List[Task]): Объекты задач.
+
+        Return:
+            List[Task]: Созданные задачи в порядке входного списка.
+        """
+        if not tasks:
+            return []
+        result = await self.session.execute(
+            insert(TaskModel)
+            .values([self._map_to_row(task) for task in tasks])
+            .returning(TaskModel)
+        )
+        created = {str(task_model.id): self._map_to_domain(task_model) for task_model in result.scalars().all()}
+        await self.session.commit()
+        return [created[str(task.id)] for task in tasks]
 
     async def get_task_by_id(self, task_id: str) -> Optional[Task]:
         """
@@ -73,10 +91,14 @@ class PostgresTaskRepository(TaskRepository):
         updated_at_from: Optional[datetime] = None,
         updated_at_to: Optional[datetime] = None,
         status: Optional[TaskStatusEnum] = None,
-        task_type: Optional[TaskTypeEnum] = None
+        task_type: Optional[TaskTypeEnum] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[TaskCursor] = None
     ) -> List[Task]:
         """
         Получает список задач с возможными фильтрами.
+        Пагинация - keyset по (created_at, id): страница читается по индексу
+        ix_tasks_created_at_id, поэтому стоимость запроса не зависит от глубины листания.
 
         Args:
             name (Optional[TaskName]): Фильтр по имени.
@@ -86,44 +108,99 @@ class PostgresTaskRepository(TaskRepository):
             updated_at_to (Optional[datetime]): Фильтр по дате обновления (до).
             status (Optional[TaskStatusEnum]): Фильтр по статусу.
             task_type (Optional[TaskTypeEnum]): Фильтр по типу задачи.
+            limit (Optional[int]): Максимальное количество задач.
+            cursor (Optional[TaskCursor]): Курсор - вернуть задачи строго после него.
 
         Return:
             List[Task]: Список найденных задач.
         """
         query = select(TaskModel)
-        filters = []
-        if name:
-            filters.append(TaskModel.name.ilike(f"%{name}%"))
-        if status:
-            filters.append(TaskModel.status == status)
-        if task_type:
-            filters.append(TaskModel.task_data["task_type"].as_string() == task_type.value)
-        if created_at_from:
-            filters.append(TaskModel.created_at >= created_at_from)
-        if created_at_to:
-            filters.append(TaskModel.created_at <= created_at_to)
-        if updated_at_from:
-            filters.append(TaskModel.updated_at >= updated_at_from)
-        if updated_at_to:
-            filters.append(TaskModel.updated_at <= updated_at_to)
+        filters = self._build_filters(
+            name=name,
+            created_at_from=created_at_from,
+            created_at_to=created_at_to,
+            updated_at_from=updated_at_from,
+            updated_at_to=updated_at_to,
+            status=status,
+            task_type=task_type
+        )
+        if cursor:
+            filters.append(
+                tuple_(TaskModel.created_at, TaskModel.id) > tuple_(cursor.created_at, UUID(cursor.id))
+            )
         if filters:
             query = query.filter(and_(*filters))
+        query = query.order_by(TaskModel.created_at, TaskModel.id)
+        if limit:
+            query = query.limit(limit)
 
         result = await self.session.execute(query)
         task_models = result.scalars().all()
         return [self._map_to_domain(task) for task in task_models]
 
-    async def update_task(self, task: Task) -> Task:
+    async def stream_tasks(
+        self,
+        name: Optional[TaskName] = None,
+        created_at_from:Optional[datetime]=None,
+        created_at_to:Optional[datetime]=None,
+        updated_at_from: Optional[datetime] = None,
+        updated_at_to: Optional[datetime] = None,
+        status: Optional[TaskStatusEnum] = None,
+        task_type: Optional[TaskTypeEnum] = None
+    ) -> AsyncIterator[dict]:
         """
-         Обновляет информацию о задаче.
+        Построчно читает задачи через серверный курсор, не загружая выборку в память.
+        Строки не превращаются в ORM-объекты и сущности Task - возвращаются значения колонок.
+
+        Args:
+            name (Optional[TaskName]): Фильтр по имени.
+            created_at_from (Optional[datetime]): Фильтр по дате создания (от).
+            created_at_to (Optional[datetime]): Фильтр по дате создания (до).
+            updated_at_from (Optional[datetime]): Фильтр по дате обновления (от).
+            updated_at_to (Optional[datetime]): Фильтр по дате обновления (до).
+            status (Optional[TaskStatusEnum]): Фильтр по статусу.
+            task_type (Optional[TaskTypeEnum]): Фильтр по типу задачи.
+
+        Return:
+            AsyncIterator[dict]: Данные задач в порядке (created_at, id).
+        """
+        query = select(*TaskModel.__table__.columns)
+        filters = self._build_filters(
+            name=name,
+            created_at_from=created_at_from,
+            created_at_to=created_at_to,
+            updated_at_from=updated_at_from,
+            updated_at_to=updated_at_to,
+            status=status,
+            task_type=task_type
+        )
+        if filters:
+            query = query.filter(and_(*filters))
+        query = query.order_by(TaskModel.created_at, TaskModel.id).execution_options(yield_per=self.stream_batch_size)
+
+        result = await self.session.stream(query)
+        async for row in result.mappings():
+            yield {
+                "id": str(row["id"]),
+                "name": row["name"],
+                "task_data": row["task_data"],
+                "status": row["status"].value,
+                "result": row["result"],
+                "created_at": row["created_at"],
+                "updated_at": row["updated_at"],
+            }
+
+    async def update_task(self, task: Task) -> Optional[Task]:
+        """
+         Обновляет информацию о задаче одним UPDATE ... RETURNING.
 
          Args:
              task (Task): Обновленный объект задачи.
 
          Return:
-             Task: Обновленный объект задачи.
+             Optional[Task]: Обновленный объект задачи или None, если задача не найдена.
          """
-        await self.session.execute(
+        result = await self.session.execute(
             update(TaskModel)
             .where(TaskModel.id == task.id)
             .values(
@@ -133,9 +210,218 @@ class PostgresTaskRepository(TaskRepository):
                 updated_at=task.updated_at,
                 result=task.result
             )
+            .returning(TaskModel)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        task_model = result.scalar_one_or_none()
+        await self.session.commit()
+        return self._map_to_domain(task_model) if task_model else None
+
+    async def claim_task(self, task_id: str) -> Optional[Task]:
+        """
+        Захватывает задачу одним UPDATE ... WHERE status = 'PENDING' RETURNING.
+        Из нескольких конкурентных вызовов (воркеры, отмена) успешен ровно один.
+
+        Args:
+            task_id (str): Идентификатор задачи.
+
+        Return:
+            Optional[Task]: Задача в статусе IN_PROGRESS или None, если захват не удался.
+        """
+        return await self._transition(
+            task_id,
+            from_status=TaskStatusEnum.PENDING,
+            status=TaskStatusEnum.IN_PROGRESS,
+            claimed_at=self._db_now()
+        )
+
+    async def cancel_task(self, task_id: str) -> Optional[Task]:
+        """
+        Отменяет задачу одним UPDATE ... WHERE status = 'PENDING' RETURNING,
+        поэтому отмена не может перезаписать задачу, которую успел захватить исполнитель.
+
+        Args:
+            task_id (str): Идентификатор задачи.
+
+        Return:
+            Optional[Task]: Задача в статусе CANCELED или None, если отмена не удалась.
+        """
+        return await self._transition(
+            task_id,
+            from_status=TaskStatusEnum.PENDING,
+            status=TaskStatusEnum.CANCELED
+        )
+
+    async def complete_task(self, task_id: str, status: TaskStatusEnum, result: Any) -> Optional[Task]:
+        """
+        Завершает задачу одним UPDATE ... WHERE status = 'IN_PROGRESS' RETURNING.
+
+        Args:
+            task_id (str): Идентификатор задачи.
+            status (TaskStatusEnum): Итоговый статус.
+            result (Any): Результат выполнения или описание ошибки.
+
+        Return:
+            Optional[Task]: Завершенная задача или None, если задача не выполнялась.
+        """
+        return await self._transition(
+            task_id,
+            from_status=TaskStatusEnum.IN_PROGRESS,
+            status=status,
+            result=result
+        )
+
+    async def save_checkpoint(self, task_id: str, checkpoint: Optional[dict]) -> bool:
+        """
+        Записывает контрольную точку в результат задачи, если она всё ещё выполняется.
+
+        Args:
+            task_id (str): Идентификатор задачи.
+            checkpoint (Optional[dict]): Контрольная точка или None для сброса.
+
+        Return:
+            bool: True, если точка сохранена.
+        """
+        task = await self._transition(
+            task_id,
+            from_status=TaskStatusEnum.IN_PROGRESS,
+            result={"checkpoint": checkpoint} if checkpoint is not None else None
+        )
+        return task is not None
+
+    async def save_progress(self, task_id: str, progress: dict) -> bool:
+        """
+        Записывает сведения о ходе выполнения в результат задачи, если она всё ещё выполняется.
+
+        Args:
+            task_id (str): Идентификатор задачи.
+            progress (dict): Сведения о ходе выполнения.
+
+        Return:
+            bool: True, если сведения сохранены.
+        """
+        task = await self._transition(task_id, from_status=TaskStatusEnum.IN_PROGRESS, result={"progress": progress})
+        return task is not None
+
+    async def claim_tasks(self, limit: int, lease_seconds: float) -> List[Task]:
+        """
+        Захватывает пакет задач одним запросом:
+        UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED LIMIT n) RETURNING.
+        Конкурентные исполнители получают непересекающиеся пакеты и не ждут друг друга.
+        Кроме PENDING захватываются задачи IN_PROGRESS, чья аренда (claimed_at) не продлевалась
+        дольше lease_seconds: их исполнитель упал, не завершив пакет. Время берется из часов
+        базы данных, поэтому расхождение часов исполнителей не влияет на аренду.
+
+        Args:
+            limit (int): Максимальный размер пакета.
+            lease_seconds (float): Срок аренды.
+
+        Return:
+            List[Task]: Захваченные задачи в статусе IN_PROGRESS.
+        """
+        now = self._db_now()
+        pending = (
+            select(TaskModel.id)
+            .where(or_(
+                TaskModel.status == TaskStatusEnum.PENDING,
+                and_(
+                    TaskModel.status == TaskStatusEnum.IN_PROGRESS,
+                    TaskModel.claimed_at < now - timedelta(seconds=lease_seconds)
+                )
+            ))
+            .order_by(TaskModel.created_at, TaskModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            update(TaskModel)
+            .where(TaskModel.id.in_(pending))
+            .values(status=TaskStatusEnum.IN_PROGRESS, claimed_at=now, updated_at=datetime.utcnow())
+            .returning(TaskModel)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        task_models = result.scalars().all()
+        await self.session.commit()
+        return [self._map_to_domain(task_model) for task_model in task_models]
+
+    async def renew_claims(self, task_ids: List[str]) -> None:
+        """
+        Продлевает аренду выполняющихся задач одним UPDATE ... WHERE status = 'IN_PROGRESS'.
+
+        Args:
+            task_ids (List[str]): Идентификаторы задач.
+        """
+        if not task_ids:
+            return
+        await self.session.execute(
+            update(TaskModel)
+            .where(
+                TaskModel.id.in_([UUID(str(task_id)) for task_id in task_ids]),
+                TaskModel.status == TaskStatusEnum.IN_PROGRESS
+            )
+            # updated_at не меняется: продление аренды не является изменением задачи
+            .values(claimed_at=self._db_now(), updated_at=TaskModel.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+
+    @staticmethod
+    def _db_now():
+        """Текущее время базы данных в UTC без часового пояса (как datetime.utcnow в колонках задач)."""
+        return func.timezone("utc", func.now())
+
+    async def complete_tasks(self, results: List[Tuple[str, TaskStatusEnum, Any]]) -> None:
+        """
+        Завершает пакет задач одним executemany-UPDATE ... WHERE status = 'IN_PROGRESS'.
+
+        Args:
+            results (List[Tuple[str, TaskStatusEnum, Any]]): Тройки (идентификатор, итоговый статус, результат).
+        """
+        if not results:
+            return
+        tasks_table = TaskModel.__table__
+        updated_at = datetime.utcnow()
+        await self.session.execute(
+            update(tasks_table)
+            .where(
+                tasks_table.c.id == bindparam("b_id"),
+                tasks_table.c.status == TaskStatusEnum.IN_PROGRESS
+            )
+            .values(
+                status=bindparam("b_status"),
+                result=bindparam("b_result"),
+                updated_at=bindparam("b_updated_at")
+            ),
+            [
+                {"b_id": UUID(str(task_id)), "b_status": status, "b_result": result, "b_updated_at": updated_at}
+                for task_id, status, result in results
+            ]
         )
         await self.session.commit()
-        return await self.get_task_by_id(task.id)
+
+    async def _transition(self, task_id: str, from_status: TaskStatusEnum, **values) -> Optional[Task]:
+        """
+        Условно меняет колонки задачи, если она находится в статусе from_status.
+
+        Args:
+            task_id (str): Идентификатор задачи.
+            from_status (TaskStatusEnum): Ожидаемый текущий статус.
+            **values: Новые значения колонок.
+
+        Return:
+            Optional[Task]: Обновленная задача или None, если условие не выполнено.
+        """
+        result = await self.session.execute(
+            update(TaskModel)
+            .where(TaskModel.id == task_id, TaskModel.status == from_status)
+            .values(updated_at=datetime.utcnow(), **values)
+            .returning(TaskModel)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        task_model = result.scalar_one_or_none()
+        await self.session.commit()
+        return self._map_to_domain(task_model) if task_model else None
 
     async def delete_task(self, task_id: str) -> None:
         """
@@ -150,6 +436,59 @@ class PostgresTaskRepository(TaskRepository):
         await self.session.execute(delete(TaskModel).where(TaskModel.id == task_id))
         await self.session.commit()
 
+    def _build_filters(
+        self,
+        name: Optional[TaskName] = None,
+        created_at_from:Optional[datetime]=None,
+        created_at_to:Optional[datetime]=None,
+        updated_at_from: Optional[datetime] = None,
+        updated_at_to: Optional[datetime] = None,
+        status: Optional[TaskStatusEnum] = None,
+        task_type: Optional[TaskTypeEnum] = None
+    ) -> list:
+        """
+        Собирает условия WHERE для фильтров списка задач.
+
+        Return:
+            list: Условия для and_().
+        """
+        filters = []
+        if name:
+            filters.append(TaskModel.name.ilike(f"%{name}%"))
+        if status:
+            filters.append(TaskModel.status == status)
+        if task_type:
+            filters.append(TaskModel.task_type == task_type.value)
+        if created_at_from:
+            filters.append(TaskModel.created_at >= created_at_from)
+        if created_at_to:
+            filters.append(TaskModel.created_at <= created_at_to)
+        if updated_at_from:
+            filters.append(TaskModel.updated_at >= updated_at_from)
+        if updated_at_to:
+            filters.append(TaskModel.updated_at <= updated_at_to)
+        return filters
+
+    def _map_to_row(self, task: Task) -> dict:
+        """
+        Преобразует объект доменной модели в значения колонок таблицы tasks.
+
+        Args:
+            task (Task): Объект доменной модели.
+
+        Return:
+            dict: Значения колонок для INSERT.
+        """
+        return {
+            "id": UUID(str(task.id)),
+            "name": task.name.as_generic_type(),
+            "task_data": task.task_data.as_generic_type(),
+            "status": task.status.as_generic_type(),
+            "result": task.result.as_generic_type(),
+            "created_at": task.created_at,
+            "updated_at": task.updated_at,
+        }
+
     def _map_to_domain(self, task_model: TaskModel) -> Task:
         """
         Преобразует объект базы данных в объект доменной модели.
@@ -163,15 +502,7 @@ class PostgresTaskRepository(TaskRepository):
         Exception:
             TaskTypeException: Если тип задачи не поддерживается.
         """
-        task_type_enum = TaskTypeEnum(task_model.task_data['task_type'])
-        if task_type_enum in [TaskTypeEnum.FILE_CREATE, TaskTypeEnum.FILE_COPY, TaskTypeEnum.FILE_DELETE]:
-            task_data = FileTaskData(
-                task_type=task_type_enum,
-                source_path=task_model.task_data['source_path'],
-                destination_path=task_model.task_data.get('destination_path')
-            ).as_generic_type()
-        else:
-            raise TaskTypeException(message=f"Неподдерживаемый тип задачи: {task_type_enum}")
+        task_data = build_task_data(task_model.task_data).as_generic_type()
 
         return Task(
             id=str(task_model.id),
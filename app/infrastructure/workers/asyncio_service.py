@@ -1,10 +1,19 @@
 import asyncio
 from typing import Any, Coroutine
 
-def run_async_function(coro: Coroutine[Any, Any, Any]) -> Any:
+from app.infrastructure.workers.bootstrap import get_worker_loop
+
 
-    loop = asyncio.get_event_loop()
+def run_async_function(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Выполняет корутину в долгоживущем event loop процесса воркера.
+    Args:
+        coro (Coroutine): Корутина задачи.
+    Return:
+        Any: Результат корутины.
+    """
+    loop = get_worker_loop()
     if loop.is_running():
-        return asyncio.ensure_future(coro)
+        return asyncio.ensure_future(coro, loop=loop)
     else:
-        return loop.run_until_complete(coro)
\ No newline at end of file
+        return loop.run_until_complete(coro)
@@ -0,0 +1,84 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from celery.signals import worker_process_init, worker_process_shutdown
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.database import create_db_engine
+from app.infrastructure.cache.task_cache import close_cache_redis
+
+logger = logging.getLogger(__name__)
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_engine: Optional[AsyncEngine] = None
+_session_maker: Optional[sessionmaker] = None
+_file_executor: Optional[ThreadPoolExecutor] = None
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs) -> None:
+    """
+    Создает для дочернего процесса Celery собственный долгоживущий event loop
+    и движок БД. Соединения asyncpg привязаны к loop, в котором открыты,
+    поэтому и пул, и все задачи процесса работают в одном loop.
+    Там же создается ограниченный пул потоков для файлового ввода-вывода.
+    """
+    global _loop, _engine, _session_maker, _file_executor
+    _loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_loop)
+    _engine = create_db_engine(
+        pool_size=settings.WORKER_DB_POOL_SIZE,
+        max_overflow=settings.WORKER_DB_MAX_OVERFLOW,
+    )
+    _session_maker = sessionmaker(_engine, class_=AsyncSession, expire_on_commit=False)
+    _file_executor = ThreadPoolExecutor(
+        max_workers=settings.FILE_IO_THREADS,
+        thread_name_prefix="file-io",
+    )
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(**kwargs) -> None:
+    """Закрывает соединения с БД и Redis, пул файлового ввода-вывода и останавливает event loop процесса."""
+    global _loop, _engine, _session_maker, _file_executor
+    if _loop is None:
+        return
+    try:
+        if _engine is not None:
+            _loop.run_until_complete(_engine.dispose())
+        _loop.run_until_complete(close_cache_redis())
+    except Exception:
+        logger.warning("Ошибка при остановке процесса воркера", exc_info=True)
+    finally:
+        if _file_executor is not None:
+            _file_executor.shutdown(wait=True)
+        _loop.close()
+        _loop, _engine, _session_maker, _file_executor = None, None, None, None
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """
+    Возвращает event loop процесса воркера.
+    Для пулов без сигнала worker_process_init (solo, eager-режим) инициализирует его лениво.
+    """
+    if _loop is None or _loop.is_closed():
+        init_worker_process()
+    return _loop
+
+
+def get_worker_session_maker() -> sessionmaker:
+    """Возвращает фабрику сессий, привязанную к движку процесса воркера."""
+    if _session_maker is None:
+        init_worker_process()
+    return _session_maker
+
+
+def get_worker_file_executor() -> ThreadPoolExecutor:
+    """Возвращает пул потоков процесса воркера для блокирующих файловых операций."""
+    if _file_executor is None:
+        init_worker_process()
+    return _file_executor
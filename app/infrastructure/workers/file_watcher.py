@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import os
+import signal
+import time
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+from watchfiles import Change, awatch
+
+from app.application.services.file_watch import PendingEvents, WatchRule, load_watch_rules
+from app.application.use_cases.create_watch_tasks import CreateWatchTasksUseCase
+from app.core.config import settings
+from app.core.database import create_db_engine
+from app.infrastructure.cache.task_cache import invalidate_task_list, close_cache_redis
+from app.infrastructure.repositories.postgres_task_repository import PostgresTaskRepository
+from app.infrastructure.workers.tasks import enqueue_task_execution_batch
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FileWatcher:
+    """
+    Наблюдатель за каталогами правил: превращает события создания и изменения файлов в задачи.
+    watchfiles объединяет события за debounce_ms, затем PendingEvents ждет, пока файл не перестанет
+    меняться settle секунд, и все готовые файлы сохраняются пакетами одним create_tasks на пакет.
+    """
+    session_maker: sessionmaker
+    rules: List[WatchRule]
+    debounce_ms: int = settings.WATCH_DEBOUNCE_MS
+    settle: float = settings.WATCH_SETTLE_SECONDS
+    batch_size: int = settings.WATCH_BATCH_SIZE
+    stopping: asyncio.Event = field(default_factory=asyncio.Event)
+
+    async def flush(self, events: List[Tuple[str, str]]) -> int:
+        """
+        Создает задачи для готовых событий и ставит их на выполнение.
+        Return:
+            int: Количество созданных задач.
+        """
+        async with self.session_maker() as session:
+            use_case = CreateWatchTasksUseCase(PostgresTaskRepository(session), self.rules, self.batch_size)
+            tasks = await use_case.execute(events)
+        if tasks:
+            enqueue_task_execution_batch([task.id for task in tasks])
+            await invalidate_task_list()
+            logger.info(f"Наблюдатель создал задач: {len(tasks)}")
+        return len(tasks)
+
+    async def run_forever(self) -> None:
+        """Наблюдает за каталогами, пока не получен сигнал остановки."""
+        pending = PendingEvents(self.settle)
+        paths = sorted({rule.path for rule in self.rules})
+        async for changes in awatch(
+            *paths,
+            watch_filter=None,
+            debounce=self.debounce_ms,
+            rust_timeout=max(int(self.settle * 1000), self.debounce_ms),
+            yield_on_timeout=True,
+            stop_event=self.stopping,
+        ):
+            now = time.monotonic()
+            for change, path in sorted(changes, key=self._change_order):
+                pending.add(change.name, path, now)
+            # Каталоги и уже исчезнувшие пути задач не порождают
+            ready = [(event, path) for event, path in pending.pop_ready(now) if os.path.isfile(path)]
+            if not ready:
+                continue
+            try:
+                await self.flush(ready)
+            except Exception:
+                logger.exception(f"Ошибка создания задач по {len(ready)} событиям")
+
+    @staticmethod
+    def _change_order(item: Tuple[Change, str]) -> int:
+        # В одном наборе изменений удаление применяется раньше создания: файл, замененный
+        # переименованием, остается в очереди
+        return 0 if item[0] == Change.deleted else 1
+
+    def stop(self) -> None:
+        self.stopping.set()
+
+
+async def main() -> None:
+    rules = load_watch_rules(settings.WATCH_RULES_PATH)
+    if not rules:
+        logger.warning(f"В {settings.WATCH_RULES_PATH} нет правил наблюдения")
+        return
+    engine = create_db_engine(pool_size=1, max_overflow=0)
+    watcher = FileWatcher(
+        session_maker=sessionmaker(engine, class_=AsyncSession, expire_on_commit=False),
+        rules=rules,
+    )
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, watcher.stop)
+
+    logger.info(f"Наблюдатель за каталогами запущен, правил: {len(rules)}")
+    try:
+        await watcher.run_forever()
+    finally:
+        await engine.dispose()
+        await close_cache_redis()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,104 @@
+import asyncio
+import logging
+import signal
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.application.services.task_processor import TaskProcessor
+from app.application.use_cases.execute_task_batch import ExecuteTaskBatchUseCase
+from app.core.config import settings
+from app.core.database import create_db_engine
+from app.infrastructure.cache.task_cache import invalidate_tasks, close_cache_redis
+from app.infrastructure.repositories.postgres_task_repository import PostgresTaskRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PostgresQueueWorker:
+    """
+    Исполнитель задач, использующий таблицу tasks как очередь (TASK_QUEUE_BACKEND=postgres).
+    Забирает пакеты PENDING-задач через SELECT ... FOR UPDATE SKIP LOCKED,
+    поэтому несколько экземпляров можно запускать параллельно. Задачи упавшего исполнителя
+    забираются заново, когда истекает их аренда (lease_seconds).
+    """
+    session_maker: sessionmaker
+    task_processor: TaskProcessor
+    batch_size: int = settings.PG_QUEUE_BATCH_SIZE
+    concurrency: int = settings.PG_QUEUE_CONCURRENCY
+    poll_interval: float = settings.PG_QUEUE_POLL_INTERVAL
+    lease_seconds: float = settings.PG_QUEUE_LEASE_SECONDS
+    flush_interval: float = settings.PG_QUEUE_FLUSH_INTERVAL
+    stopping: asyncio.Event = field(default_factory=asyncio.Event)
+
+    async def run_once(self) -> int:
+        """
+        Обрабатывает один пакет задач.
+        Return:
+            int: Количество обработанных задач.
+        """
+        async with self.session_maker() as session:
+            use_case = ExecuteTaskBatchUseCase(
+                PostgresTaskRepository(session),
+                self.task_processor,
+                concurrency=self.concurrency,
+                lease_seconds=self.lease_seconds,
+                flush_interval=self.flush_interval,
+                on_status_change=invalidate_tasks
+            )
+            return await use_case.execute(self.batch_size)
+
+    async def run_forever(self) -> None:
+        """Обрабатывает пакеты, пока не получен сигнал остановки; при пустой очереди ждет poll_interval."""
+        while not self.stopping.is_set():
+            try:
+                processed = await self.run_once()
+            except Exception:
+                logger.exception("Ошибка обработки пакета задач")
+                processed = 0
+            if processed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self.stopping.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def stop(self) -> None:
+        self.stopping.set()
+
+
+async def main() -> None:
+    engine = create_db_engine(pool_size=2, max_overflow=0)
+    file_executor = ThreadPoolExecutor(max_workers=settings.FILE_IO_THREADS, thread_name_prefix="file-io")
+    search_executor = (
+        ProcessPoolExecutor(max_workers=settings.FILE_SEARCH_PROCESSES) if settings.FILE_SEARCH_PROCESSES > 0 else None
+    )
+    worker = PostgresQueueWorker(
+        session_maker=sessionmaker(engine, class_=AsyncSession, expire_on_commit=False),
+        task_processor=TaskProcessor(
+            executor=file_executor,
+            parallelism=settings.FILE_TASK_PARALLELISM,
+            search_executor=search_executor,
+            durability=settings.FILE_WRITE_DURABILITY
+        ),
+    )
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    logger.info("Исполнитель очереди PostgreSQL запущен")
+    try:
+        await worker.run_forever()
+    finally:
+        await engine.dispose()
+        await close_cache_redis()
+        file_executor.shutdown(wait=True)
+        if search_executor is not None:
+            search_executor.shutdown(wait=True)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -1,12 +1,17 @@
+from typing import List
+
+from app.application.services.file_copy import FileCopyEngine
 from app.application.services.task_processor import TaskProcessor
 from app.application.use_cases.execute_task import ExecuteTaskUseCase
 from app.domain.exceptions.entity import TaskProcessingException, TaskNotFoundException
 from app.domain.exceptions.value_object import TaskStatusException, ValidationException
 from app.infrastructure.workers.asyncio_service import run_async_function
+from app.infrastructure.workers.bootstrap import get_worker_session_maker, get_worker_file_executor
 from app.infrastructure.repositories.postgres_task_repository import PostgresTaskRepository
 from app.application.use_cases.create_task import CreateTaskUseCase
-from app.core.database import async_session_maker
+from app.infrastructure.cache.task_cache import invalidate_task, invalidate_task_list
 
+from app.core.config import settings
 from app.infrastructure.workers.celery_worker import celery_app
 
 
@@ -24,10 +29,12 @@ def create_task_in_db(self,name: str, task_data:dict):
     """
 
     async def async_create():
-        async with async_session_maker() as session:
+        async with get_worker_session_maker()() as session:
             task_repo = PostgresTaskRepository(session)
             use_case = CreateTaskUseCase(task_repo)
-            return await use_case.execute(name, task_data)
+            new_task = await use_case.execute(name, task_data)
+            await invalidate_task_list()
+            return new_task
 
     try:
         new_task = run_async_function(async_create())
@@ -74,10 +81,18 @@ def execute_task_celery(self,task_id: str):
     """
 
     async def async_execute():
-        async with async_session_maker() as session:
+        async with get_worker_session_maker()() as session:
             task_repo = PostgresTaskRepository(session)
-            task_processor = TaskProcessor()
-            use_case = ExecuteTaskUseCase(task_repo, task_processor)
+            task_processor = TaskProcessor(
+                executor=get_worker_file_executor(),
+                copy_engine=FileCopyEngine(
+                    checkpoint_size=settings.FILE_COPY_CHECKPOINT_SIZE,
+                    resumable_threshold=settings.FILE_COPY_RESUMABLE_THRESHOLD
+                ),
+                parallelism=settings.FILE_TASK_PARALLELISM,
+                durability=settings.FILE_WRITE_DURABILITY
+            )
+            use_case = ExecuteTaskUseCase(task_repo, task_processor, on_status_change=invalidate_task)
 
             try:
                 is_last_attempt = self.request.retries >= self.max_retries
@@ -138,6 +153,7 @@ def enqueue_task_creation(name: str, task_data:dict):
 def enqueue_task_execution(task_id: str):
     """
     Отправляет задачу в Celery на выполнение.
+    В режиме TASK_QUEUE_BACKEND=postgres ничего не отправляет: задачу заберет pg_queue_worker.
 
     Args:
         task_id (str): Идентификатор задачи.
@@ -145,5 +161,26 @@ def enqueue_task_execution(task_id: str):
     Return:
         str: Идентификатор задачи в Celery.
     """
+    if settings.TASK_QUEUE_BACKEND == "postgres":
+        return task_id
     task = execute_task_celery.apply_async(args=[task_id], task_id=task_id)
-    return task.id
\ No newline at end of file
+    return task.id
+
+def enqueue_task_execution_batch(task_ids: List[str]) -> List[str]:
+    """
+    Отправляет пакет задач в Celery на выполнение через одно соединение с брокером.
+    В режиме TASK_QUEUE_BACKEND=postgres ничего не отправляет: задачи заберет pg_queue_worker.
+
+    Args:
+        task_ids (List[str]): Идентификаторы задач.
+
+    Return:
+        List[str]: Идентификаторы задач в Celery.
+    """
+    if settings.TASK_QUEUE_BACKEND == "postgres":
+        return list(task_ids)
+    with celery_app.producer_or_acquire() as producer:
+        return [
+            execute_task_celery.apply_async(args=[task_id], task_id=task_id, producer=producer).id
+            for task_id in task_ids
+        ]
@@ -1,20 +1,19 @@
 import os
 
-import redis.asyncio as redis
 from fastapi import FastAPI
 from fastapi_cache import FastAPICache
 from fastapi_cache.decorator import cache
 
 from app.api.routes.task_router import router as task_router
 from app.core.config import settings
-from fastapi_cache.backends.redis import RedisBackend
+from app.infrastructure.cache.task_cache import get_cache_backend_redis, CACHE_PREFIX
+from app.infrastructure.cache.backend import InstrumentedRedisBackend
 from prometheus_fastapi_instrumentator import Instrumentator
 app = FastAPI()
 
 @app.on_event("startup")
 async def startup():
-    redis_client = redis.from_url(settings.REDIS_URL, encoding="utf-8", decode_responses=True)
-    FastAPICache.init(RedisBackend(redis_client), prefix="fastapi-cache")
+    FastAPICache.init(InstrumentedRedisBackend(get_cache_backend_redis()), prefix=CACHE_PREFIX)
 
 
 app.include_router(task_router)
@@ -20,6 +20,20 @@ async def test_create_task_sync(ac: AsyncClient):
     assert data["name"] == task_data["name"]
     assert data["status"] == "PENDING"
 
+@pytest.mark.asyncio
+async def test_create_task_invalid_data(ac: AsyncClient):
+    """Тест создания задачи с невалидными данными: ошибка валидации - 400, а не 500"""
+    task_data = {
+        "name": "Invalid Copy",
+        "task_data": {
+            "task_type": "FILE_COPY",
+            "source_path": "/app/files/test.txt",
+            "destination_path": ""
+        }
+    }
+    response = await ac.post("/tasks/sync/create", json=task_data)
+    assert response.status_code == 400
+
 @pytest.mark.asyncio
 async def test_get_task_status(ac: AsyncClient):
     """Тест получения статуса задачи"""
@@ -45,7 +59,7 @@ async def test_get_task_status(ac: AsyncClient):
 async def test_get_task_list(ac: AsyncClient):
     response = await ac.get("/tasks/list")
     assert response.status_code == 200
-    assert isinstance(response.json(), list)
+    assert isinstance(response.json()["items"], list)
 
 @pytest.mark.asyncio
 async def test_update_task(ac: AsyncClient):
@@ -0,0 +1,31 @@
+import pytest
+from app.application.services.file_watch import PendingEvents, WatchRule
+
+
+def test_pending_events_wait_for_settle():
+    """Проверяем, что события файла объединяются и выдаются после паузы без изменений"""
+
+    pending = PendingEvents(settle=2.0)
+    pending.add("added", "/in/a.csv", now=0.0)
+    pending.add("modified", "/in/a.csv", now=1.5)
+    pending.add("added", "/in/b.csv", now=1.0)
+    pending.add("deleted", "/in/b.csv", now=1.2)
+
+    assert pending.pop_ready(now=3.0) == []
+    assert pending.pop_ready(now=3.5) == [("added", "/in/a.csv")]
+    assert pending.events == {}
+
+
+def test_watch_rule_from_dict_validation():
+    """Проверяем разбор правила и отказ для относительного пути и неизвестного события"""
+
+    rule = WatchRule.from_dict({
+        "name": "logs", "path": "/in", "task_type": "FILE_COMPRESS", "pattern": "logs/*.log", "recursive": False
+    })
+    assert rule.matches("/in/logs/a.log", "modified") is False
+    assert rule.events == ("added", "modified")
+
+    with pytest.raises(ValueError):
+        WatchRule.from_dict({"name": "bad", "path": "in", "task_type": "FILE_COPY"})
+    with pytest.raises(ValueError):
+        WatchRule.from_dict({"name": "bad", "path": "/in", "task_type": "FILE_COPY", "events": ["deleted"]})
@@ -1,11 +1,36 @@
 import pytest
+import asyncio
+import errno
+import gzip
+import hashlib
+import json
+import lzma
 import os
+import re
+import threading
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import shutil
+import tarfile
 from pathlib import Path
+from app.application.services import task_processor as task_processor_module
+from app.application.services.atomic_write import temp_path
+from app.application.services.file_copy import FileCopyEngine
 from app.application.services.task_processor import TaskProcessor
+from app.domain.value_objects.copy_checkpoint import CopyCheckpoint
+from app.domain.value_objects.dir_archive_task_data import DirArchiveTaskData
+from app.domain.value_objects.dir_sync_task_data import DirSyncTaskData
+from app.domain.value_objects.file_compress_task_data import FileCompressTaskData
+from app.domain.value_objects.file_batch_task_data import FileBatchTaskData
+from app.domain.value_objects.file_copy_task_data import FileCopyTaskData
+from app.domain.value_objects.file_delete_pattern_task_data import FileDeletePatternTaskData
+from app.domain.value_objects.file_hash_task_data import FileHashTaskData
+from app.domain.value_objects.file_parts_task_data import FilePartsTaskData
+from app.domain.value_objects.file_search_task_data import FileSearchTaskData
 from app.domain.value_objects.file_task_data import FileTaskData
 from app.domain.value_objects.task_type import TaskTypeEnum
 from app.domain.exceptions.entity import TaskProcessingException
+from app.domain.exceptions.value_object import FileValidationException
 
 @pytest.fixture
 def temp_dir(tmp_path):
@@ -66,4 +91,801 @@ async def test_copy_nonexistent_file(temp_dir):
     )
 
     with pytest.raises(TaskProcessingException, match="Ошибка при копировании"):
-        await processor.copy_file(file_data)
\ No newline at end of file
+        await processor.copy_file(file_data)
+
+@pytest.mark.asyncio
+async def test_file_operations_run_in_executor(temp_file, temp_dir):
+    """Проверяем, что файловые операции выполняются в пуле потоков и не блокируют event loop"""
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="file-io-test") as executor:
+        processor = TaskProcessor(executor=executor)
+        threads = set()
+        original_copy = processor._copy_file_sync
+
+        def tracking_copy(*args):
+            threads.add(threading.current_thread().name)
+            return original_copy(*args)
+
+        processor._copy_file_sync = tracking_copy
+        await asyncio.gather(*(
+            processor.copy_file(FileTaskData(
+                task_type=TaskTypeEnum.FILE_COPY,
+                source_path=str(temp_file),
+                destination_path=str(temp_dir / f"copy_{i}.txt")
+            ))
+            for i in range(4)
+        ))
+
+    assert all(name.startswith("file-io-test") for name in threads)
+    assert all((temp_dir / f"copy_{i}.txt").read_text() == "test content" for i in range(4))
+
+
+@pytest.mark.asyncio
+async def test_copy_file_reports_strategy(temp_file, temp_dir):
+    processor = TaskProcessor()
+    dest_path = temp_dir / "reported_copy.txt"
+
+    result = await processor.copy_file(FileTaskData(
+        task_type=TaskTypeEnum.FILE_COPY,
+        source_path=str(temp_file),
+        destination_path=str(dest_path)
+    ))
+
+    assert dest_path.read_text() == "test content"
+    assert result["strategy"] in {"reflink", "copy_file_range", "sendfile", "chunked"}
+    assert result["size"] == len("test content")
+    assert "throughput_mb_s" in result
+
+
+def test_copy_engine_preserves_sparse_holes(temp_dir):
+    source = temp_dir / "sparse.bin"
+    with open(source, "wb") as f:
+        f.write(b"head")
+        f.seek(64 * 1024 * 1024)
+        f.write(b"tail")
+    destination = temp_dir / "sparse_copy.bin"
+
+    stats = FileCopyEngine(chunk_size=1024 * 1024).copy(str(source), str(destination))
+
+    assert destination.stat().st_size == source.stat().st_size
+    assert destination.read_bytes() == source.read_bytes()
+    if stats.strategy != "reflink":
+        assert stats.bytes_copied < stats.size
+    assert destination.stat().st_blocks <= source.stat().st_blocks * 2
+
+
+def test_copy_engine_falls_back_to_chunked(temp_file, temp_dir, monkeypatch):
+    def unsupported(*args):
+        raise OSError(errno.EXDEV, "unsupported")
+
+    monkeypatch.setattr(FileCopyEngine, "_try_reflink", staticmethod(lambda src_fd, dst_fd: False))
+    monkeypatch.setattr(os, "copy_file_range", unsupported)
+    monkeypatch.setattr(os, "sendfile", unsupported)
+    destination = temp_dir / "chunked_copy.txt"
+
+    stats = FileCopyEngine().copy(str(temp_file), str(destination))
+
+    assert stats.strategy == "chunked"
+    assert destination.read_text() == "test content"
+
+
+@pytest.mark.asyncio
+async def test_resumable_copy_continues_from_checkpoint(temp_dir, monkeypatch):
+    source = temp_dir / "large.bin"
+    source.write_bytes(os.urandom(5 * 1024))
+    destination = temp_dir / "large_copy.bin"
+    processor = TaskProcessor(copy_engine=FileCopyEngine(chunk_size=512, checkpoint_size=1024, resumable_threshold=0))
+    file_data = FileTaskData(
+        task_type=TaskTypeEnum.FILE_COPY,
+        source_path=str(source),
+        destination_path=str(destination)
+    )
+    saved = []
+
+    async def fail_after_two_chunks(checkpoint):
+        saved.append(checkpoint)
+        if len(saved) == 2:
+            raise OSError("transient error")
+
+    with pytest.raises(TaskProcessingException):
+        await processor.copy_file(file_data, on_checkpoint=fail_after_two_chunks)
+    assert saved[-1].bytes_done == 2048
+    assert not destination.exists()
+
+    resumed = []
+
+    async def record(checkpoint):
+        resumed.append(checkpoint)
+
+    result = await processor.copy_file(file_data, checkpoint=saved[-1], on_checkpoint=record)
+
+    assert destination.read_bytes() == source.read_bytes()
+    assert result["resumed_from"] == 2048
+    assert result["bytes_copied"] == 3 * 1024
+    assert result["verified"] is True
+    assert [checkpoint.bytes_done for checkpoint in resumed] == [3072, 4096, 5120]
+
+
+@pytest.mark.asyncio
+async def test_resumable_copy_resets_checkpoint_on_mismatch(temp_dir):
+    source = temp_dir / "source.bin"
+    source.write_bytes(b"a" * 2048)
+    destination = temp_dir / "corrupted.bin"
+    Path(temp_path(str(destination), "partial")).write_bytes(b"b" * 1024)
+    stat_result = source.stat()
+    processor = TaskProcessor(copy_engine=FileCopyEngine(checkpoint_size=1024))
+    saved = []
+
+    async def record(checkpoint):
+        saved.append(checkpoint)
+
+    checkpoint = CopyCheckpoint(
+        size=stat_result.st_size,
+        mtime_ns=stat_result.st_mtime_ns,
+        bytes_done=1024,
+        checksum=zlib.crc32(b"a" * 1024)
+    )
+    with pytest.raises(TaskProcessingException, match="Контрольная сумма"):
+        await processor.copy_file(
+            FileTaskData(task_type=TaskTypeEnum.FILE_COPY, source_path=str(source), destination_path=str(destination)),
+            checkpoint=checkpoint,
+            on_checkpoint=record
+        )
+
+    assert saved[-1] is None
+    assert not os.path.exists(temp_path(str(destination), "partial"))
+
+
+@pytest.mark.asyncio
+async def test_copy_below_resumable_threshold_skips_checkpoints(temp_file, temp_dir):
+    processor = TaskProcessor(copy_engine=FileCopyEngine(checkpoint_size=4, resumable_threshold=1024))
+    destination = temp_dir / "small_copy.txt"
+    saved = []
+
+    async def record(checkpoint):
+        saved.append(checkpoint)
+
+    result = await processor.copy_file(
+        FileTaskData(task_type=TaskTypeEnum.FILE_COPY, source_path=str(temp_file), destination_path=str(destination)),
+        on_checkpoint=record
+    )
+
+    assert destination.read_text() == "test content"
+    assert result["strategy"] in {"reflink", "copy_file_range", "sendfile", "chunked"}
+    assert "crc32" not in result
+    assert saved == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("last_attempt, keeps_partial", [(False, True), (True, False)])
+async def test_resumable_copy_failure_keeps_partial_until_last_attempt(temp_dir, last_attempt, keeps_partial):
+    source = temp_dir / "large.bin"
+    source.write_bytes(os.urandom(4 * 1024))
+    destination = temp_dir / "large_copy.bin"
+    processor = TaskProcessor(copy_engine=FileCopyEngine(checkpoint_size=1024, resumable_threshold=0))
+
+    async def fail(checkpoint):
+        raise OSError("transient error")
+
+    with pytest.raises(TaskProcessingException):
+        await processor.copy_file(
+            FileTaskData(task_type=TaskTypeEnum.FILE_COPY, source_path=str(source), destination_path=str(destination)),
+            on_checkpoint=fail,
+            last_attempt=last_attempt
+        )
+
+    assert os.path.exists(temp_path(str(destination), "partial")) is keeps_partial
+    assert not destination.exists()
+
+
+@pytest.mark.asyncio
+async def test_copy_dir(temp_dir):
+    source = temp_dir / "tree"
+    (source / "a" / "b").mkdir(parents=True)
+    (source / "root.txt").write_text("root")
+    (source / "a" / "one.txt").write_text("one")
+    (source / "a" / "b" / "two.txt").write_text("two")
+    (source / "link").symlink_to("root.txt")
+    destination = temp_dir / "tree_copy"
+    processor = TaskProcessor(parallelism=2)
+
+    result = await processor.copy_dir(FileTaskData(
+        task_type=TaskTypeEnum.DIR_COPY,
+        source_path=str(source),
+        destination_path=str(destination)
+    ))
+
+    assert (destination / "a" / "b" / "two.txt").read_text() == "two"
+    assert os.readlink(destination / "link") == "root.txt"
+    assert result["files"] == 3
+    assert result["directories"] == 3
+    assert result["symlinks"] == 1
+    assert result["bytes"] == len("root") + len("one") + len("two")
+    assert result["failed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_copy_dir_into_itself(temp_dir):
+    processor = TaskProcessor()
+
+    with pytest.raises(TaskProcessingException, match="находится внутри"):
+        await processor.copy_dir(FileTaskData(
+            task_type=TaskTypeEnum.DIR_COPY,
+            source_path=str(temp_dir),
+            destination_path=str(temp_dir / "nested")
+        ))
+
+
+@pytest.mark.asyncio
+async def test_run_batch_reports_each_operation(temp_file, temp_dir):
+    processor = TaskProcessor()
+    batch = FileBatchTaskData(
+        task_type=TaskTypeEnum.FILE_BATCH,
+        operations=(
+            FileTaskData(task_type=TaskTypeEnum.FILE_CREATE, source_path=str(temp_dir / "created.txt")),
+            FileTaskData(task_type=TaskTypeEnum.FILE_DELETE, source_path=str(temp_dir / "missing.txt")),
+            FileTaskData(
+                task_type=TaskTypeEnum.FILE_COPY,
+                source_path=str(temp_file),
+                destination_path=str(temp_dir / "copied.txt")
+            ),
+        ),
+        parallelism=2
+    )
+
+    result = await processor.run_batch(batch)
+
+    assert [item["status"] for item in result["items"]] == ["COMPLETED", "FAILED", "COMPLETED"]
+    assert "Ошибка при удалении" in result["items"][1]["error"]
+    assert (result["completed"], result["failed"], result["skipped"]) == (2, 1, 0)
+    assert (temp_dir / "copied.txt").read_text() == "test content"
+
+
+@pytest.mark.asyncio
+async def test_run_batch_stop_on_error(temp_dir):
+    processor = TaskProcessor()
+    batch = FileBatchTaskData(
+        task_type=TaskTypeEnum.FILE_BATCH,
+        operations=(
+            FileTaskData(task_type=TaskTypeEnum.FILE_DELETE, source_path=str(temp_dir / "missing.txt")),
+            FileTaskData(task_type=TaskTypeEnum.FILE_CREATE, source_path=str(temp_dir / "never.txt")),
+        ),
+        parallelism=1,
+        stop_on_error=True
+    )
+
+    result = await processor.run_batch(batch)
+
+    assert [item["status"] for item in result["items"]] == ["FAILED", "SKIPPED"]
+    assert not (temp_dir / "never.txt").exists()
+
+
+@pytest.mark.asyncio
+async def test_sync_dir_copies_only_changes(temp_dir):
+    source = temp_dir / "src"
+    (source / "sub").mkdir(parents=True)
+    (source / "same.txt").write_text("same")
+    (source / "changed.txt").write_text("new content")
+    (source / "sub" / "added.txt").write_text("added")
+    destination = temp_dir / "dst"
+    processor = TaskProcessor(parallelism=2)
+    sync = DirSyncTaskData(
+        task_type=TaskTypeEnum.DIR_SYNC,
+        source_path=str(source),
+        destination_path=str(destination)
+    )
+
+    first = await processor.sync_dir(sync)
+    (source / "changed.txt").write_text("changed again")
+    (destination / "extra").mkdir()
+    (destination / "extra" / "stale.txt").write_text("stale")
+    second = await processor.sync_dir(sync)
+
+    assert first["files"] == 3
+    assert (second["files"], second["unchanged"], second["deleted"]) == (1, 2, 1)
+    assert (destination / "changed.txt").read_text() == "changed again"
+    assert not (destination / "extra").exists()
+
+
+@pytest.mark.asyncio
+async def test_sync_dir_checksum_ignores_mtime(temp_dir):
+    source = temp_dir / "src"
+    source.mkdir()
+    (source / "file.txt").write_text("content")
+    destination = temp_dir / "dst"
+    destination.mkdir()
+    (destination / "file.txt").write_text("content")
+    os.utime(destination / "file.txt", (0, 0))
+    processor = TaskProcessor()
+
+    result = await processor.sync_dir(DirSyncTaskData(
+        task_type=TaskTypeEnum.DIR_SYNC,
+        source_path=str(source),
+        destination_path=str(destination),
+        checksum=True
+    ))
+
+    assert (result["files"], result["unchanged"]) == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_sync_dir_reports_failed_action_path(temp_dir, monkeypatch):
+    source = temp_dir / "src"
+    source.mkdir()
+    (source / "file.txt").write_text("content")
+    destination = temp_dir / "dst"
+    processor = TaskProcessor()
+
+    def fail(action, group):
+        raise PermissionError("read-only destination")
+
+    monkeypatch.setattr(processor, "_sync_file_sync", fail)
+    result = await processor.sync_dir(DirSyncTaskData(
+        task_type=TaskTypeEnum.DIR_SYNC,
+        source_path=str(source),
+        destination_path=str(destination)
+    ))
+
+    assert result["failed"] == 1
+    assert result["errors"] == [{"path": str(destination / "file.txt"), "error": "read-only destination"}]
+
+
+@pytest.mark.asyncio
+async def test_delta_copy_rewrites_only_changed_blocks(temp_dir):
+    block = 4096
+    original = bytearray(os.urandom(block * 8))
+    source = temp_dir / "image.bin"
+    destination = temp_dir / "image_copy.bin"
+    destination.write_bytes(original)
+    original[block * 3 + 10] ^= 0xFF
+    source.write_bytes(bytes(original) + os.urandom(100))
+    processor = TaskProcessor(copy_engine=FileCopyEngine(delta_block_size=block))
+
+    result = await processor.copy_file(FileCopyTaskData(
+        task_type=TaskTypeEnum.FILE_COPY,
+        source_path=str(source),
+        destination_path=str(destination),
+        delta=True
+    ))
+
+    assert destination.read_bytes() == source.read_bytes()
+    assert result["strategy"] == "delta"
+    assert result["bytes_written"] == block + 100
+    assert (result["blocks_total"], result["blocks_changed"]) == (9, 2)
+    assert result["crc32"] == f"{zlib.crc32(source.read_bytes()):08x}"
+
+
+def test_delta_copy_truncates_longer_destination(temp_dir):
+    source = temp_dir / "short.bin"
+    source.write_bytes(b"a" * 1000)
+    destination = temp_dir / "long.bin"
+    destination.write_bytes(b"a" * 3000)
+
+    stats = FileCopyEngine(delta_block_size=512).delta_copy(str(source), str(destination))
+
+    assert destination.read_bytes() == b"a" * 1000
+    assert stats.bytes_written == 0
+
+
+@pytest.mark.asyncio
+async def test_hash_files(temp_file, temp_dir):
+    processor = TaskProcessor()
+    missing = temp_dir / "missing.bin"
+
+    result = await processor.hash_files(FileHashTaskData(
+        task_type=TaskTypeEnum.FILE_HASH,
+        paths=(str(temp_file), str(missing)),
+        algorithm="sha256"
+    ))
+
+    assert result["files"][0]["digest"] == hashlib.sha256(b"test content").hexdigest()
+    assert "error" in result["files"][1]
+    assert (result["total"], result["failed"], result["bytes"]) == (2, 1, len("test content"))
+
+
+@pytest.mark.asyncio
+async def test_copy_file_with_verify(temp_file, temp_dir):
+    processor = TaskProcessor()
+
+    result = await processor.copy_file(FileCopyTaskData(
+        task_type=TaskTypeEnum.FILE_COPY,
+        source_path=str(temp_file),
+        destination_path=str(temp_dir / "verified.txt"),
+        verify=True
+    ))
+
+    assert result["verified"] is True
+    assert result["digest"] == hashlib.blake2b(b"test content").hexdigest()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("compression_format,opener", [("gzip", gzip.decompress), ("xz", lzma.decompress)])
+async def test_compress_and_decompress_file(temp_dir, compression_format, opener):
+    processor = TaskProcessor(parallelism=2)
+    source = temp_dir / "data.bin"
+    payload = os.urandom(64 * 1024) + b"a" * (300 * 1024)
+    source.write_bytes(payload)
+
+    compressed = await processor.process(FileCompressTaskData(
+        task_type=TaskTypeEnum.FILE_COMPRESS,
+        source_path=str(source),
+        format=compression_format,
+        block_size=64 * 1024
+    ))
+
+    assert compressed["blocks"] == 6
+    assert compressed["size_in"] == len(payload)
+    assert opener(Path(compressed["destination_path"]).read_bytes()) == payload
+
+    restored = temp_dir / "restored.bin"
+    result = await processor.process(FileCompressTaskData(
+        task_type=TaskTypeEnum.FILE_DECOMPRESS,
+        source_path=compressed["destination_path"],
+        destination_path=str(restored),
+        format=compression_format
+    ))
+
+    assert result["size_out"] == len(payload)
+    assert restored.read_bytes() == payload
+
+
+@pytest.mark.asyncio
+async def test_compress_empty_file(temp_dir):
+    processor = TaskProcessor()
+    source = temp_dir / "empty.txt"
+    source.write_bytes(b"")
+
+    result = await processor.compress_file(FileCompressTaskData(
+        task_type=TaskTypeEnum.FILE_COMPRESS,
+        source_path=str(source)
+    ))
+
+    assert result["blocks"] == 1
+    assert gzip.decompress((temp_dir / "empty.txt.gz").read_bytes()) == b""
+
+
+@pytest.mark.asyncio
+async def test_compress_missing_file(temp_dir):
+    processor = TaskProcessor()
+
+    with pytest.raises(TaskProcessingException):
+        await processor.compress_file(FileCompressTaskData(
+            task_type=TaskTypeEnum.FILE_COMPRESS,
+            source_path=str(temp_dir / "missing.bin")
+        ))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("compression,name", [(None, "tree.tar"), ("gzip", "tree.tar.gz")])
+async def test_archive_dir(temp_dir, monkeypatch, compression, name):
+    monkeypatch.setattr(task_processor_module, "ARCHIVE_CHUNK_SIZE", 1000)
+    processor = TaskProcessor(parallelism=2)
+    source = temp_dir / "tree"
+    (source / "nested").mkdir(parents=True)
+    payload = os.urandom(4500)
+    (source / "big.bin").write_bytes(payload)
+    (source / "nested" / "small.txt").write_text("small")
+    (source / "empty.txt").write_bytes(b"")
+    os.symlink("big.bin", source / "link")
+    progress = []
+
+    async def on_progress(details: dict) -> None:
+        progress.append(details)
+
+    result = await processor.archive_dir(DirArchiveTaskData(
+        task_type=TaskTypeEnum.DIR_ARCHIVE,
+        source_path=str(source),
+        destination_path=str(temp_dir / name),
+        compression=compression
+    ), on_progress=on_progress)
+
+    assert (result["files"], result["directories"], result["symlinks"]) == (3, 2, 1)
+    assert result["bytes"] == len(payload) + len("small")
+    assert progress and progress[0]["current"] == str(source)
+    with tarfile.open(temp_dir / name) as archive:
+        assert archive.getnames() == ["tree", "tree/big.bin", "tree/empty.txt", "tree/link", "tree/nested",
+                                      "tree/nested/small.txt"]
+        assert archive.extractfile("tree/big.bin").read() == payload
+        assert archive.extractfile("tree/nested/small.txt").read() == b"small"
+        assert archive.getmember("tree/link").linkname == "big.bin"
+
+
+@pytest.mark.asyncio
+async def test_archive_dir_rejects_archive_inside_source(temp_dir):
+    processor = TaskProcessor()
+
+    with pytest.raises(TaskProcessingException):
+        await processor.archive_dir(DirArchiveTaskData(
+            task_type=TaskTypeEnum.DIR_ARCHIVE,
+            source_path=str(temp_dir),
+            destination_path=str(temp_dir / "self.tar")
+        ))
+
+    assert not (temp_dir / "self.tar").exists()
+
+
+@pytest.fixture
+def log_tree(temp_dir):
+    """Каталог с журналами для поиска"""
+    logs = temp_dir / "logs"
+    (logs / "old").mkdir(parents=True)
+    lines = [f"line {i} {'ERROR disk' if i % 7 == 0 else 'ok'}\n" for i in range(200)]
+    (logs / "app.log").write_text("".join(lines))
+    (logs / "old" / "app.log.1").write_text("error lower\nERROR upper\n")
+    (logs / "empty.log").write_text("")
+    return logs
+
+
+@pytest.mark.asyncio
+async def test_search_files_literal_across_ranges(log_tree, monkeypatch):
+    monkeypatch.setattr(task_processor_module, "SEARCH_RANGE_SIZE", 100)
+    processor = TaskProcessor(parallelism=3)
+    content = (log_tree / "app.log").read_bytes()
+    expected = [i for i in range(len(content)) if content.startswith(b"ERROR", i)]
+
+    result = await processor.process(FileSearchTaskData(
+        task_type=TaskTypeEnum.FILE_SEARCH,
+        paths=(str(log_tree / "app.log"),),
+        pattern="ERROR",
+        max_offsets=5
+    ))
+
+    assert result["matches"] == len(expected) == 29
+    assert result["files"][0]["offsets"] == expected[:5]
+    assert result["truncated"] is True
+
+
+@pytest.mark.parametrize("ignore_case", [False, True])
+@pytest.mark.asyncio
+async def test_search_files_literal_spanning_lines(log_tree, monkeypatch, ignore_case):
+    monkeypatch.setattr(task_processor_module, "SEARCH_RANGE_SIZE", 100)
+    processor = TaskProcessor(parallelism=3)
+    content = (log_tree / "app.log").read_bytes()
+    expected = [i for i in range(len(content)) if content.startswith(b"ok\nline", i)]
+
+    result = await processor.search_files(FileSearchTaskData(
+        task_type=TaskTypeEnum.FILE_SEARCH,
+        paths=(str(log_tree / "app.log"),),
+        pattern="OK\nLINE" if ignore_case else "ok\nline",
+        ignore_case=ignore_case,
+        max_offsets=1000
+    ))
+
+    assert result["files"][0]["offsets"] == expected
+    with pytest.raises(FileValidationException):
+        FileSearchTaskData(
+            task_type=TaskTypeEnum.FILE_SEARCH, paths=(str(log_tree),), pattern="ok\\nline", regex=True
+        )
+
+
+@pytest.mark.asyncio
+async def test_search_files_regex_in_process_pool(log_tree, temp_dir, monkeypatch):
+    monkeypatch.setattr(task_processor_module, "SEARCH_RANGE_SIZE", 256)
+    output = temp_dir / "matches.jsonl"
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        processor = TaskProcessor(search_executor=pool)
+        result = await processor.search_files(FileSearchTaskData(
+            task_type=TaskTypeEnum.FILE_SEARCH,
+            paths=(str(log_tree),),
+            pattern=r"^(line \d+ )?error",
+            regex=True,
+            ignore_case=True,
+            output_path=str(output)
+        ))
+
+    assert result["files_scanned"] == 3
+    assert result["matches"] == 31
+    assert {entry["path"]: entry["matches"] for entry in result["files"]} == {
+        str(log_tree / "app.log"): 29, str(log_tree / "old" / "app.log.1"): 2
+    }
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert len(records) == 31
+    assert records[-1] == {"path": str(log_tree / "old" / "app.log.1"), "offset": 12, "length": 5}
+    assert not list(temp_dir.glob("matches.jsonl.*.part"))
+
+
+@pytest.mark.asyncio
+async def test_search_files_missing_path(temp_dir):
+    processor = TaskProcessor()
+
+    with pytest.raises(TaskProcessingException):
+        await processor.search_files(FileSearchTaskData(
+            task_type=TaskTypeEnum.FILE_SEARCH,
+            paths=(str(temp_dir / "missing.log"),),
+            pattern="ERROR"
+        ))
+
+
+@pytest.mark.asyncio
+async def test_search_files_reports_missing_path_and_continues(log_tree, temp_dir):
+    processor = TaskProcessor()
+    missing = str(temp_dir / "missing.log")
+
+    result = await processor.search_files(FileSearchTaskData(
+        task_type=TaskTypeEnum.FILE_SEARCH,
+        paths=(missing, str(log_tree / "app.log")),
+        pattern="ERROR"
+    ))
+
+    assert result["matches"] == 29
+    assert result["failed"] == 1
+    assert result["files_scanned"] == 1
+    errors = {entry["path"]: entry["error"] for entry in result["files"] if "error" in entry}
+    assert list(errors) == [missing]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("pattern", [r"\s+", r"[^a]+", r"\D+$"])
+async def test_search_files_regex_matches_within_lines(temp_dir, monkeypatch, pattern):
+    source = temp_dir / "spaces.log"
+    content = b"".join(f"a {i} \n\n  a\t\nb{i}\n".encode() for i in range(50))
+    source.write_bytes(content)
+    expected, line_start = [], 0
+    for line in content.split(b"\n"):
+        expected.extend(line_start + match.start() for match in re.finditer(pattern.encode(), line) if match.group())
+        line_start += len(line) + 1
+    search = FileSearchTaskData(
+        task_type=TaskTypeEnum.FILE_SEARCH, paths=(str(source),), pattern=pattern, regex=True, max_offsets=10000
+    )
+
+    offsets = []
+    for range_size in (len(content), 37, 64):
+        monkeypatch.setattr(task_processor_module, "SEARCH_RANGE_SIZE", range_size)
+        result = await TaskProcessor(parallelism=4).search_files(search)
+        offsets.append(result["files"][0]["offsets"])
+
+    assert offsets == [expected] * 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("parts,part_size,expected_sizes", [(3, None, [3334, 3333, 3333]), (None, 4096, [4096, 4096, 1808])])
+async def test_split_and_concat_file(temp_dir, parts, part_size, expected_sizes):
+    processor = TaskProcessor(copy_engine=FileCopyEngine(chunk_size=1000), parallelism=2)
+    source = temp_dir / "big.bin"
+    payload = os.urandom(10000)
+    source.write_bytes(payload)
+    (temp_dir / "parts").mkdir()
+
+    split = await processor.process(FilePartsTaskData(
+        task_type=TaskTypeEnum.FILE_SPLIT,
+        source_paths=(str(source),),
+        destination_path=str(temp_dir / "parts" / "big.bin"),
+        parts=parts,
+        part_size=part_size
+    ))
+
+    assert [part["size"] for part in split["parts"]] == expected_sizes
+    assert [Path(part["path"]).name for part in split["parts"]] == ["big.bin.000", "big.bin.001", "big.bin.002"]
+    assert b"".join(Path(part["path"]).read_bytes() for part in split["parts"]) == payload
+
+    joined = temp_dir / "joined.bin"
+    result = await processor.process(FilePartsTaskData(
+        task_type=TaskTypeEnum.FILE_CONCAT,
+        source_paths=tuple(part["path"] for part in split["parts"]),
+        destination_path=str(joined)
+    ))
+
+    assert (result["parts"], result["bytes"]) == (3, len(payload))
+    assert joined.read_bytes() == payload
+
+
+@pytest.mark.asyncio
+async def test_concat_rejects_destination_among_parts(temp_file):
+    processor = TaskProcessor()
+
+    with pytest.raises(TaskProcessingException):
+        await processor.concat_files(FilePartsTaskData(
+            task_type=TaskTypeEnum.FILE_CONCAT,
+            source_paths=(str(temp_file),),
+            destination_path=str(temp_file)
+        ))
+
+    assert temp_file.read_text() == "test content"
+
+
+@pytest.fixture
+def scratch_tree(temp_dir):
+    """Каталог с временными файлами разного возраста и размера"""
+    scratch = temp_dir / "scratch"
+    (scratch / "nested" / "deep").mkdir(parents=True)
+    old = 1_000_000_000
+    for name, size, mtime in [
+        ("a.tmp", 10, old), ("b.tmp", 2000, old), ("keep.log", 10, old),
+        ("nested/c.tmp", 30, old), ("nested/deep/d.tmp", 40, None),
+    ]:
+        path = scratch / name
+        path.write_bytes(b"x" * size)
+        if mtime:
+            os.utime(path, (mtime, mtime))
+    return scratch
+
+
+@pytest.mark.asyncio
+async def test_delete_pattern_dry_run_then_delete(scratch_tree):
+    processor = TaskProcessor(parallelism=2)
+    task = dict(
+        task_type=TaskTypeEnum.FILE_DELETE_PATTERN,
+        source_path=str(scratch_tree),
+        pattern="*.tmp",
+        min_age_sec=3600,
+        max_size=1000
+    )
+
+    preview = await processor.process(FileDeletePatternTaskData(**task, dry_run=True))
+
+    assert (preview["files"], preview["bytes"], preview["deleted"]) == (2, 40, 0)
+    assert preview["directories"] == 3
+    assert (scratch_tree / "a.tmp").exists()
+
+    result = await processor.process(FileDeletePatternTaskData(**task))
+
+    assert (result["deleted"], result["bytes_freed"], result["failed"]) == (2, 40, 0)
+    remaining = sorted(str(path.relative_to(scratch_tree)) for path in scratch_tree.rglob("*") if path.is_file())
+    assert remaining == ["b.tmp", "keep.log", "nested/deep/d.tmp"]
+
+
+@pytest.mark.asyncio
+async def test_delete_pattern_relative_path_non_recursive(scratch_tree):
+    processor = TaskProcessor()
+
+    nested = await processor.delete_pattern(FileDeletePatternTaskData(
+        task_type=TaskTypeEnum.FILE_DELETE_PATTERN,
+        source_path=str(scratch_tree),
+        pattern="nested/*.tmp"
+    ))
+    top_level = await processor.delete_pattern(FileDeletePatternTaskData(
+        task_type=TaskTypeEnum.FILE_DELETE_PATTERN,
+        source_path=str(scratch_tree),
+        recursive=False
+    ))
+
+    assert nested["deleted"] == 2
+    assert top_level["deleted"] == 3
+    assert not list(scratch_tree.rglob("*.tmp"))
+    assert (scratch_tree / "nested" / "deep").is_dir()
+
+
+@pytest.mark.asyncio
+async def test_copy_file_failure_keeps_previous_destination(temp_file, temp_dir, monkeypatch):
+    processor = TaskProcessor()
+    destination = temp_dir / "existing.txt"
+    destination.write_text("previous")
+
+    def broken_copy(source_path, destination_path):
+        with open(destination_path, "wb") as f:
+            f.write(b"trunc")
+        raise OSError(errno.EIO, "crash")
+
+    monkeypatch.setattr(processor.copy_engine.__class__, "copy", lambda self, *args: broken_copy(*args))
+
+    with pytest.raises(TaskProcessingException):
+        await processor.copy_file(FileTaskData(
+            task_type=TaskTypeEnum.FILE_COPY,
+            source_path=str(temp_file),
+            destination_path=str(destination)
+        ))
+
+    assert destination.read_text() == "previous"
+    assert sorted(path.name for path in temp_dir.iterdir()) == ["existing.txt", "test_file.txt"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("durability,expected_syncs", [("none", 0), ("fsync", 6), ("group", 4)])
+async def test_batch_durability_modes(temp_file, temp_dir, monkeypatch, durability, expected_syncs):
+    synced = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: synced.append(fd) or real_fsync(fd))
+    processor = TaskProcessor(durability=durability)
+    operations = (
+        FileTaskData(task_type=TaskTypeEnum.FILE_CREATE, source_path=str(temp_dir / "created.txt")),
+        FileTaskData(task_type=TaskTypeEnum.FILE_COPY, source_path=str(temp_file),
+                     destination_path=str(temp_dir / "copy_1.txt")),
+        FileTaskData(task_type=TaskTypeEnum.FILE_COPY, source_path=str(temp_file),
+                     destination_path=str(temp_dir / "copy_2.txt")),
+    )
+
+    result = await processor.run_batch(FileBatchTaskData(task_type=TaskTypeEnum.FILE_BATCH, operations=operations))
+
+    assert result["completed"] == 3
+    assert (temp_dir / "copy_2.txt").read_text() == "test content"
+    assert len(synced) == expected_syncs
+    assert not list(temp_dir.glob(".*.tmp"))
@@ -1,35 +1,52 @@
 import pytest
+from dataclasses import replace
 from unittest.mock import AsyncMock
 from app.application.use_cases.cancel_task import CancelTaskUseCase
-from app.domain.exceptions.entity import TaskNotFoundException
+from app.domain.exceptions.entity import TaskException, TaskNotFoundException
+from app.domain.repositories.task_repository import TaskRepository
 from app.domain.exceptions.value_object import TaskTypeException
 from app.domain.value_objects.task_status import TaskStatusEnum
 from app.domain.entities.task import Task
 
 
+def make_task(status: TaskStatusEnum) -> Task:
+    return Task(id="task_id", name="Test Task", task_data={}, status=status, result=None)
+
+
 @pytest.mark.asyncio
 async def test_cancel_task_success():
     """Проверяем успешную отмену задачи со статусом PENDING"""
 
-    task_repository_mock = AsyncMock()
-
-    # Создаем мок задачи и явно задаем изменение статуса
-    task = AsyncMock()
-    task.status = TaskStatusEnum.PENDING
-
-    async def update_task_side_effect(updated_task):
-        updated_task.status = TaskStatusEnum.CANCELED
-        return updated_task
-
+    task_repository_mock = AsyncMock(spec=TaskRepository)
+    task = make_task(TaskStatusEnum.PENDING)
     task_repository_mock.get_task_by_id.return_value = task
-    task_repository_mock.update_task.side_effect = update_task_side_effect  # Фиксируем изменение
+    task_repository_mock.cancel_task.return_value = replace(task, status=TaskStatusEnum.CANCELED)
 
     use_case = CancelTaskUseCase(task_repository=task_repository_mock)
 
     result = await use_case.execute("task_id")
 
     assert result["status"] == TaskStatusEnum.CANCELED, f"Expected CANCELED, got {result['status']}"
-    task_repository_mock.update_task.assert_called_once()
+    task_repository_mock.cancel_task.assert_awaited_once_with("task_id")
+    task_repository_mock.update_task.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cancel_task_claimed_before_cancel():
+    """Ошибка, если исполнитель захватил задачу между чтением и отменой: задача не перезаписывается"""
+
+    task_repository_mock = AsyncMock(spec=TaskRepository)
+    task_repository_mock.get_task_by_id.side_effect = [
+        make_task(TaskStatusEnum.PENDING), make_task(TaskStatusEnum.IN_PROGRESS)
+    ]
+    task_repository_mock.cancel_task.return_value = None
+
+    use_case = CancelTaskUseCase(task_repository=task_repository_mock)
+
+    with pytest.raises(TaskException, match="Отмена задачи с статусом - IN_PROGRESS невозможна"):
+        await use_case.execute("task_id")
+
+    task_repository_mock.update_task.assert_not_called()
 
 
 @pytest.mark.asyncio
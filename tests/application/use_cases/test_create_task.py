@@ -2,8 +2,10 @@ import pytest
 from unittest.mock import AsyncMock
 from app.application.use_cases.create_task import CreateTaskUseCase
 from app.domain.entities.task import Task
-from app.domain.exceptions.value_object import TaskTypeException
+from app.domain.exceptions.value_object import TaskTypeException, FileBatchValidationException
 from app.domain.repositories.task_repository import TaskRepository
+from app.domain.value_objects.file_batch_task_data import FileBatchTaskData
+from app.domain.value_objects.file_copy_task_data import FileCopyTaskData
 from app.domain.value_objects.file_task_data import FileTaskData
 from app.domain.value_objects.task_name import TaskName
 from app.domain.value_objects.task_result import TaskResult
@@ -62,4 +64,54 @@ async def test_create_task_invalid_type():
         await use_case.execute(name=name, data=data)
 
 
-    task_repository_mock.create_task.assert_not_called()
\ No newline at end of file
+    task_repository_mock.create_task.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_create_file_batch_task():
+    """Проверяем создание задачи с пакетом файловых операций"""
+
+    task_repository_mock = AsyncMock(spec=TaskRepository)
+    task_repository_mock.create_task = AsyncMock(side_effect=lambda task: task)
+
+    use_case = CreateTaskUseCase(task_repository=task_repository_mock)
+
+    created_task = await use_case.execute(name="Batch", data={
+        "task_type": TaskTypeEnum.FILE_BATCH.value,
+        "operations": [
+            {"task_type": TaskTypeEnum.FILE_CREATE.value, "source_path": "/tmp/a.txt"},
+            {
+                "task_type": TaskTypeEnum.FILE_COPY.value,
+                "source_path": "/tmp/a.txt",
+                "destination_path": "/tmp/b.txt",
+                "verify": True,
+                "delta": True
+            },
+        ],
+        "stop_on_error": True
+    })
+
+    assert isinstance(created_task.task_data, FileBatchTaskData)
+    assert [operation.task_type for operation in created_task.task_data.operations] == [
+        TaskTypeEnum.FILE_CREATE, TaskTypeEnum.FILE_COPY
+    ]
+    copy_operation = created_task.task_data.operations[1]
+    assert isinstance(copy_operation, FileCopyTaskData)
+    assert copy_operation.verify is True and copy_operation.delta is True
+    assert created_task.task_data.as_generic_type()["operations"][1]["verify"] is True
+    assert created_task.task_data.stop_on_error is True
+
+
+@pytest.mark.asyncio
+async def test_create_file_batch_task_invalid_operation():
+    """Проверяем, что ошибка операции пакета указывает её индекс"""
+
+    use_case = CreateTaskUseCase(task_repository=AsyncMock(spec=TaskRepository))
+
+    with pytest.raises(FileBatchValidationException, match=r"operations\[1\]"):
+        await use_case.execute(name="Batch", data={
+            "task_type": TaskTypeEnum.FILE_BATCH.value,
+            "operations": [
+                {"task_type": TaskTypeEnum.FILE_CREATE.value, "source_path": "/tmp/a.txt"},
+                {"task_type": TaskTypeEnum.FILE_COPY.value, "source_path": "/tmp/a.txt"},
+            ]
+        })
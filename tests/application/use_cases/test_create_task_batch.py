@@ -0,0 +1,52 @@
+import pytest
+from unittest.mock import AsyncMock
+from app.application.use_cases.create_task_batch import CreateTaskBatchUseCase
+from app.domain.exceptions.value_object import TaskBatchValidationException
+from app.domain.repositories.task_repository import TaskRepository
+from app.domain.value_objects.file_task_data import FileTaskData
+from app.domain.value_objects.task_status import TaskStatus, TaskStatusEnum
+from app.domain.value_objects.task_type import TaskTypeEnum
+
+
+@pytest.mark.asyncio
+async def test_create_task_batch_success():
+    """Проверяем, что пакет сохраняется одним вызовом репозитория"""
+
+    task_repository_mock = AsyncMock(spec=TaskRepository)
+    task_repository_mock.create_tasks = AsyncMock(side_effect=lambda tasks: tasks)
+
+    use_case = CreateTaskBatchUseCase(task_repository=task_repository_mock)
+
+    items = [
+        (f"Task {i}", {"task_type": TaskTypeEnum.FILE_CREATE.value, "source_path": f"/tmp/file{i}.txt"})
+        for i in range(3)
+    ]
+
+    created_tasks = await use_case.execute(items)
+
+    assert [task.task_data.source_path for task in created_tasks] == [f"/tmp/file{i}.txt" for i in range(3)]
+    assert all(task.status == TaskStatus(TaskStatusEnum.PENDING) for task in created_tasks)
+    assert all(isinstance(task.task_data, FileTaskData) for task in created_tasks)
+    task_repository_mock.create_tasks.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_create_task_batch_reports_all_invalid_items():
+    """Проверяем, что ошибки всех невалидных задач возвращаются вместе, а пакет не сохраняется"""
+
+    task_repository_mock = AsyncMock(spec=TaskRepository)
+    use_case = CreateTaskBatchUseCase(task_repository=task_repository_mock)
+
+    items = [
+        ("Valid", {"task_type": TaskTypeEnum.FILE_CREATE.value, "source_path": "/tmp/file.txt"}),
+        ("Invalid type", {"task_type": "INVALID_TASK_TYPE", "source_path": "/tmp/file.txt"}),
+        ("Invalid copy", {"task_type": TaskTypeEnum.FILE_COPY.value, "source_path": "/tmp/file.txt"}),
+    ]
+
+    with pytest.raises(TaskBatchValidationException) as exc_info:
+        await use_case.execute(items)
+
+    assert "[1]" in str(exc_info.value)
+    assert "[2]" in str(exc_info.value)
+    assert "[0]" not in str(exc_info.value)
+    task_repository_mock.create_tasks.assert_not_called()
@@ -0,0 +1,67 @@
+import pytest
+from unittest.mock import AsyncMock
+from app.application.services.file_watch import WatchRule
+from app.application.use_cases.create_watch_tasks import CreateWatchTasksUseCase
+from app.domain.repositories.task_repository import TaskRepository
+from app.domain.value_objects.task_type import TaskTypeEnum
+
+
+def csv_rule(**kwargs) -> WatchRule:
+    return WatchRule(
+        name="csv", path="/in", task_type=TaskTypeEnum.FILE_COPY, pattern="*.csv", destination="/archive", **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_watch_tasks_by_rules():
+    """Проверяем, что подходящие файлы превращаются в задачи копирования, а остальные пропускаются"""
+
+    task_repository_mock = AsyncMock(spec=TaskRepository)
+    task_repository_mock.create_tasks = AsyncMock(side_effect=lambda tasks: tasks)
+    use_case = CreateWatchTasksUseCase(task_repository_mock, [csv_rule(options={"verify": True})])
+
+    tasks = await use_case.execute([
+        ("added", "/in/a.csv"),
+        ("modified", "/in/sub/b.csv"),
+        ("added", "/in/a.txt"),
+        ("added", "/in/.c.csv.1a2b.tmp"),
+        ("added", "/other/d.csv"),
+    ])
+
+    assert [task.name.value for task in tasks] == ["watch:csv:a.csv", "watch:csv:b.csv"]
+    assert [task.task_data.destination_path for task in tasks] == ["/archive/a.csv", "/archive/sub/b.csv"]
+    assert all(task.task_data.verify for task in tasks)
+    task_repository_mock.create_tasks.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_create_watch_tasks_in_batches():
+    """Проверяем, что задачи сохраняются пакетами по batch_size"""
+
+    task_repository_mock = AsyncMock(spec=TaskRepository)
+    task_repository_mock.create_tasks = AsyncMock(side_effect=lambda tasks: tasks)
+    use_case = CreateWatchTasksUseCase(task_repository_mock, [csv_rule(events=("added",))], batch_size=2)
+
+    tasks = await use_case.execute(
+        [("added", f"/in/{i}.csv") for i in range(5)] + [("modified", "/in/5.csv")]
+    )
+
+    assert len(tasks) == 5
+    assert [len(call.args[0]) for call in task_repository_mock.create_tasks.await_args_list] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_create_watch_tasks_skips_invalid_task():
+    """Проверяем, что невалидная задача пропускается, не мешая остальным"""
+
+    task_repository_mock = AsyncMock(spec=TaskRepository)
+    task_repository_mock.create_tasks = AsyncMock(side_effect=lambda tasks: tasks)
+    rules = [
+        WatchRule(name="broken", path="/in", task_type=TaskTypeEnum.FILE_COMPRESS, options={"format": "rar"}),
+        csv_rule(),
+    ]
+    use_case = CreateWatchTasksUseCase(task_repository_mock, rules)
+
+    tasks = await use_case.execute([("added", "/in/a.csv")])
+
+    assert [task.name.value for task in tasks] == ["watch:csv:a.csv"]
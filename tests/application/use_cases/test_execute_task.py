@@ -1,71 +1,240 @@
 import pytest
+from dataclasses import replace
+from functools import partial
 from unittest.mock import AsyncMock
 from app.domain.entities.task import Task
 from app.application.services.task_processor import TaskProcessor
 from app.application.use_cases.execute_task import ExecuteTaskUseCase
-from app.domain.exceptions.entity import TaskProcessingException
+from app.domain.exceptions.entity import TaskProcessingException, TaskAlreadyRunningException
+from app.domain.exceptions.value_object import TaskStatusException, ValidationException
 from app.domain.repositories.task_repository import TaskRepository
+from app.domain.value_objects.copy_checkpoint import CopyCheckpoint
 from app.domain.value_objects.task_status import TaskStatusEnum
 from app.domain.value_objects.task_type import TaskTypeEnum
 
 
-@pytest.mark.asyncio
-async def test_execute_task_success():
-    """Проверяем успешное выполнение задачи"""
 
-    task_repository_mock = AsyncMock(spec=TaskRepository)
+def make_processor() -> AsyncMock:
+    """Мок обработчика, диспетчеризующий задачи настоящим TaskProcessor.process на мок-обработчики"""
     task_processor_mock = AsyncMock(spec=TaskProcessor)
+    task_processor_mock.process.side_effect = partial(TaskProcessor.process, task_processor_mock)
+    return task_processor_mock
 
-    task_id = "123"
-    task = Task(
-        id=task_id,
+def make_task(status: TaskStatusEnum) -> Task:
+    return Task(
+        id="123",
         name="Test Task",
         task_data={
             "task_type": TaskTypeEnum.FILE_CREATE,
             "source_path": "/tmp/source.txt",
             "destination_path": ""
         },
-        status=TaskStatusEnum.PENDING,
+        status=status,
         result=None
     )
 
-    task_repository_mock.get_task_by_id.return_value = task
-    task_repository_mock.update_task.return_value = task
+
+def make_repository(claimed: Task = None, stored: Task = None) -> AsyncMock:
+    task_repository_mock = AsyncMock(spec=TaskRepository)
+    task_repository_mock.claim_task.return_value = claimed
+    task_repository_mock.get_task_by_id.return_value = stored
+    task_repository_mock.complete_task.side_effect = \
+        lambda task_id, status, result: replace(claimed or stored, status=status, result=result)
+    return task_repository_mock
+
+
+@pytest.mark.asyncio
+async def test_execute_task_success():
+    """Проверяем успешное выполнение задачи"""
+
+    task_repository_mock = make_repository(claimed=make_task(TaskStatusEnum.IN_PROGRESS))
+    task_processor_mock = make_processor()
     task_processor_mock.create_file.return_value = None
 
     use_case = ExecuteTaskUseCase(task_repository=task_repository_mock, task_processor=task_processor_mock)
 
-    result = await use_case.execute(task_id=task_id)
+    result = await use_case.execute(task_id="123")
 
     assert result.status == TaskStatusEnum.COMPLETED
+    task_repository_mock.claim_task.assert_awaited_once_with("123")
+    task_repository_mock.get_task_by_id.assert_not_called()
+    task_repository_mock.update_task.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_execute_task_processing_error():
     """Проверяем обработку ошибки во время выполнения задачи"""
 
-    task_repository_mock = AsyncMock(spec=TaskRepository)
-    task_processor_mock = AsyncMock(spec=TaskProcessor)
+    task_repository_mock = make_repository(claimed=make_task(TaskStatusEnum.IN_PROGRESS))
+    task_processor_mock = make_processor()
+    task_processor_mock.create_file.side_effect = TaskProcessingException("Ошибка при создании файла")
+
+    use_case = ExecuteTaskUseCase(task_repository=task_repository_mock, task_processor=task_processor_mock)
+
+    with pytest.raises(TaskProcessingException) as exc_info:
+        await use_case.execute(task_id="123")
+
+    assert "Ошибка при создании файла" in str(exc_info.value)
+    assert task_repository_mock.complete_task.await_args.args[1] == TaskStatusEnum.FAILED
+
+
+@pytest.mark.asyncio
+async def test_execute_task_invalid_data_fails_claimed_task():
+    """Некорректные данные захваченной задачи завершают её с ошибкой, а не оставляют в IN_PROGRESS"""
+
+    task = replace(make_task(TaskStatusEnum.IN_PROGRESS), task_data="not a dict")
+    task_repository_mock = make_repository(claimed=task)
+    task_processor_mock = make_processor()
+
+    use_case = ExecuteTaskUseCase(task_repository=task_repository_mock, task_processor=task_processor_mock)
+
+    with pytest.raises(ValidationException):
+        await use_case.execute(task_id="123", is_celery=True)
+
+    assert task_repository_mock.complete_task.await_args.args[1] == TaskStatusEnum.FAILED
+    task_processor_mock.create_file.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_task_returns_stored_state_when_completion_rejected():
+    """Если задачу завершили без нас, возвращается состояние из хранилища, а не выдуманный статус"""
+
+    task_repository_mock = make_repository(claimed=make_task(TaskStatusEnum.IN_PROGRESS))
+    task_repository_mock.complete_task.side_effect = None
+    task_repository_mock.complete_task.return_value = None
+    task_repository_mock.get_task_by_id.return_value = make_task(TaskStatusEnum.CANCELED)
+    task_processor_mock = make_processor()
+
+    use_case = ExecuteTaskUseCase(task_repository=task_repository_mock, task_processor=task_processor_mock)
+
+    result = await use_case.execute(task_id="123")
+
+    assert result.status == TaskStatusEnum.CANCELED
+    task_repository_mock.get_task_by_id.assert_awaited_once_with("123")
+
+
+@pytest.mark.asyncio
+async def test_execute_task_already_completed():
+    """Ошибка при запуске завершенной задачи: захват не удался, задача не выполняется"""
+
+    task_repository_mock = make_repository(stored=make_task(TaskStatusEnum.COMPLETED))
+    task_processor_mock = make_processor()
+
+    use_case = ExecuteTaskUseCase(task_repository=task_repository_mock, task_processor=task_processor_mock)
+
+    with pytest.raises(TaskStatusException):
+        await use_case.execute(task_id="123")
+
+    task_processor_mock.create_file.assert_not_called()
+    task_repository_mock.complete_task.assert_not_called()
+
 
-    task = Task(
+@pytest.mark.asyncio
+async def test_execute_task_claimed_by_another_worker():
+    """Задачу, уже захваченную другим исполнителем, повторно не выполняем"""
+
+    task_repository_mock = make_repository(stored=make_task(TaskStatusEnum.IN_PROGRESS))
+    task_processor_mock = make_processor()
+
+    use_case = ExecuteTaskUseCase(task_repository=task_repository_mock, task_processor=task_processor_mock)
+
+    with pytest.raises(TaskAlreadyRunningException):
+        await use_case.execute(task_id="123")
+
+    result = await use_case.execute(task_id="123", is_celery=True)
+    assert result.status == TaskStatusEnum.IN_PROGRESS
+    task_processor_mock.create_file.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_task_retry_continues_claimed_task():
+    """Повторная попытка Celery продолжает задачу, захваченную первой попыткой"""
+
+    task_repository_mock = make_repository(stored=make_task(TaskStatusEnum.IN_PROGRESS))
+    task_processor_mock = make_processor()
+
+    use_case = ExecuteTaskUseCase(task_repository=task_repository_mock, task_processor=task_processor_mock)
+
+    result = await use_case.execute(task_id="123", is_retry=True, is_celery=True)
+
+    assert result.status == TaskStatusEnum.COMPLETED
+    task_processor_mock.create_file.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_execute_task_notifies_status_change():
+    """Проверяем, что о каждой смене статуса сообщается по идентификатору задачи"""
+
+    task_repository_mock = make_repository(claimed=make_task(TaskStatusEnum.IN_PROGRESS))
+    task_processor_mock = make_processor()
+    on_status_change = AsyncMock()
+
+    use_case = ExecuteTaskUseCase(
+        task_repository=task_repository_mock,
+        task_processor=task_processor_mock,
+        on_status_change=on_status_change
+    )
+
+    await use_case.execute(task_id="123")
+
+    assert on_status_change.await_count == 2
+    on_status_change.assert_awaited_with("123")
+
+
+@pytest.mark.asyncio
+async def test_execute_task_retry_resumes_copy_from_checkpoint():
+    """Повтор Celery передает копированию контрольную точку, сохраненную прошлой попыткой"""
+
+    checkpoint = {"size": 4096, "mtime_ns": 1, "bytes_done": 2048, "checksum": 7}
+    stored = Task(
         id="123",
-        name="Test Task",
+        name="Copy Task",
         task_data={
-            "task_type": TaskTypeEnum.FILE_CREATE,
-            "source_path": "/tmp/source.txt",
-            "destination_path": ""
+            "task_type": TaskTypeEnum.FILE_COPY,
+            "source_path": "/tmp/source.bin",
+            "destination_path": "/tmp/destination.bin"
         },
-        status=TaskStatusEnum.PENDING,
-        result=None
+        status=TaskStatusEnum.IN_PROGRESS,
+        result={"checkpoint": checkpoint}
     )
+    task_repository_mock = make_repository(stored=stored)
+    task_processor_mock = make_processor()
+    task_processor_mock.copy_file.return_value = {"strategy": "copy_file_range", "resumed_from": 2048}
 
-    task_repository_mock.get_task_by_id.return_value = task
-    task_repository_mock.update_task.return_value = task
-    task_processor_mock.create_file.side_effect = TaskProcessingException("Ошибка при создании файла")
+    use_case = ExecuteTaskUseCase(task_repository=task_repository_mock, task_processor=task_processor_mock)
+
+    result = await use_case.execute(task_id="123", is_retry=True, is_celery=True)
+
+    kwargs = task_processor_mock.copy_file.await_args.kwargs
+    assert kwargs["checkpoint"] == CopyCheckpoint(**checkpoint)
+    await kwargs["on_checkpoint"](CopyCheckpoint(size=4096, mtime_ns=1, bytes_done=4096, checksum=9))
+    task_repository_mock.save_checkpoint.assert_awaited_once_with(
+        "123", {"size": 4096, "mtime_ns": 1, "bytes_done": 4096, "checksum": 9}
+    )
+    assert result.result["resumed_from"] == 2048
+
+
+@pytest.mark.asyncio
+async def test_execute_task_saves_archive_progress():
+    """Архивация каталога в Celery сохраняет ход выполнения в результат задачи"""
+
+    stored = Task(
+        id="123",
+        name="Archive Task",
+        task_data={
+            "task_type": TaskTypeEnum.DIR_ARCHIVE,
+            "source_path": "/tmp/tree",
+            "destination_path": "/tmp/tree.tar"
+        },
+        status=TaskStatusEnum.IN_PROGRESS
+    )
+    task_repository_mock = make_repository(stored=stored)
+    task_processor_mock = make_processor()
+    task_processor_mock.archive_dir.return_value = {"files": 1}
 
     use_case = ExecuteTaskUseCase(task_repository=task_repository_mock, task_processor=task_processor_mock)
 
-    with pytest.raises(TaskProcessingException) as exc_info:
-        await use_case.execute(task_id="123")
+    await use_case.execute(task_id="123", is_retry=True, is_celery=True)
 
-    assert "Ошибка при создании файла" in str(exc_info.value)
\ No newline at end of file
+    await task_processor_mock.archive_dir.await_args.kwargs["on_progress"]({"files": 1})
+    task_repository_mock.save_progress.assert_awaited_once_with("123", {"files": 1})
@@ -0,0 +1,147 @@
+import asyncio
+from functools import partial
+import pytest
+from unittest.mock import AsyncMock
+from app.domain.entities.task import Task
+from app.application.services.task_processor import TaskProcessor
+from app.application.use_cases.execute_task_batch import ExecuteTaskBatchUseCase
+from app.domain.repositories.task_repository import TaskRepository
+from app.domain.value_objects.task_status import TaskStatusEnum
+from app.domain.value_objects.task_type import TaskTypeEnum
+
+
+
+def make_processor() -> AsyncMock:
+    """Мок обработчика, диспетчеризующий задачи настоящим TaskProcessor.process на мок-обработчики"""
+    task_processor_mock = AsyncMock(spec=TaskProcessor)
+    task_processor_mock.process.side_effect = partial(TaskProcessor.process, task_processor_mock)
+    return task_processor_mock
+
+def make_task(task_id: str, source_path: str) -> Task:
+    return Task(
+        id=task_id,
+        name="Test Task",
+        task_data={
+            "task_type": TaskTypeEnum.FILE_CREATE,
+            "source_path": source_path,
+            "destination_path": ""
+        },
+        status=TaskStatusEnum.IN_PROGRESS,
+        result=None
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_task_batch_completes_all_in_one_write():
+    """Проверяем, что результаты пакета записываются одним вызовом complete_tasks"""
+
+    task_repository_mock = AsyncMock(spec=TaskRepository)
+    task_repository_mock.claim_tasks.return_value = [
+        make_task("1", "/tmp/ok.txt"),
+        make_task("2", "/tmp/fail.txt"),
+    ]
+    task_processor_mock = make_processor()
+
+    async def create_file(file_task_data):
+        if file_task_data.source_path == "/tmp/fail.txt":
+            raise OSError("disk full")
+
+    task_processor_mock.create_file.side_effect = create_file
+    on_status_change = AsyncMock()
+
+    use_case = ExecuteTaskBatchUseCase(
+        task_repository=task_repository_mock,
+        task_processor=task_processor_mock,
+        on_status_change=on_status_change
+    )
+
+    processed = await use_case.execute(batch_size=10)
+
+    assert processed == 2
+    task_repository_mock.claim_tasks.assert_awaited_once_with(10, 300.0)
+    task_repository_mock.complete_tasks.assert_awaited_once()
+    results = task_repository_mock.complete_tasks.await_args.args[0]
+    assert [(task_id, status) for task_id, status, _ in results] == [
+        ("1", TaskStatusEnum.COMPLETED),
+        ("2", TaskStatusEnum.FAILED),
+    ]
+    assert on_status_change.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_task_batch_empty_queue():
+    """Проверяем, что при пустой очереди ничего не записывается"""
+
+    task_repository_mock = AsyncMock(spec=TaskRepository)
+    task_repository_mock.claim_tasks.return_value = []
+
+    use_case = ExecuteTaskBatchUseCase(
+        task_repository=task_repository_mock,
+        task_processor=AsyncMock(spec=TaskProcessor)
+    )
+
+    assert await use_case.execute(batch_size=10) == 0
+    task_repository_mock.complete_tasks.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_task_batch_renews_claims_while_running():
+    """Проверяем, что аренда задач пакета продлевается, пока они выполняются"""
+
+    task_repository_mock = AsyncMock(spec=TaskRepository)
+    task_repository_mock.claim_tasks.return_value = [make_task("1", "/tmp/slow.txt")]
+    task_processor_mock = make_processor()
+
+    async def create_file(file_task_data):
+        await asyncio.sleep(0.25)
+
+    task_processor_mock.create_file.side_effect = create_file
+
+    use_case = ExecuteTaskBatchUseCase(
+        task_repository=task_repository_mock,
+        task_processor=task_processor_mock,
+        lease_seconds=0.3
+    )
+
+    await use_case.execute(batch_size=10)
+
+    task_repository_mock.claim_tasks.assert_awaited_once_with(10, 0.3)
+    assert task_repository_mock.renew_claims.await_count == 2
+    task_repository_mock.renew_claims.assert_awaited_with(["1"])
+    task_repository_mock.complete_tasks.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_execute_task_batch_writes_results_as_tasks_finish():
+    """Проверяем, что результат быстрой задачи записывается, не дожидаясь медленной"""
+
+    task_repository_mock = AsyncMock(spec=TaskRepository)
+    task_repository_mock.claim_tasks.return_value = [
+        make_task("1", "/tmp/slow.txt"),
+        make_task("2", "/tmp/fast.txt"),
+    ]
+    task_processor_mock = make_processor()
+    written, seen_by_slow_task = [], []
+    task_repository_mock.complete_tasks.side_effect = lambda results: written.append(
+        [task_id for task_id, _, _ in results]
+    )
+
+    async def create_file(file_task_data):
+        if file_task_data.source_path == "/tmp/slow.txt":
+            await asyncio.sleep(0.3)
+            seen_by_slow_task.extend(written)
+
+    task_processor_mock.create_file.side_effect = create_file
+
+    use_case = ExecuteTaskBatchUseCase(
+        task_repository=task_repository_mock,
+        task_processor=task_processor_mock,
+        lease_seconds=0.3,
+        flush_interval=0.05
+    )
+
+    assert await use_case.execute(batch_size=10) == 2
+
+    assert seen_by_slow_task == [["2"]]
+    assert written == [["2"], ["1"]]
+    task_repository_mock.renew_claims.assert_awaited_with(["1"])
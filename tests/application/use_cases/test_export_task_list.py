@@ -0,0 +1,43 @@
+import json
+import pytest
+from unittest.mock import AsyncMock
+from datetime import datetime
+from app.application.use_cases.export_task_list import ExportTaskListUseCase
+from app.domain.repositories.task_repository import TaskRepository
+from app.domain.value_objects.task_status import TaskStatusEnum
+
+
+@pytest.mark.asyncio
+async def test_export_task_list_ndjson():
+    """Проверяем, что каждая задача выгружается отдельной JSON-строкой"""
+
+    task_repository_mock = AsyncMock(spec=TaskRepository)
+    rows = [
+        {
+            "id": str(i),
+            "name": f"Task {i}",
+            "task_data": {"task_type": "FILE_CREATE", "source_path": f"/tmp/file{i}.txt"},
+            "status": TaskStatusEnum.PENDING.value,
+            "result": None,
+            "created_at": datetime(2024, 1, i + 1),
+            "updated_at": datetime(2024, 1, i + 1),
+        }
+        for i in range(3)
+    ]
+
+    async def stream_tasks(**filters):
+        for row in rows:
+            yield row
+
+    task_repository_mock.stream_tasks.side_effect = stream_tasks
+
+    use_case = ExportTaskListUseCase(task_repository=task_repository_mock)
+
+    lines = [line async for line in use_case.execute(status=TaskStatusEnum.PENDING)]
+
+    assert len(lines) == 3
+    assert all(line.endswith("\n") for line in lines)
+    first = json.loads(lines[0])
+    assert first["name"] == "Task 0"
+    assert first["created_at"] == "2024-01-01T00:00:00"
+    assert task_repository_mock.stream_tasks.call_args.kwargs["status"] == TaskStatusEnum.PENDING
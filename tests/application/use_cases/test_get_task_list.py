@@ -1,8 +1,11 @@
 import pytest
 from unittest.mock import AsyncMock
 from datetime import datetime
+from uuid import uuid4
 from app.application.use_cases.get_task_list import GetTaskListUseCase
 from app.domain.entities.task import Task
+from app.domain.exceptions.value_object import TaskCursorException
+from app.domain.value_objects.task_cursor import TaskCursor
 from app.domain.value_objects.task_name import TaskName
 from app.domain.value_objects.task_status import TaskStatusEnum
 from app.domain.value_objects.task_type import TaskTypeEnum
@@ -42,7 +45,8 @@ async def test_get_task_list_success():
         status=TaskStatusEnum.PENDING
     )
 
-    assert result == tasks
+    assert result["items"] == tasks
+    assert result["next_cursor"] is None
     task_repository_mock.get_tasks.assert_awaited_once_with(
         name=TaskName("Task"),
         created_at_from=datetime(2024, 1, 1),
@@ -50,5 +54,50 @@ async def test_get_task_list_success():
         updated_at_from=None,
         updated_at_to=None,
         status=TaskStatusEnum.PENDING,
-        task_type=None
-    )
\ No newline at end of file
+        task_type=None,
+        limit=101,
+        cursor=None
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_task_list_next_cursor():
+    """Проверяем, что при наличии следующей страницы возвращается курсор на последнюю задачу"""
+
+    task_repository_mock = AsyncMock(spec=TaskRepository)
+
+    tasks = [
+        Task(
+            id=str(uuid4()),
+            name=f"Task {i}",
+            task_data=None,
+            created_at=datetime(2024, 1, i + 1)
+        )
+        for i in range(3)
+    ]
+    task_repository_mock.get_tasks.return_value = tasks
+
+    use_case = GetTaskListUseCase(task_repository=task_repository_mock)
+
+    result = await use_case.execute(limit=2)
+
+    assert result["items"] == tasks[:2]
+    cursor = TaskCursor.decode(result["next_cursor"])
+    assert cursor.created_at == tasks[1].created_at
+    assert cursor.id == tasks[1].id
+
+    await use_case.execute(limit=2, cursor=result["next_cursor"])
+    assert task_repository_mock.get_tasks.await_args.kwargs["cursor"] == cursor
+
+
+@pytest.mark.asyncio
+async def test_get_task_list_invalid_cursor():
+    """Ошибка при передаче поврежденного курсора"""
+
+    task_repository_mock = AsyncMock(spec=TaskRepository)
+    use_case = GetTaskListUseCase(task_repository=task_repository_mock)
+
+    with pytest.raises(TaskCursorException):
+        await use_case.execute(cursor="not-a-cursor")
+
+    task_repository_mock.get_tasks.assert_not_called()
\ No newline at end of file
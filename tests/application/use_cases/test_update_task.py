@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock
 from app.application.use_cases.update_task import UpdateTaskUseCase
 from app.domain.entities.task import Task
 from app.domain.exceptions.entity import TaskException, TaskNotFoundException
-from app.domain.exceptions.value_object import TaskTypeException
+from app.domain.exceptions.value_object import TaskTypeException, ValidationException
 from app.domain.value_objects.file_task_data import FileTaskData
 from app.domain.value_objects.task_name import TaskName
 from app.domain.value_objects.task_status import TaskStatusEnum
@@ -102,4 +102,54 @@ async def test_update_task_invalid_status():
         await use_case.execute(task_id="123", name="New Name")
 
     task_repository_mock.get_task_by_id.assert_awaited_once_with("123")
-    task_repository_mock.update_task.assert_not_awaited()
\ No newline at end of file
+    task_repository_mock.update_task.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_update_task_rejects_type_not_described_by_paths():
+    """Проверяем, что задачу нельзя перевести в тип, данные которого не описываются двумя путями"""
+
+    task_repository_mock = AsyncMock(spec=TaskRepository)
+    task_repository_mock.get_task_by_id.return_value = Task(
+        id="123", name="Task", task_data=None, status=TaskStatusEnum.PENDING, result=None
+    )
+
+    use_case = UpdateTaskUseCase(task_repository=task_repository_mock)
+
+    with pytest.raises(TaskTypeException, match="Тип задачи FILE_BATCH нельзя задать обновлением"):
+        await use_case.execute(
+            task_id="123",
+            data=SimpleNamespace(task_type="FILE_BATCH", source_path="/tmp/x", destination_path=None)
+        )
+
+    task_repository_mock.update_task.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_update_task_builds_data_by_type():
+    """Проверяем, что данные задачи собираются и валидируются по её типу"""
+
+    task_repository_mock = AsyncMock(spec=TaskRepository)
+    task_repository_mock.get_task_by_id.return_value = Task(
+        id="123", name="Task", task_data=None, status=TaskStatusEnum.PENDING, result=None
+    )
+    task_repository_mock.update_task.side_effect = lambda task: task
+
+    use_case = UpdateTaskUseCase(task_repository=task_repository_mock)
+
+    result = await use_case.execute(
+        task_id="123",
+        data=SimpleNamespace(task_type="FILE_COPY", source_path="/tmp/a", destination_path="/tmp/b")
+    )
+    assert result.task_data == {
+        "task_type": TaskTypeEnum.FILE_COPY.value,
+        "source_path": "/tmp/a",
+        "destination_path": "/tmp/b",
+        "delta": False,
+        "verify": False
+    }
+
+    with pytest.raises(ValidationException):
+        await use_case.execute(
+            task_id="123",
+            data=SimpleNamespace(task_type="FILE_COPY", source_path="/tmp/a", destination_path=None)
+        )
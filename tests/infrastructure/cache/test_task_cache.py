@@ -0,0 +1,150 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from app.api.schemas.task import GetTaskListRequest
+from app.domain.value_objects.task_status import TaskStatusEnum
+from fastapi_cache import FastAPICache
+from fastapi_cache.decorator import cache
+from app.infrastructure.cache import task_cache
+from app.infrastructure.cache.backend import InstrumentedRedisBackend
+from app.infrastructure.cache.task_cache import build_query_key, get_cache_backend_redis, normalize_cache_value, \
+    task_list_key_builder, task_status_key_builder
+
+
+class MemoryRedis:
+    """Хранилище в памяти с интерфейсом redis.asyncio, декодирующее ответы так же, как настроенный клиент"""
+
+    def __init__(self, client):
+        self.decode_responses = client.get_connection_kwargs().get("decode_responses", False)
+        self.values = {}
+
+    def _response(self, value):
+        return value.decode() if self.decode_responses and value is not None else value
+
+    async def get(self, key):
+        return self._response(self.values.get(key))
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value if isinstance(value, bytes) else str(value).encode()
+
+    def pipeline(self, transaction=True):
+        return MemoryPipeline(self)
+
+
+class MemoryPipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def ttl(self, key):
+        self.commands.append(lambda: 60 if key in self.redis.values else -2)
+        return self
+
+    def get(self, key):
+        self.commands.append(lambda: self.redis._response(self.redis.values.get(key)))
+        return self
+
+    async def execute(self):
+        return [command() for command in self.commands]
+
+
+async def get_tasks():
+    pass
+
+
+@pytest.mark.asyncio
+async def test_task_list_key_uses_generation(monkeypatch):
+    """Проверяем, что ключ списка задач строится из текущего поколения"""
+
+    redis_mock = MagicMock()
+    redis_mock.get = AsyncMock(return_value="7")
+    monkeypatch.setattr(task_cache, "get_cache_redis", lambda: redis_mock)
+
+    key = await task_list_key_builder(get_tasks, request=None, args=(), kwargs={"filters": None})
+
+    assert key.startswith("fastapi-cache:task-list:7:")
+
+
+@pytest.mark.asyncio
+async def test_task_list_key_bypasses_cache_when_redis_unavailable(monkeypatch):
+    """Проверяем, что при недоступном Redis возвращается одноразовый ключ, а не ошибка"""
+
+    redis_mock = MagicMock()
+    redis_mock.get = AsyncMock(side_effect=ConnectionError("Redis недоступен"))
+    monkeypatch.setattr(task_cache, "get_cache_redis", lambda: redis_mock)
+
+    first = await task_list_key_builder(get_tasks, request=None, args=(), kwargs={"filters": None})
+    second = await task_list_key_builder(get_tasks, request=None, args=(), kwargs={"filters": None})
+
+    assert first.startswith("fastapi-cache:task-list:uncached:")
+    assert first != second
+
+
+def test_normalize_cache_value_drops_none_fields():
+    """Проверяем, что пустые поля модели не попадают в ключ, а перечисления заменяются значениями"""
+
+    filters = GetTaskListRequest(status=TaskStatusEnum.PENDING, limit=10)
+
+    assert normalize_cache_value(filters) == {"limit": 10, "status": TaskStatusEnum.PENDING.value}
+
+
+def test_normalize_cache_value_sorts_dict_keys():
+    """Проверяем, что ключи словарей сортируются, в том числе во вложенных значениях"""
+
+    value = normalize_cache_value({"b": 1, "a": [{"d": 2, "c": 3}]})
+
+    assert list(value) == ["a", "b"]
+    assert list(value["a"][0]) == ["c", "d"]
+
+
+def test_normalize_cache_value_converts_datetime_to_utc():
+    """Проверяем, что datetime с часовым поясом переводится в UTC, а наивный остается как есть"""
+
+    moscow = timezone(timedelta(hours=3))
+
+    assert normalize_cache_value(datetime(2024, 1, 1, 15, 0, tzinfo=moscow)) == "2024-01-01T12:00:00"
+    assert normalize_cache_value(datetime(2024, 1, 1, 12, 0)) == "2024-01-01T12:00:00"
+
+
+def test_build_query_key_equal_for_equivalent_filters():
+    """Проверяем, что эквивалентные фильтры дают одинаковый ключ, а разные - разный"""
+
+    moscow = timezone(timedelta(hours=3))
+    first = GetTaskListRequest(
+        status=TaskStatusEnum.PENDING, created_at_from=datetime(2024, 1, 1, 15, 0, tzinfo=moscow)
+    )
+    second = GetTaskListRequest(
+        created_at_from=datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc), status="PENDING", name=None
+    )
+    other = GetTaskListRequest(status=TaskStatusEnum.COMPLETED)
+
+    key = build_query_key("task-list:0", "/tasks/list", {"filters": first})
+
+    assert key == build_query_key("task-list:0", "/tasks/list", {"filters": second})
+    assert key != build_query_key("task-list:0", "/tasks/list", {"filters": other})
+    assert key != build_query_key("task-list:1", "/tasks/list", {"filters": first})
+
+
+@pytest.mark.asyncio
+async def test_cached_response_is_read_back():
+    """Проверяем, что ответ, сохраненный через бэкенд fastapi-cache, читается из кэша повторным запросом"""
+
+    FastAPICache.init(InstrumentedRedisBackend(MemoryRedis(get_cache_backend_redis())), prefix="fastapi-cache")
+    calls = []
+
+    @cache(expire=60, key_builder=task_status_key_builder)
+    async def get_task_status(task_id: str):
+        calls.append(task_id)
+        return {"id": task_id, "status": "PENDING"}
+
+    first = await get_task_status(task_id="123")
+    second = await get_task_status(task_id="123")
+
+    assert first == second == {"id": "123", "status": "PENDING"}
+    assert calls == ["123"]
@@ -0,0 +1,44 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+from app.infrastructure.repositories.postgres_task_repository import PostgresTaskRepository
+
+
+def compiled_sql(session: AsyncMock) -> str:
+    statement = session.execute.await_args.args[0]
+    return str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+@pytest.mark.asyncio
+async def test_claim_tasks_reclaims_expired_leases():
+    """Проверяем, что пакетный захват забирает и PENDING, и IN_PROGRESS-задачи с истекшей арендой"""
+
+    session = AsyncMock()
+    session.execute.return_value = MagicMock()
+    session.execute.return_value.scalars.return_value.all.return_value = []
+    repository = PostgresTaskRepository(session)
+
+    assert await repository.claim_tasks(10, lease_seconds=60) == []
+
+    sql = compiled_sql(session)
+    assert (
+        "tasks.status = 'PENDING' OR tasks.status = 'IN_PROGRESS' "
+        "AND tasks.claimed_at < timezone('utc', now()) - make_interval(secs=>60.0)"
+    ) in sql
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "claimed_at=timezone('utc', now())" in sql
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_renew_claims_touches_only_running_tasks():
+    """Проверяем, что продление аренды не трогает задачи, которые уже не выполняются"""
+
+    session = AsyncMock()
+    repository = PostgresTaskRepository(session)
+
+    await repository.renew_claims(["6f1c1a9e-3f0b-4c1e-9a43-0e8f7b0d2c11"])
+
+    sql = compiled_sql(session)
+    assert "SET updated_at=tasks.updated_at, claimed_at=timezone('utc', now())" in sql
+    assert "tasks.status = 'IN_PROGRESS'" in sql